@@ -31,6 +31,9 @@ import sys  # to get file system encoding
 
 import psychopy.iohub as io
 from psychopy.hardware import keyboard
+# shared GTDT runtime helpers live in 1_Procedure/gtdt
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from gtdt import conditions, ports, refresh, triggers
 
 
 
@@ -86,11 +89,9 @@ win = visual.Window(
 win.mouseVisible = False
 
 # store frame rate of monitor if we can measure it
-expInfo['frameRate'] = win.getActualFrameRate()
-if expInfo['frameRate'] != None:
-    frameDur = 1.0 / round(expInfo['frameRate'])
-else:
-    frameDur = 1.0 / 60.0  # could not measure, so guess
+# measured once per monitor/resolution and cached, see gtdt/refresh.py
+expInfo['frameRate'] = refresh.frame_rate(win, monitor='testMonitor')
+frameDur = 1.0 / round(expInfo['frameRate'])
 
 # --- Setup input devices ---
 ioConfig = {}
@@ -249,19 +250,16 @@ center = visual.ShapeStim(
     lineWidth=1.0,     colorSpace='rgb',  lineColor='white', fillColor='white',
     opacity=None, depth=-3.0, interpolate=False)
 press = keyboard.Keyboard()
-stimulus = parallel.ParallelPort(address='0x5FB8')
+# the same backend for every marker; GTDT_TRIGGER=udp, file or serial:<device> replaces the LPT (gtdt/ports.py)
+stimulus = ports.open_port('0x5FB8')
 #address='0x5FB8': 设置并行端口的地址,使用地址 0x5FB8 来连接并操作并行端口
 def stimulus_marker(value):
-    stimulus.setData(value)
-    core.wait(0.05)
-    stimulus.setData(0)
+    triggers.attach(win, stimulus).send(value)  # queued onto the next flip, never blocks
 #stimulus_marker(1)
 #stimulus_marker('bseq')
-responses = parallel.ParallelPort(address='0x5FB8')
+responses = ports.open_port('0x5FB8')
 def responses_marker(value):
-    responses.setData(value)
-    core.wait(0.05)
-    responses.setData(0)
+    triggers.attach(win, responses).send(value)  # queued onto the next flip, never blocks
 #responses_marker(2)
 
 # --- Initialize components for Routine "rest" ---
@@ -286,6 +284,10 @@ i5 = visual.ImageStim(
     texRes=128.0, interpolate=True, depth=0.0)
 key_resp_5 = keyboard.Keyboard()
 
+# every block and trial list is parsed now, none between blocks (gtdt/conditions.py)
+conditionTables = conditions.ConditionCache(data.importConditions)
+conditionTables.preload(conditions.find(_thisDir))
+
 # Create some handy timers
 globalClock = core.Clock()  # to track the time since experiment started
 routineTimer = core.Clock()  # to track time remaining of each (possibly non-slip) routine 
@@ -620,7 +622,7 @@ routineTimer.reset()
 # set up handler to look after randomisation of conditions etc
 blocks = data.TrialHandler(nReps=1.0, method='fullRandom', 
     extraInfo=expInfo, originPath=-1,
-    trialList=data.importConditions('blist_c2.xlsx'),
+    trialList=conditionTables.get('blist_c2.xlsx'),
     seed=None, name='blocks')
 thisExp.addLoop(blocks)  # add the loop to the experiment
 thisBlock = blocks.trialList[0]  # so we can initialise stimuli with some values
@@ -728,7 +730,7 @@ for thisBlock in blocks:
     # set up handler to look after randomisation of conditions etc
     trials = data.TrialHandler(nReps=1.0, method='fullRandom', 
         extraInfo=expInfo, originPath=-1,
-        trialList=data.importConditions('c1.xlsx'),
+        trialList=conditionTables.get('c1.xlsx'),
         seed=None, name='trials')
     thisExp.addLoop(trials)  # add the loop to the experiment
     thisTrial = trials.trialList[0]  # so we can initialise stimuli with some values
@@ -31,6 +31,9 @@ import sys  # to get file system encoding
 
 import psychopy.iohub as io
 from psychopy.hardware import keyboard
+# shared GTDT runtime helpers live in 1_Procedure/gtdt
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from gtdt import annulus, conditions, flicker, ports, refresh, stimlog, timeline, triggers
 from datetime import datetime
 
 
@@ -84,11 +87,13 @@ win = visual.Window(
 win.mouseVisible = False
 
 # store frame rate of monitor if we can measure it
-expInfo['frameRate'] = win.getActualFrameRate()
-if expInfo['frameRate'] != None:
-    frameDur = 1.0 / round(expInfo['frameRate'])
-else:
-    frameDur = 1.0 / 60.0  # could not measure, so guess
+# measured once per monitor/resolution and cached, see gtdt/refresh.py
+expInfo['frameRate'] = refresh.frame_rate(win, monitor='testMonitor')
+frameDur = 1.0 / round(expInfo['frameRate'])
+# the cover flicker this refresh rate can show for 21.25 Hz, see gtdt/flicker.py
+gtdtFlicker = flicker.plan(21.25, 1.0 / frameDur)
+# values shown on every frame of the GTDT trials, check with `python -m gtdt.stimlog`
+stimLog = stimlog.StimulusLog(filename + '_stim.dat', 1.0 / frameDur, gtdtFlicker.hz)
 # --- Setup input devices ---
 ioConfig = {}
 
@@ -123,7 +128,8 @@ text = visual.TextStim(win=win, name='text',
     color='white', colorSpace='rgb', opacity=None, 
     languageStyle='LTR',
     depth=0.0);
-bstart = parallel.ParallelPort(address='0x3EFC')
+# the same backend for every marker; GTDT_TRIGGER=udp, file or serial:<device> replaces the LPT (gtdt/ports.py)
+bstart = ports.open_port('0x3EFC')
 #def bstart_marker(value):
 #    bstart.setData(value)
 #    core.wait(0.05)
@@ -136,86 +142,8 @@ bg = visual.Rect(
     ori=0.0, pos=(0, 0), anchor='center',
     lineWidth=1.0,     colorSpace='rgb',  lineColor='white', fillColor='white',
     opacity=None, depth=0.0, interpolate=False)
-annular = visual.Pie(
-    win=win, name='annular',start=0, end=22.5,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='lightgrey', fillColor='lightgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular2 = visual.Pie(
-    win=win, name='annular2',start=22.5, end=45,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='darkgrey', fillColor='darkgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular3 = visual.Pie(
-    win=win, name='annular3',start=45, end=67.5,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='lightgrey', fillColor='lightgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular4 = visual.Pie(
-    win=win, name='annular4',start=67.5, end=90,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='darkgrey', fillColor='darkgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular5 = visual.Pie(
-    win=win, name='annular5',start=90,end=112.5,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='lightgrey', fillColor='lightgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular6 = visual.Pie(
-    win=win, name='annular6',start=112.5,end=135,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='darkgrey', fillColor='darkgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular7 = visual.Pie(
-    win=win, name='annular7',start=135,end=157.5,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='lightgrey', fillColor='lightgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular8 = visual.Pie(
-    win=win, name='annular8',start=157.5,end=180,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='darkgrey', fillColor='darkgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular9 = visual.Pie(
-    win=win, name='annular9',start=180,end=202.5,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='lightgrey', fillColor='lightgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular10 = visual.Pie(
-    win=win, name='annular10',start=202.5,end=225,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='darkgrey', fillColor='darkgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular11 = visual.Pie(
-    win=win, name='annular9',start=225,end=247.5,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='lightgrey', fillColor='lightgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular12 = visual.Pie(
-    win=win, name='annular12',start=247.5,end=270,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='darkgrey', fillColor='darkgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular13 = visual.Pie(
-    win=win, name='annular9',start=270,end=292.5,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='lightgrey', fillColor='lightgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular14 = visual.Pie(
-    win=win, name='annular14',start=292.5,end=315,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='darkgrey', fillColor='darkgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular15 = visual.Pie(
-    win=win, name='annular15',start=315,end=337.5,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='lightgrey', fillColor='lightgrey',
-    opacity=None, depth=-1.0, interpolate=False)
-annular16 = visual.Pie(
-    win=win, name='annular16',start=337.5,end=360,radius=0.25,
-    ori=0.0, pos=(0, 0),
-    lineWidth=1.0,     colorSpace='rgb',  lineColor='darkgrey', fillColor='darkgrey',
-    opacity=None, depth=-1.0, interpolate=False)
+# the 16 checkerboard sectors, drawn as one textured stimulus
+annular = annulus.make_annulus(win, radius=0.25, name='annular', depth=-1.0)
 cover = visual.ShapeStim(
     win=win, name='cover',
     size=(0.5, 0.5), vertices='circle',
@@ -229,24 +157,20 @@ center = visual.ShapeStim(
     lineWidth=1.0,     colorSpace='rgb',  lineColor='white', fillColor='white',
     opacity=None, depth=-3.0, interpolate=False)
 press = keyboard.Keyboard()
-stimulus = parallel.ParallelPort(address='0x3EFC')
+stimulus = ports.open_port('0x3EFC')
 #def stimulus_marker(value):
 #    stimulus.setData(value)
 #    core.wait(0.05)
 #    stimulus.setData(0)
 #stimulus_marker(1)
 #stimulus_marker('bseq')
-responses = parallel.ParallelPort(address='0x3EFC')
+responses = ports.open_port('0x3EFC')
 def responses_marker(value):
-    responses.setData(value)
-    core.wait(0.05)
-    responses.setData(0)
+    triggers.attach(win, responses).send(value)  # queued onto the next flip, never blocks
 #responses_marker(2)
-square = parallel.ParallelPort(address='0x3EFC')
+square = ports.open_port('0x3EFC')
 def square_marker(value):
-    square.setData(value)
-    core.wait(0.05)
-    square.setData(0)
+    triggers.attach(win, square).send(value, urgent=True)  # ahead of queued codes, on the next flip
     
 # --- Initialize components for Routine "rest" ---
 i4 = visual.ImageStim(
@@ -258,7 +182,7 @@ i4 = visual.ImageStim(
     flipHoriz=False, flipVert=False,
     texRes=128.0, interpolate=True, depth=0.0)
 key_resp_4 = keyboard.Keyboard()
-bend = parallel.ParallelPort(address='0x3EFC')
+bend = ports.open_port('0x3EFC')
 #def bend_marker(value):
 #    bend.setData(value)
 #    core.wait(0.05)
@@ -275,6 +199,10 @@ i5 = visual.ImageStim(
     texRes=128.0, interpolate=True, depth=0.0)
 key_resp_5 = keyboard.Keyboard()
 
+# every block and trial list is parsed now, none between blocks (gtdt/conditions.py)
+conditionTables = conditions.ConditionCache(data.importConditions)
+conditionTables.preload(conditions.find(root_dir, _thisDir))
+
 # Create some handy timers
 globalClock = core.Clock()  # to track the time since experiment started
 routineTimer = core.Clock()  # to track time remaining of each (possibly non-slip) routine 
@@ -391,7 +319,7 @@ routineTimer.reset()
 # set up handler to look after randomisation of conditions etc
 blocks = data.TrialHandler(nReps=1.0, method='sequential', 
     extraInfo=expInfo, originPath=-1,
-    trialList=data.importConditions(root_dir + 'blist_c1.xlsx'),
+    trialList=conditionTables.get(root_dir + 'blist_c1.xlsx'),
     seed=None, name='blocks')
 thisExp.addLoop(blocks)  # add the loop to the experiment
 thisBlock = blocks.trialList[0]  # so we can initialise stimuli with some values
@@ -530,7 +458,7 @@ for thisBlock in blocks:
     # set up handler to look after randomisation of conditions etc
     trials = data.TrialHandler(nReps=1.0, method='fullRandom', 
         extraInfo=expInfo, originPath=-1,
-        trialList=data.importConditions(root_dir + 'c1.xlsx'),
+        trialList=conditionTables.get(root_dir + 'c1.xlsx'),
         seed=None, name='trials')
     thisExp.addLoop(trials)  # add the loop to the experiment
     thisTrial = trials.trialList[0]  # so we can initialise stimuli with some values
@@ -553,9 +481,7 @@ for thisBlock in blocks:
         press.rt = []
         _press_allKeys = []
         # keep track of which components have finished
-        GTDTComponents = [bg, annular, annular2, annular3,annular4,
-        annular5,annular6,annular7,annular8,annular9,annular10,annular11,annular12,
-        annular13,annular14,annular15,annular16, cover, center, press, stimulus] # diff
+        GTDTComponents = [bg, annular, cover, center, press, stimulus] # diff
         for thisComponent in GTDTComponents:
             thisComponent.tStart = None
             thisComponent.tStop = None
@@ -567,7 +493,15 @@ for thisBlock in blocks:
         t = 0
         _timeToFirstFrame = win.getFutureFlipTime(clock="now")
         frameN = -1
+        # contrast, flicker and square size of every frame, computed once per trial
+        trialTimeline = timeline.compile_trial(thisTrial, 1.0 / frameDur, flicker_hz=gtdtFlicker.hz)
+        trials.addData('flicker.hz', gtdtFlicker.hz)
+        trials.addData('flicker.method', gtdtFlicker.method)
+        # flip indices of the square enlargement, fixed before the trial
+        squareFrame = trialTimeline.event_frame(timeline.SQUARE_MARKER)
+        trialFlip = triggers.attach(win, square).flip_count
         
+        flipTimes = []  # time of every flip of the trial, for the stimulus log
         # --- Run Routine "GTDT" ---
         routineForceEnded = not continueRoutine
         while continueRoutine:
@@ -576,6 +510,8 @@ for thisBlock in blocks:
             tThisFlip = win.getFutureFlipTime(clock=routineTimer)
             tThisFlipGlobal = win.getFutureFlipTime(clock=None)
             frameN = frameN + 1  # number of completed frames (so 0 is the first frame)
+            frameI = trialTimeline.index(frameN)  # row of the precomputed timeline
+            stimLog.frame(frameN, trialTimeline)
             # update/draw components on each frame
             
             # *bg* updates
@@ -595,15 +531,10 @@ for thisBlock in blocks:
             
             # if bg is active this frame...
             if bg.status == STARTED:
-                if t == ssec:
-                    # 在 t = ssec 时刻添加正方形marker
-                    square_marker(9)
-                elif ssec<t<=esec:
-                    x=1.0
-                    y=1.0
-                else:
-                    x=0.5
-                    y=0.5
+                x = y = trialTimeline.size[frameI]
+                if frameN == squareFrame:
+                    # sent right after the flip that shows the enlarged square
+                    square_marker(timeline.SQUARE_MARKER)
                 bg.setSize((x,y))
                 # update params
                 bg.setOpacity(None, log=False)
@@ -641,16 +572,9 @@ for thisBlock in blocks:
             
             # if annular is active this frame...
             if annular.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
+                cont = trialTimeline.contrast[frameI]
                 # update params
-                annular.setOpacity(None, log=False)
                 annular.setContrast(cont, log=False)
-                annular.setLineWidth(1.0, log=False)
             
             # if annular is stopping this frame...
             if annular.status == STARTED:
@@ -665,622 +589,6 @@ for thisBlock in blocks:
                     annular.status = FINISHED
                     annular.setAutoDraw(False)
 
-            # *annular2* updates
-            
-            # if annular2 is starting this frame...
-            if annular2.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular2.frameNStart = frameN  # exact frame index
-                annular2.tStart = t  # local t and not account for scr refresh
-                annular2.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular2, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular2.started')
-                # update status
-                annular2.status = STARTED
-                annular2.setAutoDraw(True)
-            
-            # if annular2 is active this frame...
-            if annular2.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular2.setOpacity(None, log=False)
-                annular2.setContrast(cont, log=False)
-                annular2.setLineWidth(1.0, log=False)
-            
-            # if annular2 is stopping this frame...
-            if annular2.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular2.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular2.tStop = t  # not accounting for scr refresh
-                    annular2.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular2.stopped')
-                    # update status
-                    annular2.status = FINISHED
-                    annular2.setAutoDraw(False)
-
-            # *annular3* updates
-            
-            # if annular3 is starting this frame...
-            if annular3.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular3.frameNStart = frameN  # exact frame index
-                annular3.tStart = t  # local t and not account for scr refresh
-                annular3.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular3, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular3.started')
-                # update status
-                annular3.status = STARTED
-                annular3.setAutoDraw(True)
-            
-            # if annular3 is active this frame...
-            if annular3.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular3.setOpacity(None, log=False)
-                annular3.setContrast(cont, log=False)
-                annular3.setLineWidth(1.0, log=False)
-            
-            # if annular3 is stopping this frame...
-            if annular3.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular3.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular3.tStop = t  # not accounting for scr refresh
-                    annular3.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular3.stopped')
-                    # update status
-                    annular3.status = FINISHED
-                    annular3.setAutoDraw(False)
-
-
-            # *annular4* updates
-            
-            # if annular4 is starting this frame...
-            if annular4.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular4.frameNStart = frameN  # exact frame index
-                annular4.tStart = t  # local t and not account for scr refresh
-                annular4.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular4, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular4.started')
-                # update status
-                annular4.status = STARTED
-                annular4.setAutoDraw(True)
-            
-            # if annular4 is active this frame...
-            if annular4.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular4.setOpacity(None, log=False)
-                annular4.setContrast(cont, log=False)
-                annular4.setLineWidth(1.0, log=False)
-            
-            # if annular4 is stopping this frame...
-            if annular4.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular4.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular4.tStop = t  # not accounting for scr refresh
-                    annular4.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular4.stopped')
-                    # update status
-                    annular4.status = FINISHED
-                    annular4.setAutoDraw(False)
-
-            # *annular5* updates
-            
-            # if annular5 is starting this frame...
-            if annular5.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular5.frameNStart = frameN  # exact frame index
-                annular5.tStart = t  # local t and not account for scr refresh
-                annular5.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular5, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular5.started')
-                # update status
-                annular5.status = STARTED
-                annular5.setAutoDraw(True)
-            
-            # if annular5 is active this frame...
-            if annular5.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular5.setOpacity(None, log=False)
-                annular5.setContrast(cont, log=False)
-                annular5.setLineWidth(1.0, log=False)
-            
-            # if annular5 is stopping this frame...
-            if annular5.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular5.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular5.tStop = t  # not accounting for scr refresh
-                    annular5.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular5.stopped')
-                    # update status
-                    annular5.status = FINISHED
-                    annular5.setAutoDraw(False)
-
-            # *annular6* updates
-            
-            # if annular6 is starting this frame...
-            if annular6.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular6.frameNStart = frameN  # exact frame index
-                annular6.tStart = t  # local t and not account for scr refresh
-                annular6.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular6, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular6.started')
-                # update status
-                annular6.status = STARTED
-                annular6.setAutoDraw(True)
-            
-            # if annular6 is active this frame...
-            if annular6.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular6.setOpacity(None, log=False)
-                annular6.setContrast(cont, log=False)
-                annular6.setLineWidth(1.0, log=False)
-            
-            # if annular6 is stopping this frame...
-            if annular6.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular6.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular6.tStop = t  # not accounting for scr refresh
-                    annular6.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular6.stopped')
-                    # update status
-                    annular6.status = FINISHED
-                    annular6.setAutoDraw(False)
-
-            # *annular7* updates
-            
-            # if annular7 is starting this frame...
-            if annular7.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular7.frameNStart = frameN  # exact frame index
-                annular7.tStart = t  # local t and not account for scr refresh
-                annular7.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular7, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular7.started')
-                # update status
-                annular7.status = STARTED
-                annular7.setAutoDraw(True)
-            
-            # if annular7 is active this frame...
-            if annular7.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular7.setOpacity(None, log=False)
-                annular7.setContrast(cont, log=False)
-                annular7.setLineWidth(1.0, log=False)
-            
-            # if annular7 is stopping this frame...
-            if annular7.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular7.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular7.tStop = t  # not accounting for scr refresh
-                    annular7.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular7.stopped')
-                    # update status
-                    annular7.status = FINISHED
-                    annular7.setAutoDraw(False)
-
-            # *annular8* updates
-            
-            # if annular8 is starting this frame...
-            if annular8.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular8.frameNStart = frameN  # exact frame index
-                annular8.tStart = t  # local t and not account for scr refresh
-                annular8.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular8, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular8.started')
-                # update status
-                annular8.status = STARTED
-                annular8.setAutoDraw(True)
-            
-            # if annular8 is active this frame...
-            if annular8.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular8.setOpacity(None, log=False)
-                annular8.setContrast(cont, log=False)
-                annular8.setLineWidth(1.0, log=False)
-            
-            # if annular8 is stopping this frame...
-            if annular8.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular8.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular8.tStop = t  # not accounting for scr refresh
-                    annular8.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular8.stopped')
-                    # update status
-                    annular8.status = FINISHED
-                    annular8.setAutoDraw(False)
-
-            # *annular9* updates
-            
-            # if annular9 is starting this frame...
-            if annular9.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular9.frameNStart = frameN  # exact frame index
-                annular9.tStart = t  # local t and not account for scr refresh
-                annular9.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular9, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular9.started')
-                # update status
-                annular9.status = STARTED
-                annular9.setAutoDraw(True)
-            
-            # if annular9 is active this frame...
-            if annular9.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular9.setOpacity(None, log=False)
-                annular9.setContrast(cont, log=False)
-                annular9.setLineWidth(1.0, log=False)
-            
-            # if annular9 is stopping this frame...
-            if annular9.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular9.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular9.tStop = t  # not accounting for scr refresh
-                    annular9.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular9.stopped')
-                    # update status
-                    annular9.status = FINISHED
-                    annular9.setAutoDraw(False)
-
-            # *annular10* updates
-            
-            # if annular10 is starting this frame...
-            if annular10.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular10.frameNStart = frameN  # exact frame index
-                annular10.tStart = t  # local t and not account for scr refresh
-                annular10.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular10, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular10.started')
-                # update status
-                annular10.status = STARTED
-                annular10.setAutoDraw(True)
-            
-            # if annular10 is active this frame...
-            if annular10.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular10.setOpacity(None, log=False)
-                annular10.setContrast(cont, log=False)
-                annular10.setLineWidth(1.0, log=False)
-            
-            # if annular10 is stopping this frame...
-            if annular10.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular10.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular10.tStop = t  # not accounting for scr refresh
-                    annular10.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular10.stopped')
-                    # update status
-                    annular10.status = FINISHED
-                    annular10.setAutoDraw(False)
-
-            # *annular11* updates
-            
-            # if annular11 is starting this frame...
-            if annular11.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular11.frameNStart = frameN  # exact frame index
-                annular11.tStart = t  # local t and not account for scr refresh
-                annular11.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular11, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular11.started')
-                # update status
-                annular11.status = STARTED
-                annular11.setAutoDraw(True)
-            
-            # if annular11 is active this frame...
-            if annular11.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular11.setOpacity(None, log=False)
-                annular11.setContrast(cont, log=False)
-                annular11.setLineWidth(1.0, log=False)
-            
-            # if annular11 is stopping this frame...
-            if annular11.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular11.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular11.tStop = t  # not accounting for scr refresh
-                    annular11.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular11.stopped')
-                    # update status
-                    annular11.status = FINISHED
-                    annular11.setAutoDraw(False)
-
-            # *annular12* updates
-            
-            # if annular12 is starting this frame...
-            if annular12.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular12.frameNStart = frameN  # exact frame index
-                annular12.tStart = t  # local t and not account for scr refresh
-                annular12.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular12, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular12.started')
-                # update status
-                annular12.status = STARTED
-                annular12.setAutoDraw(True)
-            
-            # if annular12 is active this frame...
-            if annular12.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular12.setOpacity(None, log=False)
-                annular12.setContrast(cont, log=False)
-                annular12.setLineWidth(1.0, log=False)
-            
-            # if annular12 is stopping this frame...
-            if annular12.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular12.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular12.tStop = t  # not accounting for scr refresh
-                    annular12.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular12.stopped')
-                    # update status
-                    annular12.status = FINISHED
-                    annular12.setAutoDraw(False)
-
-            # *annular13* updates
-            
-            # if annular13 is starting this frame...
-            if annular13.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular13.frameNStart = frameN  # exact frame index
-                annular13.tStart = t  # local t and not account for scr refresh
-                annular13.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular13, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular13.started')
-                # update status
-                annular13.status = STARTED
-                annular13.setAutoDraw(True)
-            
-            # if annular13 is active this frame...
-            if annular13.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular13.setOpacity(None, log=False)
-                annular13.setContrast(cont, log=False)
-                annular13.setLineWidth(1.0, log=False)
-            
-            # if annular13 is stopping this frame...
-            if annular13.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular13.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular13.tStop = t  # not accounting for scr refresh
-                    annular13.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular13.stopped')
-                    # update status
-                    annular13.status = FINISHED
-                    annular13.setAutoDraw(False)
-
-            # *annular14* updates
-            
-            # if annular14 is starting this frame...
-            if annular14.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular14.frameNStart = frameN  # exact frame index
-                annular14.tStart = t  # local t and not account for scr refresh
-                annular14.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular14, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular14.started')
-                # update status
-                annular14.status = STARTED
-                annular14.setAutoDraw(True)
-            
-            # if annular14 is active this frame...
-            if annular14.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular14.setOpacity(None, log=False)
-                annular14.setContrast(cont, log=False)
-                annular14.setLineWidth(1.0, log=False)
-            
-            # if annular14 is stopping this frame...
-            if annular14.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular14.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular14.tStop = t  # not accounting for scr refresh
-                    annular14.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular14.stopped')
-                    # update status
-                    annular14.status = FINISHED
-                    annular14.setAutoDraw(False)
-
-            # *annular15* updates
-            
-            # if annular15 is starting this frame...
-            if annular15.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular15.frameNStart = frameN  # exact frame index
-                annular15.tStart = t  # local t and not account for scr refresh
-                annular15.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular15, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular15.started')
-                # update status
-                annular15.status = STARTED
-                annular15.setAutoDraw(True)
-            
-            # if annular15 is active this frame...
-            if annular15.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular15.setOpacity(None, log=False)
-                annular15.setContrast(cont, log=False)
-                annular15.setLineWidth(1.0, log=False)
-            
-            # if annular15 is stopping this frame...
-            if annular15.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular15.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular15.tStop = t  # not accounting for scr refresh
-                    annular15.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular15.stopped')
-                    # update status
-                    annular15.status = FINISHED
-                    annular15.setAutoDraw(False)
-
-            # *annular16* updates
-            
-            # if annular16 is starting this frame...
-            if annular16.status == NOT_STARTED and tThisFlip >= 0.0-frameTolerance:
-                # keep track of start time/frame for later
-                annular16.frameNStart = frameN  # exact frame index
-                annular16.tStart = t  # local t and not account for scr refresh
-                annular16.tStartRefresh = tThisFlipGlobal  # on global time
-                win.timeOnFlip(annular16, 'tStartRefresh')  # time at next scr refresh
-                # add timestamp to datafile
-                thisExp.timestampOnFlip(win, 'annular16.started')
-                # update status
-                annular16.status = STARTED
-                annular16.setAutoDraw(True)
-            
-            # if annular16 is active this frame...
-            if annular16.status == STARTED:
-                if 0<t<=1.6:
-                    cont=(-0.1875)*t+0.65
-                elif 1.6<t<=2.4:
-                    cont=0.375*t-0.25
-                else:
-                    cont=0.65
-                # update params
-                annular16.setOpacity(None, log=False)
-                annular16.setContrast(cont, log=False)
-                annular16.setLineWidth(1.0, log=False)
-            
-            # if annular16 is stopping this frame...
-            if annular16.status == STARTED:
-                # is it time to stop? (based on global clock, using actual start)
-                if tThisFlipGlobal > annular16.tStartRefresh + asec-frameTolerance:
-                    # keep track of stop time/frame for later
-                    annular16.tStop = t  # not accounting for scr refresh
-                    annular16.frameNStop = frameN  # exact frame index
-                    # add timestamp to datafile
-                    thisExp.timestampOnFlip(win, 'annular16.stopped')
-                    # update status
-                    annular16.status = FINISHED
-                    annular16.setAutoDraw(False)
-            
             # *cover* updates
             
             # if cover is starting this frame...
@@ -1298,7 +606,7 @@ for thisBlock in blocks:
             
             # if cover is active this frame...
             if cover.status == STARTED:
-                opci=0.5+0.5*np.sin(2*np.pi*t*21.25)
+                opci = trialTimeline.opacity[frameI]
                 # update params
                 cover.setOpacity(opci, log=False)
                 cover.setContrast(0.0, log=False)
@@ -1440,7 +748,7 @@ for thisBlock in blocks:
             
             # refresh the screen
             if continueRoutine:  # don't flip if this routine is over or we'll get a blank screen
-                win.flip()
+                flipTimes.append(win.flip())
         
         # --- Ending Routine "GTDT" ---
         for thisComponent in GTDTComponents:
@@ -1454,6 +762,14 @@ for thisBlock in blocks:
         trials.addData('press.keys',press.keys)
         if press.keys != None:  # we had a response
             trials.addData('press.rt', press.rt)
+        # frame of marker 9 and the flips it waited for the port (0 = on the resize flip)
+        for flip, code, delay in triggers.attach(win, square).since(trialFlip):
+            if code == timeline.SQUARE_MARKER:
+                trials.addData('square.frame', flip - trialFlip - 1)
+                trials.addData('square.delay', delay)
+        # the frames of the trial as shown, with its markers
+        stimLog.end_trial(flipTimes, [(flip - trialFlip - 1, code) for flip, code, delay
+                                     in triggers.attach(win, square).since(trialFlip)])
         # the Routine "GTDT" was not non-slip safe, so reset the non-slip timer
         routineTimer.reset()
         thisExp.nextEntry()
@@ -1720,6 +1036,8 @@ routineTimer.reset()
 # and win.timeOnFlip() tasks get executed before quitting
 win.flip()
 
+# every GTDT trial is in the stimulus log file
+stimLog.close()
 # these shouldn't be strictly necessary (should auto-save)
 thisExp.saveAsWideText(filename+'.csv', delim='auto')
 thisExp.saveAsPickle(filename)
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Shared runtime helpers for the GTDT PsychoPy scripts.
+
+The coder/builder scripts in 0_GTDT(NNU) and 1_GTDT(SJTU) add 1_Procedure to
+sys.path and import the modules of this package directly, e.g.
+
+    from gtdt import triggers
+"""
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Checkerboard annulus drawn as a single stimulus.
+
+The GTDT scripts built the ring from 16 visual.Pie objects (annular ...
+annular16), each with its own bookkeeping, setContrast/setOpacity/
+setLineWidth calls and draw call on every frame. make_annulus() bakes the 16
+alternating sectors into one texture and returns a single GratingStim with a
+circular mask, so the whole ring costs one draw and one setContrast per frame.
+
+The texture holds the sector colours in PsychoPy's signed rgb space, so
+`contrast` scales them exactly like it scaled the fill colour of each Pie.
+"""
+import numpy as np
+
+N_SECTORS = 16
+# 'lightgrey' and 'darkgrey' of the Pies, converted to signed rgb (-1 .. 1)
+LIGHTGREY = 211 / 127.5 - 1
+DARKGREY = 169 / 127.5 - 1
+
+
+def sector_texture(n_sectors=N_SECTORS, colors=(LIGHTGREY, DARKGREY), res=512):
+    """res x res array with `n_sectors` alternating wedges.
+
+    Angles run clockwise from 12 o'clock like the start/end of visual.Pie, so
+    sector 0 (0-22.5 deg) gets colors[0] as annular did. Row 0 is the bottom
+    of the texture, as PsychoPy expects.
+    """
+    coords = (np.arange(res) + 0.5) / res * 2 - 1
+    x, y = np.meshgrid(coords, coords)
+    angle = np.degrees(np.arctan2(x, y)) % 360  # clockwise from north
+    sector = (angle // (360.0 / n_sectors)).astype(int)
+    return np.where(sector % 2 == 0, colors[0], colors[1])
+
+
+def make_annulus(win, radius=0.25, name='annular', depth=-1.0, n_sectors=N_SECTORS,
+                 colors=(LIGHTGREY, DARKGREY), res=512, contrast=1.0, visual=None):
+    """One GratingStim replacing the 16 annular* Pies.
+
+    radius is in the window's units (0.25 for units='height', 2.8 for 'cm'),
+    depth/name are kept so autoDraw order and the data file match the Pies.
+    """
+    if visual is None:
+        from psychopy import visual
+
+    # one texture repeat across the stimulus: for 'norm'/'height' PsychoPy
+    # reads sf as cycles per stimulus, otherwise as cycles per unit
+    if win.units in ('norm', 'height'):
+        sf = 1.0
+    else:
+        sf = 1.0 / (2 * radius)
+    return visual.GratingStim(
+        win=win, name=name,
+        tex=sector_texture(n_sectors, colors, res), mask='circle',
+        size=(2 * radius, 2 * radius), sf=sf, phase=0.0,
+        ori=0.0, pos=(0, 0),
+        color=[1, 1, 1], colorSpace='rgb', contrast=contrast,
+        opacity=1.0, interpolate=False, depth=depth)
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+Headless benchmark of the GTDT trial loop.
+
+Runs the real tasks.Session flow of C1-C3 / P1-P3 (routine engine, trial
+timelines, trigger scheduler, frame log) against stand-ins for the window,
+stimuli, keyboard and trial handlers, with the markers going to an in-memory
+ports.FileBackend, at simulated refresh rates, and prints percentiles of the
+Python time spent per frame of the GTDT trials (everything between two
+flips; no drawing happens). Nothing needs a monitor, a port or psychopy, so a
+change can be checked before a script goes to a lab PC:
+
+    cd 1_Procedure
+    python -m gtdt.bench_tasks
+    python -m gtdt.bench_tasks --tasks C1 P2 --rates 85 144 --rows 4
+    python -m gtdt.bench_tasks --realtime     # with the realtime section
+    python -m gtdt.bench_tasks --check-log    # same wide csv columns with and without it
+
+The Session runs without its realtime.RealTime section unless --realtime
+is given, so the benchmark neither renices, pins nor gc-freezes the
+process it runs in.
+
+The stand-in window never waits for a refresh: flip n returns the nominal
+time n / rate, so the timing reported is the CPU cost of the loop alone.
+The 'space' presses are read by the Session's key reader thread whenever it
+gets to run, so a trial sees fewer of them than at a real refresh rate. The
+first frame of a trial is reported apart ('setup'): it also holds everything
+done since the flip before the trial (saving the previous trial; the
+timeline is compiled ahead during the trial before or the fixation, and the
+conditions files are all parsed when the Session is built).
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+import types
+
+import numpy as np
+
+from gtdt import datalog, ports, tasks
+
+RATES = (60, 85, 120, 144)
+TASKS = ('C1', 'C2', 'C3', 'P1', 'P2', 'P3')
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                        '1_GTDT(SJTU)', 'shuffled') + os.sep
+PRESS_INTERVAL = 0.6  # seconds between two simulated 'space' presses in a trial
+
+
+class Window(object):
+    """Window stand-in with a simulated refresh clock.
+
+    flip() runs the callOnFlip/timeOnFlip work like psychopy and records the
+    perf_counter time since the previous flip returned, for the frames shown
+    while `timing` is set.
+    """
+
+    units = 'height'
+
+    def __init__(self, frame_rate):
+        self.frame_rate = float(frame_rate)
+        self.flips = 0
+        self.timing = False
+        self.cost = []
+        self._onFlip = []
+        self._last = time.perf_counter()
+
+    def callOnFlip(self, function, *args, **kwargs):
+        self._onFlip.append((function, args, kwargs))
+
+    def timeOnFlip(self, obj, attrib):
+        self._onFlip.append((lambda: setattr(obj, attrib, self.flips / self.frame_rate),
+                             (), {}))
+
+    def clearBuffer(self):
+        pass
+
+    def getFutureFlipTime(self, clock=None):
+        return (self.flips + 1) / self.frame_rate
+
+    def flip(self, clearBuffer=True):
+        if self.timing:
+            self.cost.append(time.perf_counter() - self._last)
+        self.flips += 1
+        onFlip, self._onFlip = self._onFlip, []
+        for function, args, kwargs in onFlip:
+            function(*args, **kwargs)
+        self._last = time.perf_counter()
+        return self.flips / self.frame_rate
+
+
+class Stimulus(object):
+    # any visual stimulus: setters and draw() accept everything and do nothing
+    def __init__(self, *args, **kwargs):
+        self.name = kwargs.get('name')
+        self.text = ''
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+
+visual = types.SimpleNamespace(ImageStim=Stimulus, TextStim=Stimulus, Rect=Stimulus,
+                               ShapeStim=Stimulus, TextBox2=Stimulus,
+                               GratingStim=Stimulus)
+
+
+class Key(object):
+    def __init__(self, name, rt):
+        self.name = name
+        self.rt = rt
+        self.tDown = rt
+
+
+class Keyboard(object):
+    """Keyboard stand-in answering every screen.
+
+    The trial keyboard ('press') gives a 'space' every PRESS_INTERVAL seconds
+    of flips of the window, whichever thread polls it (the Session reads it
+    with a keyreader.KeyReader), any other keyboard its first allowed key on
+    the third poll ('p' on the practice_end screen ends the practice).
+    'escape' is never pressed.
+    """
+
+    frame_rate = 60.0
+    window = None
+
+    def __init__(self, *args, **kwargs):
+        self.name = kwargs.get('name', '')
+        self.clock = types.SimpleNamespace(reset=self.reset, getTime=self.getTime)
+        self.keys = []
+        self.rt = []
+        self.reset()
+
+    def reset(self):
+        self.polls = 0
+        self.started = self.window.flips if self.window is not None else 0
+        self.presses = 0
+
+    def getTime(self):
+        # the key times count flips of the window since the last reset
+        if self.window is None:
+            return self.polls / self.frame_rate
+        return (self.window.flips - self.started) / self.frame_rate
+
+    def clearEvents(self, eventType=None):
+        pass
+
+    def getKeys(self, keyList=None, waitRelease=False):
+        if keyList == ['escape']:
+            return []
+        self.polls += 1
+        if self.name == 'press':
+            every = max(1, int(round(PRESS_INTERVAL * self.frame_rate)))
+            flips = self.window.flips - self.started
+            if flips // every <= self.presses:
+                return []
+            self.presses = flips // every
+            return [Key('space', self.presses * every / self.frame_rate)]
+        rt = self.polls / self.frame_rate
+        return [Key(keyList[0], rt)] if self.polls == 3 else []
+
+
+class ExperimentHandler(object):
+    def __init__(self, win):
+        self.win = win
+        self.extraInfo = {}
+        self.entries = []
+        self.thisEntry = {}
+
+    def addData(self, name, value):
+        self.thisEntry[name] = value
+
+    def timestampOnFlip(self, win, name):
+        win.callOnFlip(lambda: self.addData(name, win.flips / win.frame_rate))
+
+    def addLoop(self, loop):
+        loop.exp = self
+
+    def nextEntry(self):
+        self.entries.append(self.thisEntry)
+        self.thisEntry = {}
+
+
+class TrialHandler(object):
+    # sequential / (full)random trial loop over the first rows of a conditions file
+    def __init__(self, nReps, method, extraInfo, originPath, trialList, seed, name):
+        self.nReps = int(nReps)
+        self.method = method
+        self.trialList = trialList
+        self.nTotal = self.nReps * len(trialList)
+        self.name = name
+        self.finished = False
+        self.exp = None
+        self.thisN = -1
+        # the whole order is drawn up front, as psychopy does, for getFutureTrial()
+        rng = random.Random(0)
+        self.sequence = []
+        for rep in range(self.nReps):
+            order = list(self.trialList)
+            if self.method != 'sequential':
+                rng.shuffle(order)
+            self.sequence.extend(order)
+
+    def __iter__(self):
+        for self.thisN, row in enumerate(self.sequence):
+            if self.finished:
+                return
+            yield row
+
+    def getFutureTrial(self, n=1):
+        # the row `n` trials ahead, None beyond the last
+        index = self.thisN + n
+        return self.sequence[index] if 0 <= index < len(self.sequence) else None
+
+    def addData(self, name, value):
+        self.exp.addData(name, value)
+
+
+def data_module(rows):
+    # importConditions limited to the first `rows` rows of every xlsx
+    import pandas as pd
+
+    def importConditions(path):
+        return pd.read_excel(path).head(rows).to_dict('records')
+
+    return types.SimpleNamespace(TrialHandler=TrialHandler, importConditions=importConditions)
+
+
+def run_task(name, frame_rate, rows, root_dir=ROOT_DIR, realtime=False, log=None):
+    """Python time (ms) per frame of the GTDT trials of one task at `frame_rate`.
+
+    Returns the times of all frames and a mask of the first frame of every
+    trial, which also carries the trial setup (timeline compile, retime).
+    """
+    win = Window(frame_rate)
+    Keyboard.frame_rate = frame_rate
+    Keyboard.window = win
+    cfg = tasks.TASKS[name]
+    # names like btrials are relative to the script folder, which the scripts chdir into
+    cwd = os.getcwd()
+    os.chdir(root_dir)
+    try:
+        session = tasks.Session(cfg, win, ExperimentHandler(win), root_dir,
+                                port=None if cfg.get('practice') else ports.FileBackend(),
+                                frame_rate=frame_rate, quit_keyboard=Keyboard(),
+                                log=log, realtime=realtime, visual=visual,
+                                keyboard=types.SimpleNamespace(Keyboard=Keyboard),
+                                data=data_module(rows))
+        trial = session.trial
+        first = []
+
+        def timed_trial(*args):
+            first.append(len(win.cost))
+            win.timing = True
+            try:
+                trial(*args)
+            finally:
+                win.timing = False
+
+        session.trial = timed_trial
+        session.run()
+        session.close()
+    finally:
+        os.chdir(cwd)
+    cost = np.array(win.cost) * 1000
+    setup = np.zeros(len(cost), dtype=bool)
+    setup[first] = True
+    return cost, setup
+
+
+def wide_columns(name, frame_rate, rows, root_dir=ROOT_DIR, realtime=False):
+    # columns of the wide csv rebuilt from the TrialLog of one run of the task
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, name + '_long.csv')
+    log = datalog.TrialLog(path)
+    try:
+        run_task(name, frame_rate, rows, root_dir, realtime, log)
+    finally:
+        log.close()
+    datalog.to_wide(path, os.path.join(folder, name + '.csv'))
+    with open(os.path.join(folder, name + '.csv'), newline='', encoding='utf-8') as f:
+        return next(csv.reader(f))
+
+
+def check_log(names, frame_rate, rows, root_dir=ROOT_DIR):
+    """True if every task writes the same wide csv columns with and without realtime."""
+    same = True
+    for name in names:
+        without = wide_columns(name, frame_rate, rows, root_dir, realtime=False)
+        with_rt = wide_columns(name, frame_rate, rows, root_dir, realtime=True)
+        extra = sorted(set(with_rt) ^ set(without))
+        print('%-4s wide csv: %d columns, %s' % (name, len(without),
+              'same with realtime' if not extra else 'differ: ' + ', '.join(extra)))
+        same = same and not extra
+    return same
+
+
+def summarise(name, frame_rate, cost, setup):
+    # percentiles of the running frames; the trial setup frames separately
+    budget = 1000.0 / frame_rate
+    frames = cost[~setup]
+    p50, p95, p99 = np.percentile(frames, [50, 95, 99])
+    print('%-4s %5.0f Hz  %6d frames  p50 %6.3f  p95 %6.3f  p99 %6.3f  max %7.3f ms'
+          '  setup max %7.3f ms  over %.2f ms: %d'
+          % (name, frame_rate, len(frames), p50, p95, p99, frames.max(),
+             cost[setup].max(), budget, np.sum(cost > budget)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tasks', nargs='+', default=list(TASKS), choices=sorted(tasks.TASKS))
+    parser.add_argument('--rates', nargs='+', type=float, default=list(RATES),
+                        help='simulated refresh rates (Hz)')
+    parser.add_argument('--rows', type=int, default=2,
+                        help='rows used from every conditions file')
+    parser.add_argument('--root-dir', default=ROOT_DIR,
+                        help='folder with the xlsx conditions files')
+    parser.add_argument('--realtime', action='store_true',
+                        help='run the trials in the realtime section (priority, pinning, gc)')
+    parser.add_argument('--check-log', action='store_true',
+                        help='only check that the realtime section adds no wide csv columns')
+    args = parser.parse_args(argv)
+    if args.check_log:
+        if not check_log(args.tasks, args.rates[0], args.rows, args.root_dir):
+            sys.exit(1)
+        return
+    for name in args.tasks:
+        for frame_rate in args.rates:
+            summarise(name, frame_rate, *run_task(name, frame_rate, args.rows, args.root_dir,
+                                                  args.realtime))
+
+
+if __name__ == '__main__':
+    main()
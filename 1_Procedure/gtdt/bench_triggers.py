@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Trigger latency and jitter test bench.
+
+Nothing told us how long setData takes or how far after the flip a marker
+actually goes out. This bench runs a scripted sequence of flips with a
+marker every few frames through triggers.TriggerScheduler and one trigger
+backend (ports.py) and timestamps every write against the flip before it:
+
+    write   : duration of setData itself
+    offset  : flip -> start of the write (the scheduler's share)
+    arrival : flip -> receipt of the code by a loopback receiver (udp on
+              127.0.0.1 / localhost only; parallel and serial lines need
+              an external recorder)
+
+and prints percentiles and a histogram per backend. With --limit every
+backend must keep the p99 of its arrival (or offset + write) under that many
+ms, and the exit status tells whether it did, so each site can certify its
+trigger timing before collecting data:
+
+    cd 1_Procedure
+    python -m gtdt.bench_triggers                      # file and udp, simulated 85 Hz
+    python -m gtdt.bench_triggers 0x3EFC --psychopy --limit 1 --out triggers.csv
+
+Without --psychopy the flips come from a simulated window that waits for a
+real-time refresh clock, so the bench runs on any machine.
+"""
+import argparse
+import csv
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
+
+from gtdt import ports, triggers
+
+SPECS = ('file', 'udp')
+PERCENTILES = (50, 95, 99)
+
+
+class SimulatedWindow(object):
+    """Window stand-in whose flip() waits for the next tick of a refresh clock.
+
+    Returns the perf_counter time of that tick; a tick missed by the caller
+    is skipped, like a missed vertical blank.
+    """
+
+    def __init__(self, frame_rate):
+        self.frame_rate = float(frame_rate)
+        self._period = 1.0 / self.frame_rate
+        self._next = None
+
+    def flip(self, clearBuffer=True):
+        now = time.perf_counter()
+        if self._next is None:
+            self._next = now
+        self._next += self._period
+        while self._next < now:
+            self._next += self._period
+        # sleep most of the way, then spin for the last 2 ms
+        remaining = self._next - time.perf_counter()
+        if remaining > 0.002:
+            time.sleep(remaining - 0.002)
+        while time.perf_counter() < self._next:
+            pass
+        return self._next
+
+
+class Receiver(object):
+    """UDP receiver recording (perf_counter time, code) of every datagram."""
+
+    def __init__(self, host, port):
+        self.records = []
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((host, port))
+        self._socket.settimeout(0.05)
+        self._running = True
+        self._thread = threading.Thread(target=self._work, name='Receiver')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _work(self):
+        while self._running:
+            try:
+                data, _ = self._socket.recvfrom(16)
+            except socket.timeout:
+                continue
+            self.records.append((time.perf_counter(), data[0]))
+
+    def stop(self, n_expected, timeout=1.0):
+        # wait for the datagrams still in flight, then close
+        deadline = time.perf_counter() + timeout
+        while len(self.records) < n_expected and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        self._running = False
+        self._thread.join()
+        self._socket.close()
+
+
+def receiver_for(backend):
+    # a loopback receiver for a udp backend sending to this machine
+    if isinstance(backend, ports.UDPBackend) and \
+            backend.address[0] in ('127.0.0.1', 'localhost'):
+        return Receiver(*backend.address)
+    return None
+
+
+def run(spec, win, n_frames=850, every=10, hold_frames=4):
+    """Flip `n_frames` times with a marker every `every` frames through `spec`.
+
+    Returns a dict of per-write arrays: write, offset, arrival (ms, NaN
+    without a receiver) and the flip before each write, plus the delays in
+    flips of the scheduler and the name of the backend.
+    """
+    backend = ports.parse(spec)
+    receiver = receiver_for(backend)
+    flipTimes = []
+    flip = win.flip
+
+    def recorded_flip(*args, **kwargs):
+        result = flip(*args, **kwargs)
+        flipTimes.append(time.perf_counter())
+        return result
+
+    win.flip = recorded_flip
+    scheduler = triggers.TriggerScheduler(backend, win, hold_frames=hold_frames)
+    try:
+        for frameN in range(n_frames):
+            if frameN % every == 0:
+                scheduler.send(1 + frameN // every % 255)
+            win.flip()
+        while scheduler.pending():
+            win.flip()  # until the last code has been cleared
+    finally:
+        win.flip = flip
+        win._gtdtTrigger = None
+    if receiver is not None:
+        receiver.stop(len(backend.times))
+    backend.close()
+
+    times = np.array(backend.times)
+    # each write belongs to the last flip before it
+    flipIndex = np.searchsorted(np.array(flipTimes), times) - 1
+    before = np.array(flipTimes)[np.clip(flipIndex, 0, None)]
+    arrival = np.full(len(times), np.nan)
+    if receiver is not None:
+        n = min(len(times), len(receiver.records))
+        arrival[:n] = np.array([t for t, _ in receiver.records[:n]]) - before[:n]
+    return dict(name=backend.name, write=np.array(backend.latencies) * 1000,
+                offset=(times - before) * 1000, arrival=arrival * 1000, flip=flipIndex,
+                delays=np.array(scheduler.delays))
+
+
+def histogram(values, bins=12, width=40):
+    # text histogram of `values` (ms)
+    counts, edges = np.histogram(values, bins=bins)
+    scale = float(width) / max(1, counts.max())
+    return '\n'.join('    %8.3f - %8.3f ms %6d %s'
+                     % (lo, hi, count, '#' * int(round(count * scale)))
+                     for lo, hi, count in zip(edges[:-1], edges[1:], counts))
+
+
+def total(result):
+    # end-to-end latency of every write: arrival when it was received, else offset + write
+    if not np.all(np.isnan(result['arrival'])):
+        return result['arrival'][~np.isnan(result['arrival'])]
+    return result['offset'] + result['write']
+
+
+def summarise(result, limit=None):
+    """Print the percentiles and histogram of one run; True if it is within `limit`."""
+    print('%s: %d writes, %d flips waited behind a held code'
+          % (result['name'], len(result['write']), int(result['delays'].sum())))
+    for measure in ('write', 'offset', 'arrival'):
+        values = result[measure][~np.isnan(result[measure])]
+        if not len(values):
+            continue
+        quantiles = zip(PERCENTILES, np.percentile(values, PERCENTILES))
+        print('  %-8s %s  max %7.3f ms'
+              % (measure, '  '.join('p%d %7.3f' % qv for qv in quantiles), values.max()))
+    end_to_end = total(result)
+    print(histogram(end_to_end))
+    if limit is None:
+        return True
+    p99 = np.percentile(end_to_end, 99)
+    ok = p99 <= limit
+    print('  %s: p99 %.3f ms %s %.3f ms' % ('PASS' if ok else 'FAIL', p99,
+                                          '<=' if ok else '>', limit))
+    return ok
+
+
+def save(results, path):
+    # one row per write of every backend
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['backend', 'write', 'flip', 'write_ms', 'offset_ms', 'arrival_ms'])
+        for result in results:
+            for n, row in enumerate(zip(result['flip'], result['write'], result['offset'],
+                                        result['arrival'])):
+                writer.writerow([result['name'], n] + ['%.6f' % v if isinstance(v, float)
+                                                       else v for v in row])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('specs', nargs='*', default=list(SPECS),
+                        help='trigger backends (ports.py), default: %s' % ' '.join(SPECS))
+    parser.add_argument('--frames', type=int, default=850, help='flips per backend')
+    parser.add_argument('--every', type=int, default=10, help='frames between two markers')
+    parser.add_argument('--hold-frames', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=85.0,
+                        help='refresh rate of the simulated window (Hz)')
+    parser.add_argument('--psychopy', action='store_true',
+                        help='flip a real full-screen psychopy window instead')
+    parser.add_argument('--limit', type=float,
+                        help='p99 end-to-end latency (ms) every backend must stay under')
+    parser.add_argument('--out', help='csv with one row per write')
+    args = parser.parse_args(argv)
+    if args.every <= args.hold_frames + 1:
+        parser.error('--every must leave room for the held code and one flip of 0')
+
+    if args.psychopy:
+        from psychopy import visual
+
+        from gtdt import refresh
+        win = visual.Window(fullscr=True, monitor='testMonitor', color=[0, 0, 0],
+                            waitBlanking=True)
+        print('refresh %.2f Hz' % refresh.frame_rate(win, monitor='testMonitor'))
+    else:
+        win = SimulatedWindow(args.rate)
+    results = [run(spec, win, args.frames, args.every, args.hold_frames)
+               for spec in args.specs]
+    if args.psychopy:
+        win.close()
+    passed = all([summarise(result, args.limit) for result in results])
+    if args.out:
+        save(results, args.out)
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
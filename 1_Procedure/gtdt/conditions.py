@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Condition tables parsed once, before the first block.
+
+Every block loop called data.importConditions(root_dir + 'c2.xlsx') (or the
+c32x.xlsx its row names), which parses an Excel file between two blocks
+while the participant waits on the rest screen. A ConditionCache parses all
+block lists and trial lists of a task at start-up and hands each loop an
+in-memory copy of the rows; a block transition reads no file:
+
+    conditionTables = conditions.ConditionCache(data.importConditions)
+    conditionTables.preload(conditions.find(root_dir, _thisDir))
+    ...
+    trialList=conditionTables.get(root_dir + 'c2.xlsx')
+
+tasks.Session preloads the files of its task itself. The tables can also be
+compiled into one pickle per folder, which is read instead of the xlsx files
+while their size and modification time are unchanged:
+
+    cd 1_Procedure
+    python -m gtdt.conditions "1_GTDT(SJTU)/shuffled"    # writes conditions.pkl
+"""
+import argparse
+import glob
+import os
+import pickle
+
+PATTERNS = ('blist_*.xlsx', 'c*.xlsx')  # block lists and trial lists
+STORE = 'conditions.pkl'
+VERSION = 1
+
+
+def find(*folders):
+    """Block and trial lists in `folders`, each file once."""
+    paths = []
+    seen = set()
+    for folder in folders:
+        for pattern in PATTERNS:
+            for path in sorted(glob.glob(os.path.join(folder, pattern))):
+                key = os.path.abspath(path)
+                if key not in seen:
+                    seen.add(key)
+                    paths.append(path)
+    return paths
+
+
+def stamp(path):
+    # what a compiled table is checked against
+    st = os.stat(path)
+    return st.st_size, st.st_mtime
+
+
+class ConditionCache(object):
+    """Parsed conditions files by absolute path.
+
+    import_conditions : parser of one file (psychopy.data.importConditions)
+    store             : pickle of compiled tables to start from and save(), or None
+    parsed            : files parsed from xlsx so far
+    misses            : files first asked for by get(), i.e. not preloaded
+    """
+
+    def __init__(self, import_conditions=None, store=None):
+        if import_conditions is None:
+            from psychopy.data import importConditions as import_conditions
+        self.import_conditions = import_conditions
+        self.store = store
+        self.tables = {}  # path -> rows, checked and ready for get()
+        self.parsed = []
+        self.misses = []
+        self._compiled = {}  # name -> (stamp, rows) as stored
+        if store is not None and os.path.exists(store):
+            with open(store, 'rb') as f:
+                version, compiled = pickle.load(f)
+            if version == VERSION:
+                self._compiled = compiled
+
+    def _name(self, key):
+        # compiled tables are named relative to the store, so the folder can move
+        if self.store is None:
+            return key
+        return os.path.relpath(key, os.path.dirname(os.path.abspath(self.store)))
+
+    def _load(self, key):
+        name = self._name(key)
+        compiled = self._compiled.get(name)
+        current = stamp(key)
+        if compiled is not None and compiled[0] == current:
+            return compiled[1]
+        rows = self.import_conditions(key)
+        self._compiled[name] = (current, rows)
+        self.parsed.append(key)
+        return rows
+
+    def preload(self, paths):
+        """Parse (or take from the store) every file of `paths` now."""
+        for path in paths:
+            key = os.path.abspath(path)
+            if key not in self.tables:
+                self.tables[key] = self._load(key)
+
+    def get(self, path):
+        # the rows of one file, as importConditions returns them
+        key = os.path.abspath(path)
+        if key not in self.tables:
+            self.misses.append(key)
+            self.tables[key] = self._load(key)
+        return list(self.tables[key])
+
+    def save(self):
+        """Write the compiled tables to the store (only if something was parsed)."""
+        if self.store is None or not self.parsed:
+            return
+        tmp = self.store + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump((VERSION, self._compiled), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.store)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('folders', nargs='+', help='folders with blist_*.xlsx / c*.xlsx')
+    args = parser.parse_args(argv)
+    for folder in args.folders:
+        cache = ConditionCache(store=os.path.join(folder, STORE))
+        paths = find(folder)
+        cache.preload(paths)
+        cache.save()
+        print('%s: %d tables, %d parsed -> %s' % (folder, len(paths), len(cache.parsed),
+                                                  cache.store))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only, crash-safe trial log.
+
+thisExp keeps every entry in memory and only writes the .csv/.psydat at the
+end of the session, so a crash loses the whole run and the last save stalls.
+A TrialLog appends the data of every entry to a long-format csv instead,
+
+    entry, component, event, flip, time, marker, value
+
+one row per value (`annular.started` -> component 'annular', event 'started'),
+plus one row per marker of a GTDT trial (trial frame, flip time and code) and
+an 'end' row closing the entry. The caller only puts records on a queue; a
+background thread formats them, appends them to the file and flushes it to
+disk once per entry:
+
+    log = datalog.TrialLog(filename + '_long.csv')
+    session = tasks.Session(tasks.C1, win, thisExp, root_dir, port=port, log=log)
+    session.run()
+    log.close()
+
+The long file converts back to the wide csv the preprocessing scripts read
+(entries without their 'end' row, i.e. cut off by a crash, are dropped):
+
+    cd 1_Procedure
+    python -m gtdt.datalog data/123456_GTDT1_long.csv
+"""
+import argparse
+import atexit
+import csv
+import os
+import queue
+import threading
+
+COLUMNS = ['entry', 'component', 'event', 'flip', 'time', 'marker', 'value']
+# realtime diagnostics in files written before they moved to the frames .npz
+SKIPPED = {('gc', 'pause'), ('GTDT', 'overrun')}
+_FLUSH = object()  # queued after the last record of an entry
+_STOP = object()
+
+
+def split_key(key):
+    # 'annular.started' -> ('annular', 'started'); 'asec' -> ('', 'asec')
+    component, _, event = key.rpartition('.')
+    return component, event
+
+
+def _text(value):
+    return '' if value is None else str(value)
+
+
+class TrialLog(object):
+    """Long-format log of a session, written by a background thread.
+
+    path : csv the rows are appended to (created with a header if missing);
+           the entries of a restarted session continue the numbering after
+           the last complete entry, the partial one a crash left is cut off
+    """
+
+    def __init__(self, path):
+        self.path = path
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.entry = 0 if new else _resume(path)  # number of the entry being recorded
+        self.error = None
+        self._queue = queue.Queue()
+        self._file = open(path, 'a', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        if new:
+            self._writer.writerow(COLUMNS)
+        self._thread = threading.Thread(target=self._work, name='TrialLog')
+        self._thread.daemon = True
+        self._thread.start()
+        atexit.register(self.close)  # also drain the queue on core.quit()
+
+    def event(self, component, event, flip=None, time=None, marker=None, value=None):
+        # one record of the current entry; returns immediately
+        self._queue.put((self.entry, component, event, flip, time, marker, value))
+
+    def add_entry(self, row):
+        """Queue the values of one finished entry (thisExp.entries[-1]) and close it."""
+        for key, value in row.items():
+            component, event = split_key(key)
+            self._queue.put((self.entry, component, event, None, None, None, value))
+        self._queue.put((self.entry, '', 'end', None, None, None, None))
+        self._queue.put(_FLUSH)
+        self.entry += 1
+
+    def close(self):
+        # write what is still queued and stop the thread; safe to call twice
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if not self._file.closed:
+            self._file.close()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _work(self):
+        while True:
+            record = self._queue.get()
+            if record is _STOP:
+                self._sync()
+                return
+            if self.error is not None:
+                continue  # keep draining so the producer never blocks
+            try:
+                if record is _FLUSH:
+                    self._sync()
+                else:
+                    self._writer.writerow([_text(value) for value in record])
+            except (IOError, OSError) as error:
+                self.error = error
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def _resume(path):
+    # number of the entry after the last 'end' row; the rows after it are cut off
+    entry, keep = 0, None
+    with open(path, 'rb+') as f:
+        offset = [0]
+
+        def lines():
+            for line in iter(f.readline, b''):
+                offset[0] = f.tell()
+                yield line.decode('utf-8')
+
+        for row in csv.reader(lines()):
+            if row == COLUMNS:
+                keep = offset[0]
+            elif len(row) > 2 and row[2] == 'end':
+                entry, keep = int(row[0]) + 1, offset[0]
+        if keep is not None:
+            f.truncate(keep)
+    return entry
+
+
+def read_entries(path):
+    """Complete entries of a long csv, as lists of row dicts in file order."""
+    entries = []
+    rows = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if row['value'] is None:
+                break  # line cut off by a crash
+            if row['event'] == 'end' and not row['component']:
+                entries.append(rows)
+                rows = []
+            else:
+                rows.append(row)
+    return entries
+
+
+def to_wide(path, out):
+    """Write the complete entries of the long csv `path` as the wide csv `out`.
+
+    One line per entry and one column per value, as thisExp.saveAsWideText
+    writes them; the marker rows (frames.markers has them) and the SKIPPED
+    diagnostics are left out.
+    Returns the number of entries written.
+    """
+    header = []
+    seen = set()
+    lines = []
+    for rows in read_entries(path):
+        line = {}
+        for row in rows:
+            if row['event'] == 'marker' or (row['component'], row['event']) in SKIPPED:
+                continue
+            key = row['component'] + '.' + row['event'] if row['component'] else row['event']
+            if key not in seen:
+                seen.add(key)
+                header.append(key)
+            line[key] = row['value']
+        lines.append(line)
+    with open(out, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, header, restval='')
+        writer.writeheader()
+        writer.writerows(lines)
+    return len(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('files', nargs='+', help='*_long.csv written by TrialLog')
+    parser.add_argument('--force', action='store_true',
+                        help='overwrite an existing wide csv')
+    args = parser.parse_args(argv)
+    for path in args.files:
+        stem = path[:-len('_long.csv')] if path.endswith('_long.csv') else \
+            os.path.splitext(path)[0] + '_wide'
+        out = stem + '.csv'
+        if os.path.exists(out) and not args.force:
+            print('%s exists, skipped (use --force to overwrite)' % out)
+            continue
+        print('%s: %d entries -> %s' % (path, to_wide(path, out), out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+SSVEP flicker of the GTDT cover, planned for the measured refresh rate.
+
+The cover opacity 0.5 + 0.5 * sin(2 * pi * 21.25 * t) is sampled once per
+flip. At 85 Hz that is exactly 4 frames per cycle; at 60, 120 or 144 Hz
+21.25 Hz is no whole number of frames and the frames carry a sampled sine
+whose cycles differ from frame to frame. plan() decides, for one target
+frequency and refresh rate, which frequency is actually shown:
+
+    exact   : the nearest frequency with a whole number of frames per cycle,
+              frame_rate / k (k >= MIN_FRAMES); every cycle is identical
+    sampled : the target itself as a sampled sinusoid, valid below
+              frame_rate / 2; its spectrum is the target plus images at
+              k * frame_rate +- target, all above the Nyquist limit
+    auto    : exact when that is within `tolerance` of the target, otherwise
+              sampled
+
+tasks.Session plans the flicker of its task once and stores the effective
+frequency and method with every trial (flicker.hz, flicker.method), so the
+analysis reads the frequency that was shown instead of assuming 21.25 Hz:
+
+    cd 1_Procedure
+    python -m gtdt.flicker 21.25 20 --rates 60 85 120 144
+"""
+import argparse
+
+import numpy as np
+
+MIN_FRAMES = 3  # a 2-frame cycle of a sine sampled at phase 0 is flat
+TOLERANCE = 0.05  # Hz; closer than this the exact frequency replaces the target
+
+
+class Flicker(object):
+    """The flicker shown for `target_hz` at `frame_rate`.
+
+    hz               : effective frequency of the cover luminance
+    method           : 'exact' or 'sampled'
+    frames_per_cycle : frame_rate / hz (a whole number for 'exact')
+    """
+
+    def __init__(self, target_hz, frame_rate, hz, method):
+        self.target_hz = float(target_hz)
+        self.frame_rate = float(frame_rate)
+        self.hz = float(hz)
+        self.method = method
+        self.frames_per_cycle = self.frame_rate / self.hz
+
+    def opacity(self, t):
+        # cover opacity at the flip times t (s)
+        return 0.5 + 0.5 * np.sin(2 * np.pi * self.hz * np.asarray(t, dtype=float))
+
+    def images(self, n=2):
+        # frequencies of the first spectral images of the sampled sequence
+        return sorted(abs(k * self.frame_rate + sign * self.hz)
+                      for k in range(1, n + 1) for sign in (-1, 1))
+
+    def describe(self):
+        return ('%.4g Hz for %.4g Hz at %.4g Hz: %s, %.3f frames/cycle'
+                % (self.hz, self.target_hz, self.frame_rate, self.method,
+                   self.frames_per_cycle))
+
+
+def exact(target_hz, frame_rate, min_frames=MIN_FRAMES):
+    """Nearest frequency frame_rate / k to `target_hz` with k >= min_frames."""
+    k = max(min_frames, int(round(frame_rate / float(target_hz))))
+    candidates = [frame_rate / float(n) for n in (k - 1, k, k + 1) if n >= min_frames]
+    return min(candidates, key=lambda hz: abs(hz - target_hz))
+
+
+def plan(target_hz, frame_rate, method='auto', tolerance=TOLERANCE,
+         min_frames=MIN_FRAMES):
+    """Flicker shown for `target_hz` at `frame_rate` (see the module docstring)."""
+    target_hz = float(target_hz)
+    frame_rate = float(frame_rate)
+    nearest = exact(target_hz, frame_rate, min_frames)
+    if method == 'auto':
+        method = 'exact' if abs(nearest - target_hz) <= tolerance else 'sampled'
+    if method == 'exact':
+        return Flicker(target_hz, frame_rate, nearest, 'exact')
+    if method != 'sampled':
+        raise ValueError("method must be 'auto', 'exact' or 'sampled', got %r" % method)
+    if target_hz >= frame_rate / 2:
+        raise ValueError('%.4g Hz cannot be sampled at %.4g Hz (Nyquist limit %.4g Hz)'
+                         % (target_hz, frame_rate, frame_rate / 2))
+    return Flicker(target_hz, frame_rate, target_hz, 'sampled')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('targets', nargs='+', type=float, help='flicker frequencies (Hz)')
+    parser.add_argument('--rates', nargs='+', type=float, default=[60, 85, 120, 144],
+                        help='refresh rates (Hz)')
+    parser.add_argument('--method', default='auto', choices=['auto', 'exact', 'sampled'])
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+    for target in args.targets:
+        for rate in args.rates:
+            try:
+                flicker = plan(target, rate, args.method, args.tolerance)
+            except ValueError as error:
+                print(error)
+                continue
+            print('%s; nearest exact %.4g Hz; images %s Hz'
+                  % (flicker.describe(), exact(target, rate),
+                     ', '.join('%.4g' % hz for hz in flicker.images())))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Per-trial frame timing of the GTDT routine.
+
+The flicker and the contrast ramp are indexed by frame number, so a dropped
+frame shifts the SSVEP stimulus in time. FrameLog keeps, for every trial,
+the flip times recorded by routine.Routine and the flips the markers went
+out on, adds a few summary columns to the trial loop
+
+    frames.n, frames.missed, frames.maxInterval, frames.meanInterval (ms),
+    frames.markers ("frame:code" pairs)
+
+and writes the whole session to one compact .npz next to the csv, with the
+garbage collections and late flips of the realtime section when it ran
+(realtime.RealTime.arrays(): gc_pauses, overruns):
+
+    session.frames.save(filename + '_frames.npz')
+
+The file can be checked offline; trials whose timing deviated are flagged:
+
+    cd 1_Procedure
+    python -m gtdt.frames data/123456_GTDT1_frames.npz
+"""
+import argparse
+
+import numpy as np
+
+TOLERANCE = 0.5  # an interval longer than 1.5 frames counts as a missed flip
+
+TRIAL_DTYPE = np.dtype([('trial', np.int32), ('n', np.int32), ('missed', np.int32),
+                        ('max', np.float32), ('mean', np.float32),
+                        ('drift', np.float32)])
+MARKER_DTYPE = np.dtype([('trial', np.int32), ('frame', np.int32), ('code', np.uint8)])
+
+
+def trial_stats(flip_times, frame_rate, tolerance=TOLERANCE):
+    """Summary of the flips of one trial (intervals in ms).
+
+    missed : number of refreshes that passed without a flip
+    drift  : largest lag of a flip behind its nominal time frame/frame_rate
+    """
+    flip_times = np.asarray(flip_times, dtype=float)
+    frameDur = 1.0 / frame_rate
+    if len(flip_times) < 2:
+        return dict(n=len(flip_times), missed=0, max=np.nan, mean=np.nan, drift=0.0)
+    intervals = np.diff(flip_times)
+    late = intervals > (1 + tolerance) * frameDur
+    missed = int(np.sum(np.round(intervals[late] / frameDur) - 1))
+    nominal = np.arange(len(flip_times)) * frameDur
+    drift = np.max(flip_times - flip_times[0] - nominal)
+    return dict(n=len(flip_times), missed=missed, max=intervals.max() * 1000,
+                mean=intervals.mean() * 1000, drift=drift * 1000)
+
+
+class FrameLog(object):
+    """Frame timing of every trial of a session.
+
+    frame_rate : nominal refresh rate (Hz) the timelines were compiled for
+    """
+
+    def __init__(self, frame_rate, tolerance=TOLERANCE):
+        self.frame_rate = float(frame_rate)
+        self.tolerance = tolerance
+        self.trials = []
+        self.intervals = []
+        self.markers = []
+        self.last_markers = []  # (frame, code) of the last trial
+        self.realtime = None  # realtime.RealTime of the trials, saved with them
+        self._flip = 0
+
+    def start(self, win):
+        # remember where the marker scheduler stands when the trial starts
+        trigger = getattr(win, '_gtdtTrigger', None)
+        self._flip = trigger.flip_count if trigger is not None else 0
+
+    def stop(self, win, flip_times, handler=None):
+        """Record one trial; adds the frames.* columns to `handler` if given."""
+        trial = len(self.trials)
+        stats = trial_stats(flip_times, self.frame_rate, self.tolerance)
+        self.trials.append((trial, stats['n'], stats['missed'], stats['max'],
+                            stats['mean'], stats['drift']))
+        self.intervals.append(np.diff(np.asarray(flip_times, dtype=float)))
+
+        # a code is written right after flip number `n` of the scheduler,
+        # i.e. with frame n - 1 of the trial counted from its first flip
+        markers = []
+        trigger = getattr(win, '_gtdtTrigger', None)
+        if trigger is not None:
+            for n, code in trigger.sent:
+                if n > self._flip:
+                    markers.append((n - self._flip - 1, code))
+        self.markers.extend((trial, frame, code) for frame, code in markers)
+        self.last_markers = markers
+
+        if handler is not None:
+            handler.addData('frames.n', stats['n'])
+            handler.addData('frames.missed', stats['missed'])
+            handler.addData('frames.maxInterval', round(float(stats['max']), 3))
+            handler.addData('frames.meanInterval', round(float(stats['mean']), 3))
+            handler.addData('frames.markers',
+                            ';'.join('%d:%d' % marker for marker in markers))
+        return stats
+
+    def save(self, path):
+        # one .npz per session: trial table, all intervals (ms) and marker frames
+        intervals = [iv * 1000 for iv in self.intervals]
+        offsets = np.cumsum([0] + [len(iv) for iv in intervals])
+        realtime = self.realtime.arrays() if self.realtime is not None else {}
+        np.savez_compressed(
+            path, frame_rate=self.frame_rate, tolerance=self.tolerance,
+            trials=np.array(self.trials, dtype=TRIAL_DTYPE),
+            intervals=np.concatenate(intervals).astype(np.float32)
+            if intervals else np.zeros(0, np.float32),
+            offsets=offsets.astype(np.int64),
+            markers=np.array(self.markers, dtype=MARKER_DTYPE), **realtime)
+
+
+def flag(trials, frame_rate, max_missed=0, max_drift=None):
+    """Boolean mask of the trials whose flicker timing deviated.
+
+    A trial is flagged when it missed more than `max_missed` flips or when a
+    flip lagged its nominal time by more than `max_drift` ms (one frame by
+    default), which shifts the flicker phase of everything after it.
+    """
+    if max_drift is None:
+        max_drift = 1000.0 / frame_rate
+    return (trials['missed'] > max_missed) | (trials['drift'] > max_drift)
+
+
+def summarise(path, max_missed=0, max_drift=None):
+    with np.load(path) as log:
+        trials = log['trials']
+        frame_rate = float(log['frame_rate'])
+        markers = log['markers']
+        pauses = log['gc_pauses'] if 'gc_pauses' in log else None
+        overruns = log['overruns'] if 'overruns' in log else None
+    bad = flag(trials, frame_rate, max_missed, max_drift)
+    print('%s: %d trials at %.2f Hz, %d flagged'
+          % (path, len(trials), frame_rate, bad.sum()))
+    if pauses is not None:
+        inside = pauses[pauses['frame'] >= 0]
+        print('realtime: %d collections (max %.3f ms), %d inside a trial, %d overruns'
+              % (len(pauses), pauses['ms'].max() if len(pauses) else 0.0, len(inside),
+                 len(overruns)))
+    print('trial  frames  missed  max(ms)  mean(ms)  drift(ms)  markers')
+    for row, is_bad in zip(trials, bad):
+        codes = markers[markers['trial'] == row['trial']]
+        print('%5d  %6d  %6d  %7.2f  %8.3f  %9.2f  %s%s'
+              % (row['trial'], row['n'], row['missed'], row['max'], row['mean'],
+                 row['drift'], ' '.join('%d:%d' % (m['frame'], m['code']) for m in codes),
+                 '  <- exclude' if is_bad else ''))
+    return trials['trial'][bad]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('files', nargs='+', help='*_frames.npz written by FrameLog.save')
+    parser.add_argument('--max-missed', type=int, default=0,
+                        help='missed flips tolerated per trial')
+    parser.add_argument('--max-drift', type=float, default=None,
+                        help='largest tolerated lag of a flip in ms (default: one frame)')
+    args = parser.parse_args(argv)
+    for path in args.files:
+        summarise(path, args.max_missed, args.max_drift)
+
+
+if __name__ == '__main__':
+    main()
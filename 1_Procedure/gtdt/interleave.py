@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Constrained pseudo-random order of the Task 2 / Task 3 blocks.
+
+GTDT2and3_1.py and GTDT2and3_2.py were two hand-written orders of the
+blist_c2 / blist_c3 blocks with the whole trial loop repeated for every block.
+block_order() draws such an order at run time instead:
+
+    order = interleave.block_order({'C2': blist_c2, 'C3': blist_c3},
+                                   seed=expInfo['participant'], first='C2', parts=2)
+    order = interleave.session_part(order, part=1, parts=2)
+
+The same seed gives the same order. Part 1 also writes the order with
+save_order() and the later parts read it back with load_order(), so a part
+never runs against an order it was not drawn with: a missing part 1 file or
+one written for another participant is an error.
+"""
+import json
+import os
+import random
+
+MAX_RUN = 2  # no more than two blocks of the same task in a row
+
+
+def block_order(blocks, seed=None, first=None, max_run=MAX_RUN, attempts=1000, parts=1):
+    """Interleave the block rows of several tasks.
+
+    blocks  : dict task name -> list of block rows (e.g. importConditions('blist_c2.xlsx'))
+    seed    : seed of the order (the participant id)
+    first   : task of the first block of every session part, or None
+    max_run : maximum number of consecutive blocks of one task
+    parts   : number of sessions the order is split over (session_part)
+
+    Returns a list of block rows, each a copy with a 'task' entry added. The
+    rows of each task are shuffled, then the tasks are drawn at random,
+    weighted by the number of blocks left, under the run-length constraint.
+    """
+    rng = random.Random(seed)
+    queues = {}
+    for task in sorted(blocks):
+        rows = [dict(row, task=task) for row in blocks[task]]
+        rng.shuffle(rows)
+        queues[task] = rows
+    total = sum(len(rows) for rows in queues.values())
+    starts = set(part_start(total, part, parts) for part in range(1, parts + 1))
+
+    for attempt in range(attempts):
+        left = dict((task, list(rows)) for task, rows in queues.items())
+        order = []
+        run = 0
+        while any(left.values()):
+            allowed = [task for task in sorted(left) if left[task] and
+                       not (order and order[-1]['task'] == task and run >= max_run)]
+            if first is not None and len(order) in starts:
+                allowed = [task for task in allowed if task == first]
+            if not allowed:
+                break  # dead end, draw again
+            task = rng.choices(allowed, weights=[len(left[t]) for t in allowed])[0]
+            run = run + 1 if order and order[-1]['task'] == task else 1
+            order.append(left[task].pop(0))
+        else:
+            return order
+    raise ValueError('no block order with at most %d blocks of one task in a row'
+                     % max_run)
+
+
+def part_start(n, part, parts):
+    # index of the first of `n` blocks in session `part` (1-based) of `parts`
+    if not 1 <= part <= parts:
+        raise ValueError('part must be between 1 and %d, got %r' % (parts, part))
+    size, extra = divmod(n, parts)
+    return (part - 1) * size + min(part - 1, extra)
+
+
+def session_part(order, part, parts):
+    """Blocks of session `part` (1-based) when `order` is split over `parts` sessions."""
+    start = part_start(len(order), part, parts)
+    stop = start + len(order) // parts + (part <= len(order) % parts)
+    return order[start:stop]
+
+
+def save_order(path, order, blocks, seed=None):
+    """Write `order` as (task, row number in blocks[task]) pairs, with its seed."""
+    used = set()
+    pairs = []
+    for row in order:
+        task = row['task']
+        plain = dict((key, value) for key, value in row.items() if key != 'task')
+        n = next(n for n, other in enumerate(blocks[task])
+                 if (task, n) not in used and other == plain)
+        used.add((task, n))
+        pairs.append([task, n])
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(dict(seed=seed, order=pairs), f, indent=1)
+
+
+def load_order(path, blocks, seed=None):
+    """The order save_order() wrote for `seed`, rebuilt from the same `blocks`."""
+    if not os.path.exists(path):
+        raise ValueError('no block order in %s: run part 1 of this participant first'
+                         % path)
+    with open(path) as f:
+        saved = json.load(f)
+    if saved['seed'] != seed:
+        raise ValueError('the block order in %s was drawn for participant %r, not %r'
+                         % (path, saved['seed'], seed))
+    return [dict(blocks[task][n], task=task) for task, n in saved['order']]
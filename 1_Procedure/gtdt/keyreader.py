@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Keyboard sampled off the frame loop.
+
+The GTDT routine read the 'space' presses with press.getKeys() once per
+frame and sent the response marker from the same loop, so a press was seen,
+and marked, only on the next frame: the marker came up to one refresh late
+and went out with the flip-locked markers. A KeyReader polls one keyboard in
+its own thread every `interval` seconds while it is armed, calls on_key(key)
+from that thread as soon as a press is read (the response marker, written to
+the port right away with TriggerScheduler.send_now) and queues the press;
+the frame loop only drains the queue:
+
+    reader = keyreader.KeyReader(kb, ['space'], on_key=lambda key: send_now(2))
+    press = gtdt.add_keys(kb, ['space'], store='all', reader=reader)
+
+routine.Routine arms the reader on the flip its keyboard starts on (clock
+reset, events cleared, as before) and disarms it when the keyboard stops.
+Key times are those of the keyboard: with psychopy's psychtoolbox backend
+rt and tDown are the timestamps of the key event itself, whatever the poll
+interval; the interval only bounds the marker latency. It is 4 ms, a third
+of a frame at 85 Hz: a 1 ms poll woke the thread, took DEVICE_LOCK and the
+GIL four times as often for no better RT. Every press also gets `received`,
+the perf_counter time it was read, and `delay`, the keyboard clock time from
+the key event to that read; `lags` holds the time from reading it to the end
+of on_key. Inside a realtime.RealTime section the reader threads run on the
+other CPUs than the frame loop.
+
+All readers and the escape check of the routines take DEVICE_LOCK around
+getKeys(), since psychopy's keyboards share one event buffer per device.
+"""
+import collections
+import threading
+import time
+
+import numpy as np
+
+INTERVAL = 0.004  # seconds between two polls of an armed reader
+DEVICE_LOCK = threading.Lock()
+
+
+class KeyReader(object):
+    """Polls `kb` for `key_list` in a background thread while armed.
+
+    kb       : psychopy Keyboard
+    on_key   : called with every new press, from the reader thread
+    interval : seconds between two polls
+    presses  : number of presses read so far
+    delays   : seconds from each key event to its read (poll latency)
+    lags     : seconds from reading each press to the return of on_key
+    """
+
+    def __init__(self, kb, key_list, on_key=None, interval=INTERVAL, name=None):
+        self.kb = kb
+        self.key_list = list(key_list)
+        self.on_key = on_key
+        self.interval = interval
+        self.presses = 0
+        self.delays = []
+        self.lags = []
+        self._queue = collections.deque()
+        self._armed = threading.Event()
+        self._running = True
+        self._thread = threading.Thread(target=self._work,
+                                        name='KeyReader %s' % (name or kb.name))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def start(self):
+        # arm the reader; called on the flip the keyboard starts on
+        self.kb.clock.reset()
+        with DEVICE_LOCK:
+            self.kb.clearEvents(eventType='keyboard')
+        self._queue.clear()
+        self._armed.set()
+
+    def stop(self):
+        self._armed.clear()
+
+    def drain(self):
+        """Presses read since the last drain(), oldest first."""
+        keys = []
+        while self._queue:
+            keys.append(self._queue.popleft())
+        return keys
+
+    def close(self):
+        self._running = False
+        self._armed.set()
+        self._thread.join()
+
+    def _work(self):
+        while self._running:
+            if not self._armed.wait(0.1):
+                continue
+            with DEVICE_LOCK:
+                keys = self.kb.getKeys(keyList=self.key_list, waitRelease=False)
+                now = self.kb.clock.getTime()
+            for key in keys:
+                received = time.perf_counter()
+                key.received = received
+                key.delay = now - key.rt
+                self.delays.append(key.delay)
+                self.presses += 1
+                if self.on_key is not None:
+                    self.on_key(key)
+                self.lags.append(time.perf_counter() - received)
+                self._queue.append(key)
+            time.sleep(self.interval)
+
+    def describe(self):
+        if not self.lags:
+            return '%s: no presses' % self._thread.name
+        ms = np.array(self.lags) * 1000
+        delay = np.array(self.delays) * 1000
+        return ('%s: %d presses, press to read mean %.3f  max %.3f ms, '
+                'read to marker mean %.3f  max %.3f ms (poll every %.1f ms)'
+                % (self._thread.name, self.presses, delay.mean(), delay.max(),
+                   ms.mean(), ms.max(), self.interval * 1000))
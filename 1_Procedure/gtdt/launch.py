@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Fast-start launcher for the GTDT tasks.
+
+The Builder scripts import sound, plugins, layout, iohub and the rest of
+psychopy before the dialog opens, and each instruction image is decoded the
+first time it is drawn, which stalls the first frame of the routine. This
+launcher imports only the psychopy modules the chosen tasks use (the
+parallel port only for the formal tasks), shows a loading screen while all
+instruction / rest / rep_practise images and texts are uploaded
+(tasks.Session.prewarm) and reports the time to the first frame of each task.
+
+Every task script also opens its own full-screen window and measures the
+refresh rate again, which takes seconds and does not always give the same
+rate. Several tasks given together run one after the other in one window,
+with one participant dialog and one refresh measurement; each task still
+writes its own data files:
+
+    cd 1_Procedure
+    python -m gtdt.launch                  # P1 C1 P2 C2 P3 C3 in one window
+    python -m gtdt.launch C1
+    python -m gtdt.launch C2C3 --part 2
+    python -m gtdt.launch P1 --root-dir "1_GTDT(SJTU)/no_shuffled"
+    python -m gtdt.launch --shader         # GTDT stimulus drawn by shader.GTDTStim
+
+The data files are the ones the task scripts write, in <root-dir>/data.
+"""
+import time
+
+START = time.perf_counter()  # before any psychopy import
+
+import argparse
+import os
+import random
+
+from gtdt import conditions, datalog, ports, refresh, tasks
+
+# expName and parallel port address of the script each task replaces
+# (GTDT_TRIGGER selects another trigger backend, see ports.py)
+SCRIPTS = dict(C1=('GTDT1', '0x5FB8'), C2=('GTDT2', '0x5FB8'), C3=('GTDT_C3', '0x5FB8'),
+               P1=('GTDT_P1', None), P2=('GTDT_P2', None), P3=('GTDT_P3', None),
+               C2C3=('GTDT2and3_%d', '0x3EFC'))
+SEQUENCE = ('P1', 'C1', 'P2', 'C2', 'P3', 'C3')  # a whole participant session
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                        '1_GTDT(SJTU)', 'shuffled')
+
+
+def timings(since, **steps):
+    # seconds since `since` of every step, as 'name=1.234s'
+    return ', '.join('%s=%.3fs' % (name, t - since) for name, t in
+                     sorted(steps.items(), key=lambda step: step[1]))
+
+
+def open_window(visual, fullscr=True, units='height'):
+    """The window of the whole session and its refresh rate, measured once (or cached)."""
+    win = visual.Window(size=(1024, 768), fullscr=fullscr, screen=0, winType='pyglet',
+                        monitor='testMonitor', color=[0, 0, 0], colorSpace='rgb',
+                        useFBO=True, units=units)
+    win.mouseVisible = False
+    frameRate = refresh.frame_rate(win, monitor='testMonitor')
+    frameDur = 1.0 / round(frameRate)
+    return win, frameRate, frameDur
+
+
+def run_task(name, win, frameDur, expInfo, root_dir, quit_keyboard, part=1, parts=2,
+             since=None, shader=False, condition_cache=None):
+    """Run one task in `win` and write its data files.
+
+    since  : time the dead time before the first frame is counted from
+             (the end of the previous task), START by default
+    shader : draw the GTDT stimulus on the GPU (tasks.Session(shader=True))
+    condition_cache : conditions.ConditionCache shared by the tasks of the session
+    """
+    from psychopy import data, logging, visual
+
+    since = START if since is None else since
+    cfg = tasks.TASKS[name]
+    expName, address = SCRIPTS[name]
+    if '%' in expName:
+        expName = expName % part
+    expInfo = dict(expInfo, expName=expName)
+    filename = root_dir + u'data/%s_%s' % (expInfo['participant'], expName)
+    thisExp = data.ExperimentHandler(name=expName, version='', extraInfo=expInfo,
+                                     runtimeInfo=None, originPath=__file__,
+                                     savePickle=True, saveWideText=True,
+                                     dataFileName=filename)
+    logFile = logging.LogFile(filename + '.log', level=logging.EXP)
+
+    # stimuli take the units of the window when they are created
+    win.units = cfg['units']
+    loading = visual.TextStim(win, text='Loading...', height=cfg['fixation_height'],
+                              color='white')
+    loading.draw()
+    win.flip()
+    port = None if address is None else ports.open_port(address)
+    log = datalog.TrialLog(filename + '_long.csv')
+    session = tasks.Session(cfg, win, thisExp, root_dir, port=port,
+                            frame_rate=1.0 / frameDur, quit_keyboard=quit_keyboard,
+                            log=log, shader=shader, condition_cache=condition_cache,
+                            stim_log=filename + '_stim.dat')
+    if condition_cache is not None:
+        condition_cache.save()  # the next launch reads the compiled tables
+    session.prewarm()
+    prewarmed = time.perf_counter()
+
+    def first_frame():
+        # runs on the flip of the first instruction frame
+        now = time.perf_counter()
+        expInfo['timeToFirstFrame'] = round(now - since, 3)
+        steps = timings(since, prewarm=prewarmed, first_frame=now)
+        logging.exp('time to first frame %.3fs (%s)' % (expInfo['timeToFirstFrame'], steps))
+        print('%s: time to first frame %.3fs (%s)'
+              % (expName, expInfo['timeToFirstFrame'], steps))
+
+    win.callOnFlip(first_frame)
+    if cfg.get('interleave'):
+        # written by part 1, read by the later parts of the same participant
+        order_file = root_dir + u'data/%s_%s_order.json' % (expInfo['participant'],
+                                                           cfg['name'])
+        session.run(part=part, parts=parts, seed=expInfo['participant'],
+                    order_file=order_file)
+    else:
+        session.run()
+
+    # --- End task ---
+    win.flip()
+    session.frames.save(filename + '_frames.npz')
+    log.close()
+    thisExp.saveAsWideText(filename + '.csv', delim='auto')
+    thisExp.saveAsPickle(filename)
+    logging.flush()
+    logging.root.removeTarget(logFile)
+    if port is not None:
+        logging.exp('trigger ' + port.describe())
+    if session.rt is not None:
+        logging.exp(session.rt.describe())
+    for reader in session.readers:
+        logging.exp(reader.describe())
+    session.close()
+    thisExp.abort()  # or data files will save again on exit
+
+
+def run(names, root_dir=ROOT_DIR, part=1, parts=2, fullscr=True, shader=False):
+    from psychopy import core, data, gui, logging, visual
+    from psychopy.hardware import keyboard
+    imported = time.perf_counter()
+
+    title = SCRIPTS[names[0]][0].replace('%d', str(part)) if len(names) == 1 else 'GTDT'
+    root_dir = os.path.abspath(root_dir) + os.sep
+    os.chdir(root_dir)  # conditions files name each other relative to the script folder
+    expInfo = {'participant': '%06d' % random.randint(0, 999999),
+               'age': '', 'gender': '', 'session': '001'}
+    dlg = gui.DlgFromDict(dictionary=expInfo, sortKeys=False, title=title)
+    if dlg.OK == False:
+        core.quit()  # user pressed cancel
+    dialog = time.perf_counter()
+    expInfo['date'] = data.getDateStr()
+    expInfo['shader'] = int(shader)  # which renderer drew the GTDT stimulus
+    logging.console.setLevel(logging.WARNING)
+
+    win, expInfo['frameRate'], frameDur = open_window(visual, fullscr,
+                                                      tasks.TASKS[names[0]]['units'])
+    window = time.perf_counter()
+    print('imports %.3fs, window and refresh measurement %.3fs (%.2f Hz)'
+          % (imported - START, window - dialog, 1.0 / frameDur))
+    defaultKeyboard = keyboard.Keyboard()
+    # every xlsx is parsed once per session, or taken from <root-dir>/conditions.pkl
+    condition_cache = conditions.ConditionCache(data.importConditions,
+                                                store=root_dir + conditions.STORE)
+    # the dialog does not count as start-up time
+    since = START + (dialog - imported)
+    for name in names:
+        run_task(name, win, frameDur, expInfo, root_dir, defaultKeyboard,
+                 part=part, parts=parts, since=since, shader=shader,
+                 condition_cache=condition_cache)
+        since = time.perf_counter()
+    win.close()
+    core.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('tasks', nargs='*', default=list(SEQUENCE),
+                        help='tasks run in turn in one window, out of %s (default: %s)'
+                             % (', '.join(sorted(tasks.TASKS)), ' '.join(SEQUENCE)))
+    parser.add_argument('--root-dir', default=ROOT_DIR,
+                        help='folder with the images and xlsx files of the tasks')
+    parser.add_argument('--part', type=int, default=1,
+                        help='session part of the interleaved C2C3 task')
+    parser.add_argument('--window', action='store_true', help='not full screen')
+    parser.add_argument('--shader', action='store_true',
+                        help='draw the GTDT stimulus with one GPU shader (gtdt/shader.py)')
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.tasks) - set(tasks.TASKS))
+    if unknown:
+        parser.error('unknown task(s): %s' % ', '.join(unknown))
+    run(args.tasks, args.root_dir, part=args.part, fullscr=not args.window,
+        shader=args.shader)
+
+
+if __name__ == '__main__':
+    main()
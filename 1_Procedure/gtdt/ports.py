@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Trigger output backends.
+
+The scripts wrote their markers to parallel.ParallelPort(address='0x5FB8')
+(or '0x3EFC'), one ParallelPort object per marker type on the same address,
+so they only ran on a PC with that LPT card. open_port() returns one shared
+backend per physical port instead, chosen by a spec string:
+
+    0x3EFC, parallel:0x3EFC        parallel port at that address (psychopy.parallel)
+    serial:COM3, serial:/dev/ttyUSB0@115200
+                                   one byte per code on a serial trigger box (pyserial)
+    udp, udp:192.168.1.5:5005      one datagram per code (default 127.0.0.1:5005)
+    file, file:markers.csv         no hardware: codes are recorded with their time
+                                   and written to the csv at exit
+
+Every backend has the setData(code) of a ParallelPort, so triggers.attach()
+and the scripts use it unchanged, and times each write (`times`, `latencies`).
+The environment variable GTDT_TRIGGER overrides the spec of every script,
+so a site without an LPT card, or a development machine, runs the same code:
+
+    GTDT_TRIGGER=udp python GTDT_C1_coder.py
+    cd 1_Procedure
+    python -m gtdt.ports file --writes 1000    # write latency of a backend
+
+The latencies of all open backends are printed when the script exits.
+"""
+import argparse
+import atexit
+import os
+import socket
+import time
+
+import numpy as np
+
+ENV = 'GTDT_TRIGGER'
+UDP_PORT = 5005
+SERIAL_BAUDRATE = 115200
+
+_open = {}  # spec -> backend, one object per physical port
+
+
+class Backend(object):
+    """A trigger output with the setData(code) of psychopy's ParallelPort.
+
+    times     : perf_counter time at the start of every write
+    latencies : duration (s) of every write
+    """
+
+    kind = 'none'
+
+    def __init__(self, target=''):
+        self.target = target
+        self.times = []
+        self.latencies = []
+
+    def setData(self, code):
+        start = time.perf_counter()
+        self._write(int(code))
+        self.latencies.append(time.perf_counter() - start)
+        self.times.append(start)
+
+    def _write(self, code):
+        pass
+
+    def close(self):
+        pass
+
+    @property
+    def name(self):
+        return '%s %s' % (self.kind, self.target) if self.target else self.kind
+
+    def describe(self):
+        name = self.name
+        if not self.latencies:
+            return '%s: no writes' % name
+        ms = np.array(self.latencies) * 1000
+        return ('%s: %d writes, latency mean %.3f  p99 %.3f  max %.3f ms'
+                % (name, len(ms), ms.mean(), np.percentile(ms, 99), ms.max()))
+
+
+class ParallelBackend(Backend):
+    kind = 'parallel'
+
+    def __init__(self, address=None):
+        from psychopy import parallel
+
+        Backend.__init__(self, address or '')
+        self.port = parallel.ParallelPort(address=address)
+
+    def _write(self, code):
+        self.port.setData(code)
+
+
+class SerialBackend(Backend):
+    kind = 'serial'
+
+    def __init__(self, device, baudrate=SERIAL_BAUDRATE):
+        import serial
+
+        Backend.__init__(self, '%s@%d' % (device, baudrate))
+        self.port = serial.Serial(device, baudrate=baudrate, timeout=0)
+
+    def _write(self, code):
+        self.port.write(bytes([code]))
+
+    def close(self):
+        self.port.close()
+
+
+class UDPBackend(Backend):
+    kind = 'udp'
+
+    def __init__(self, host='127.0.0.1', port=UDP_PORT):
+        Backend.__init__(self, '%s:%d' % (host, port))
+        self.address = (host, port)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def _write(self, code):
+        self.socket.sendto(bytes([code]), self.address)
+
+    def close(self):
+        self.socket.close()
+
+
+class FileBackend(Backend):
+    """Records (perf_counter time, code) of every write; no hardware.
+
+    path : csv written on close(), or None to keep the records in memory only
+    """
+
+    kind = 'file'
+
+    def __init__(self, path=None):
+        Backend.__init__(self, path or '')
+        self.path = path
+        self.records = []
+
+    def _write(self, code):
+        self.records.append((time.perf_counter(), code))
+
+    @property
+    def codes(self):
+        return [code for _, code in self.records]
+
+    def close(self):
+        if self.path is None:
+            return
+        with open(self.path, 'w') as f:
+            f.write('time,code\n')
+            f.writelines('%.6f,%d\n' % record for record in self.records)
+
+
+def parse(spec):
+    """Backend of a spec string (see the module docstring), not yet shared."""
+    kind, _, target = spec.partition(':')
+    if kind == 'parallel' or kind.lower().startswith('0x'):
+        return ParallelBackend((target or None) if kind == 'parallel' else kind)
+    if kind == 'serial':
+        device, _, baudrate = target.partition('@')
+        return SerialBackend(device, int(baudrate or SERIAL_BAUDRATE))
+    if kind == 'udp':
+        host, _, port = target.rpartition(':') if ':' in target else (target, '', '')
+        return UDPBackend(host or '127.0.0.1', int(port or UDP_PORT))
+    if kind == 'file':
+        return FileBackend(target or None)
+    raise ValueError('unknown trigger backend %r (parallel, serial, udp or file)' % spec)
+
+
+def open_port(spec):
+    """The shared backend for `spec`, or for $GTDT_TRIGGER when that is set.
+
+    Every marker of a script goes to the same physical port, so all calls
+    resolving to one spec get the same object.
+    """
+    spec = os.environ.get(ENV) or spec
+    if spec not in _open:
+        if not _open:
+            atexit.register(close_all)
+        _open[spec] = parse(spec)
+    return _open[spec]
+
+
+def close_all(logger=print):
+    # print the latency of every backend opened and close them
+    for spec, backend in sorted(_open.items()):
+        logger('trigger ' + backend.describe())
+        backend.close()
+    _open.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('spec', help='backend spec, e.g. 0x3EFC, serial:COM3, udp, file')
+    parser.add_argument('--writes', type=int, default=1000,
+                        help='codes written, every other one a 0 as the scripts do')
+    parser.add_argument('--interval', type=float, default=0.0,
+                        help='seconds between writes')
+    args = parser.parse_args(argv)
+    backend = parse(args.spec)
+    for n in range(args.writes):
+        backend.setData(0 if n % 2 == 0 else 1 + n // 2 % 255)
+        if args.interval:
+            time.sleep(args.interval)
+    backend.close()
+    print(backend.describe())
+
+
+if __name__ == '__main__':
+    main()
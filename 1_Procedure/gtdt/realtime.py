@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Garbage collection and scheduling control around the trial loop.
+
+Python's cyclic garbage collector runs whenever enough objects have been
+allocated, i.e. at some frame of some trial, and the OS may preempt the
+presentation process for another one at any time; either shows up as a
+dropped flip in the middle of the flicker. While a RealTime section is
+active
+
+    - everything allocated so far is frozen (gc.freeze) and automatic
+      collection is off; collect() runs it explicitly between two trials.
+      The section unfreezes when it ends, so what it froze can be collected
+    - the process runs at raised priority (Linux: nice -10 or as far as
+      allowed; elsewhere psychopy.core.rush) and, on Linux, the thread
+      running the trials is pinned to one CPU; the other threads (key
+      readers, log writer, refresh and stimulus log helpers) are moved to
+      the remaining CPUs, so their work never competes with the frame loop
+    - every collection is timed, and end_trial() flags the flips that came
+      late (frames.TOLERANCE), both with the trial and frame they fell on
+
+The pauses and overruns are diagnostics, not task data: they stay out of
+the trial log and go into the frames .npz of the session (arrays()).
+tasks.Session runs its trial loops (fixation and trials) in a section:
+
+    rt = realtime.RealTime()
+    with rt:
+        for thisTrial in trials:
+            ...                                  # rt.frame = frameN per frame
+            rt.end_trial(gtdt.flipTimes)         # overruns, then collect()
+    print(rt.describe())
+
+Raising the priority or pinning may need privileges; what could not be done
+is listed in `denied` and the section runs without it.
+"""
+import gc
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from gtdt import frames
+
+NICE = -10  # priority asked for on Linux
+COLLECT_GENERATION = 1  # between trials; the full collection runs when a section ends
+
+# frame -1: a collection between two trials, counted with the trial before it
+PAUSE_DTYPE = np.dtype([('trial', np.int32), ('frame', np.int32), ('generation', np.int32),
+                        ('ms', np.float32), ('collected', np.int64)])
+OVERRUN_DTYPE = np.dtype([('trial', np.int32), ('frame', np.int32), ('ms', np.float32)])
+
+
+def default_cpu():
+    # the last CPU the process may run on, away from the interrupts CPU 0 takes
+    if not hasattr(os, 'sched_getaffinity'):
+        return None
+    return max(os.sched_getaffinity(0))
+
+
+class RealTime(object):
+    """GC freeze, priority and CPU pinning while entered (see the module docstring).
+
+    frame_rate : refresh rate the flips are checked against
+    priority   : raise the process priority in a section
+    pin        : pin the thread running the trials to one CPU in a section (Linux)
+    cpu        : the CPU to pin to, default_cpu() if None
+    pauses     : (trial, frame, generation, ms, collected) of every collection
+    overruns   : (trial, frame, interval ms) of every late flip
+    denied     : what the OS did not allow
+    """
+
+    def __init__(self, frame_rate=60.0, priority=True, pin=True, cpu=None,
+                 tolerance=frames.TOLERANCE):
+        self.frame_rate = float(frame_rate)
+        self.priority = priority
+        self.pin = pin
+        self.cpu = cpu
+        self.tolerance = tolerance
+        self.trial = 0
+        self.frame = None  # frame of the running trial, None between trials
+        self.pauses = []
+        self.overruns = []
+        self.denied = []
+        self._depth = 0
+        self._gcWasEnabled = True
+        self._restore = []
+        self._pauseStart = None
+        self._pauseTrial = None  # trial a collection is counted with, if not self.trial
+        self._render = None  # native id of the pinned thread
+        self._others = set()  # CPUs of the other threads while pinned
+        self._moved = {}  # native id -> affinity before the section, of the other threads
+
+    # --- section ---
+    def __enter__(self):
+        self._depth += 1
+        if self._depth == 1:
+            self._gcWasEnabled = gc.isenabled()
+            gc.callbacks.append(self._on_gc)
+            gc.collect()
+            gc.freeze()  # what exists now is never scanned again
+            gc.disable()
+            if self.priority:
+                self._raise_priority()
+            cpu = self.cpu if self.cpu is not None else default_cpu()
+            if self.pin and cpu is not None:
+                self._pin(cpu)
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0:
+            for restore in reversed(self._restore):
+                restore()
+            self._restore = []
+            gc.unfreeze()  # the next section freezes what is alive then
+            if self._gcWasEnabled:
+                gc.enable()
+            self.collect(2, trial=self.trial - 1)  # after the last trial of the section
+            gc.callbacks.remove(self._on_gc)
+        return False
+
+    def _raise_priority(self):
+        if sys.platform.startswith('linux'):
+            old = os.getpriority(os.PRIO_PROCESS, 0)
+            if old <= NICE:
+                return  # already there
+            for nice in range(NICE, old):
+                try:
+                    os.setpriority(os.PRIO_PROCESS, 0, nice)
+                except OSError:
+                    continue
+                self._restore.append(lambda: os.setpriority(os.PRIO_PROCESS, 0, old))
+                if nice != NICE:
+                    self.denied.append('priority %d (got %d)' % (NICE, nice))
+                return
+            self.denied.append('priority %d' % NICE)
+            return
+        try:
+            from psychopy import core
+        except ImportError:
+            self.denied.append('priority (no psychopy)')
+            return
+        if core.rush(True) is False:
+            self.denied.append('priority (core.rush)')
+        else:
+            self._restore.append(lambda: core.rush(False))
+
+    def _pin(self, cpu):
+        if not hasattr(os, 'sched_setaffinity'):
+            return  # Linux only
+        # on Linux the affinity of pid 0 is that of the calling thread, the one
+        # running the trials
+        old = os.sched_getaffinity(0)
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError:
+            self.denied.append('affinity cpu %d' % cpu)
+            return
+        self._restore.append(lambda: os.sched_setaffinity(0, old))
+        self._render = threading.get_native_id()
+        self._others = set(old) - {cpu}
+        self._moved = {}
+        self.move_helpers()
+        self._restore.append(lambda: self._unmove(old, cpu))
+
+    def move_helpers(self):
+        """Move the other threads of the process off the pinned CPU.
+
+        A thread started from the pinned one inherits its CPU, so end_trial()
+        calls this again between the trials.
+        """
+        if self._render is None or not self._others:
+            return  # not pinned, or no other CPU to move to
+        try:
+            threads = [int(tid) for tid in os.listdir('/proc/self/task')]
+        except OSError:
+            return
+        for tid in threads:
+            if tid == self._render or tid in self._moved:
+                continue
+            try:
+                before = os.sched_getaffinity(tid)
+                os.sched_setaffinity(tid, self._others)
+            except OSError:
+                continue  # ended meanwhile
+            self._moved[tid] = before
+
+    def _unmove(self, old, cpu):
+        # the threads started in the section had only the pinned CPU: they get `old`
+        for tid, before in self._moved.items():
+            try:
+                os.sched_setaffinity(tid, old if before == {cpu} else before)
+            except OSError:
+                pass  # the thread has ended
+        self._moved = {}
+        self._render = None
+
+    # --- collections ---
+    def _on_gc(self, phase, info):
+        # gc.callbacks: time every collection, explicit or not
+        if phase == 'start':
+            self._pauseStart = time.perf_counter()
+            return
+        if self._pauseStart is None:
+            return
+        ms = (time.perf_counter() - self._pauseStart) * 1000
+        self._pauseStart = None
+        trial = self.trial if self._pauseTrial is None else self._pauseTrial
+        self.pauses.append((trial, self.frame, info['generation'], ms, info['collected']))
+
+    def collect(self, generation=COLLECT_GENERATION, trial=None):
+        """Collect garbage now, outside the frames of a trial (counted with `trial`)."""
+        frame, self.frame = self.frame, None
+        self._pauseTrial = trial
+        try:
+            gc.collect(generation)
+        finally:
+            self.frame = frame
+            self._pauseTrial = None
+
+    def end_trial(self, flip_times):
+        """Record the late flips of the trial just run, then collect between trials.
+
+        An interval longer than 1 + tolerance frames is an overrun of the
+        frame it ends (frame n: the interval from flip n - 1 to flip n).
+        """
+        intervals = np.diff(np.asarray(flip_times, dtype=float))
+        late = np.flatnonzero(intervals > (1 + self.tolerance) / self.frame_rate)
+        for n in late:
+            ms = intervals[n] * 1000
+            self.overruns.append((self.trial, int(n) + 1, ms))
+        self.frame = None
+        self.collect()
+        self.move_helpers()
+        self.trial += 1
+
+    def arrays(self):
+        """The pauses and overruns as structured arrays, for frames.FrameLog.save()."""
+        pauses = [(trial, -1 if frame is None else frame, generation, ms, collected)
+                  for trial, frame, generation, ms, collected in self.pauses]
+        return dict(gc_pauses=np.array(pauses, dtype=PAUSE_DTYPE),
+                    overruns=np.array(self.overruns, dtype=OVERRUN_DTYPE))
+
+    def describe(self):
+        ms = np.array([pause[3] for pause in self.pauses])
+        text = ('realtime: %d trials, %d collections (max %.3f ms), %d overruns'
+                % (self.trial, len(ms), ms.max() if len(ms) else 0.0, len(self.overruns)))
+        during = [pause for pause in self.pauses if pause[1] is not None]
+        if during:
+            text += ', %d collections inside a trial' % len(during)
+        if self.denied:
+            text += '; not allowed: ' + ', '.join(self.denied)
+        return text
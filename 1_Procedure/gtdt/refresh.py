@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Per-monitor refresh-rate calibration cache.
+
+The scripts did
+
+    expInfo['frameRate'] = win.getActualFrameRate()
+    frameDur = 1.0 / round(expInfo['frameRate']) ... or 1.0 / 60.0 if it returned None
+
+at every launch, which costs a few seconds and, when the measurement fails,
+silently runs an 85 Hz CRT with 60 Hz timelines and the wrong flicker. The
+rate of each monitor/resolution is now measured once and kept, with its
+jitter and the date, in a small JSON file (~/.gtdt/refresh.json):
+
+    expInfo['frameRate'] = refresh.frame_rate(win, monitor='testMonitor')
+    frameDur = 1.0 / round(expInfo['frameRate'])
+
+A cached rate is checked against the first CHECK_FRAMES flips and used at
+once if they agree. A stale entry (older than MAX_AGE days) is still used
+but re-measured from the flips of the first screens of the session, without
+extra waiting, and the cache is updated for the next launch. When the flips
+disagree with the entry, the rate of those first flips is used instead and
+re-measured the same way. Only without any entry is the rate measured
+before the script continues; a failed measurement is an error, never a guess.
+
+    cd 1_Procedure
+    python -m gtdt.refresh            # list the cached monitors
+"""
+import argparse
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.gtdt', 'refresh.json')
+MAX_AGE = 30  # days before an entry is re-measured
+CHECK_FRAMES = 12  # flips compared with the cached rate at start-up
+MEASURE_FRAMES = 120  # flips of a full measurement
+TOLERANCE = 0.02  # relative difference of rates taken as a different refresh
+
+
+def monitor_key(win, monitor='testMonitor'):
+    # 'testMonitor 1920x1080 screen0'
+    width, height = (int(n) for n in win.size)
+    return '%s %dx%d screen%d' % (monitor, width, height, getattr(win, 'screen', 0))
+
+
+def rate_of(flip_times):
+    """Refresh rate (Hz) and jitter (ms) of a run of consecutive flips.
+
+    The rate comes from the median interval, so a dropped frame does not
+    pull it down; the jitter is the SD of the intervals within half a frame
+    of the median.
+    """
+    intervals = np.diff(np.asarray(flip_times, dtype=float))
+    if len(intervals) < 2:
+        return None, None
+    median = np.median(intervals)
+    if not median > 0:
+        return None, None
+    regular = intervals[np.abs(intervals - median) < 0.5 * median]
+    return 1.0 / median, float(np.std(regular) * 1000)
+
+
+def measure(win, n_frames=MEASURE_FRAMES, warmup=10):
+    """Flip `n_frames` times and return (rate, jitter) of the flips."""
+    for _ in range(warmup):
+        win.flip()
+    flip_times = [win.flip() for _ in range(n_frames + 1)]
+    if None in flip_times:
+        # flip() returns None when the window does not wait for the refresh
+        raise RuntimeError('the window gives no flip times; is waitBlanking off?')
+    return rate_of(flip_times)
+
+
+def agrees(rate, reference, tolerance=TOLERANCE):
+    return rate is not None and abs(rate - reference) <= tolerance * reference
+
+
+class Cache(object):
+    """Measured refresh rates by monitor key, stored as JSON."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path) as f:
+                self.entries = json.load(f)
+        except (IOError, OSError, ValueError):
+            self.entries = {}
+
+    def get(self, key, max_age=MAX_AGE):
+        """(entry, stale) for `key`; entry is None when nothing is cached."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, True
+        stale = time.time() - entry['time'] > max_age * 86400
+        return entry, stale
+
+    def put(self, key, rate, jitter, frames):
+        with self._lock:
+            self.entries[key] = dict(rate=round(rate, 4), jitter=round(jitter, 4),
+                                     frames=frames, time=time.time(),
+                                     date=time.strftime('%Y-%m-%d %H:%M'))
+            self._write()
+
+    def save(self):
+        with self._lock:
+            self._write()
+
+    def _write(self):
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+        # write to a temporary file first, a crash never leaves half a cache
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+class FlipRecorder(object):
+    """Re-measure the refresh from the flips the session makes anyway.
+
+    Hooks win.flip like triggers.TriggerScheduler, keeps the first `n_frames`
+    flip times, then computes the rate on a background thread and stores it.
+    """
+
+    def __init__(self, win, cache, key, expected, n_frames=MEASURE_FRAMES, logger=None):
+        self.cache = cache
+        self.key = key
+        self.expected = expected
+        self.n_frames = n_frames
+        self.logger = logger
+        self.flip_times = []
+        self.rate = None
+        self.jitter = None
+        flip = win.flip
+
+        def flip_and_record(*args, **kwargs):
+            flipTime = flip(*args, **kwargs)
+            if len(self.flip_times) <= self.n_frames:
+                self.flip_times.append(flipTime)
+                if len(self.flip_times) > self.n_frames:
+                    thread = threading.Thread(target=self._store, name='refresh')
+                    thread.daemon = True
+                    thread.start()
+            return flipTime
+
+        win.flip = flip_and_record
+
+    def _store(self):
+        # the screens of a session may wait for key presses between routines,
+        # which only shows as long intervals; rate_of() takes the median
+        self.rate, self.jitter = rate_of(self.flip_times)
+        if self.rate is None:
+            return
+        self.cache.put(self.key, self.rate, self.jitter, self.n_frames)
+        if self.logger is not None and not agrees(self.rate, self.expected):
+            self.logger('refresh: %s now runs at %.2f Hz, this session used %.2f Hz'
+                        % (self.key, self.rate, self.expected))
+
+
+def frame_rate(win, monitor='testMonitor', cache=None, max_age=MAX_AGE,
+               check_frames=CHECK_FRAMES, logger=None):
+    """Refresh rate (Hz) of `win`, from the cache when it can be trusted.
+
+    logger : function receiving warning messages (psychopy logging.warning by default)
+    """
+    if logger is None:
+        from psychopy import logging
+        logger = logging.warning
+    cache = Cache() if cache is None else cache
+    key = monitor_key(win, monitor)
+    entry, stale = cache.get(key, max_age)
+    if entry is not None:
+        rate, _ = measure(win, check_frames, warmup=2)
+        if agrees(rate, entry['rate']):
+            if stale:
+                win._gtdtRefresh = FlipRecorder(win, cache, key, entry['rate'],
+                                                logger=logger)
+            return entry['rate']
+        if rate is not None:
+            # the first flips are the better guess; the session's own flips re-measure
+            logger('refresh: first flips run at %.2f Hz, cached %.2f Hz for %s; using '
+                   '%.2f Hz and re-measuring in the background' % (rate, entry['rate'], key,
+                                                                   rate))
+            win._gtdtRefresh = FlipRecorder(win, cache, key, rate, logger=logger)
+            return rate
+        logger('refresh: no flip times in the first flips, cached %.2f Hz for %s; '
+               're-measuring' % (entry['rate'], key))
+    rate, jitter = measure(win)
+    if rate is None:
+        raise RuntimeError('could not measure the refresh rate of ' + key)
+    cache.put(key, rate, jitter, MEASURE_FRAMES)
+    return cache.entries[key]['rate']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--cache', default=CACHE_PATH)
+    parser.add_argument('--forget', nargs='*', metavar='KEY',
+                        help='drop these monitors (all if no key is given)')
+    args = parser.parse_args(argv)
+    cache = Cache(args.cache)
+    if args.forget is not None:
+        for key in args.forget or list(cache.entries):
+            cache.entries.pop(key, None)
+        cache.save()
+    print('%s: %d monitor(s)' % (args.cache, len(cache.entries)))
+    for key, entry in sorted(cache.entries.items()):
+        print('%-40s %8.3f Hz  jitter %6.3f ms  %s' % (key, entry['rate'], entry['jitter'],
+                                                      entry['date']))
+
+
+if __name__ == '__main__':
+    main()
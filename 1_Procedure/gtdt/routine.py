@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Table-driven routine engine.
+
+A Builder routine checks, on every frame and for every component, whether it
+is starting, active or stopping by comparing times against the routine clock.
+A Routine holds its components in a table with start/stop frames computed
+once, advances the whole table with one vectorised comparison per frame and
+only touches the components whose state actually changed on that frame:
+
+    gtdt = routine.Routine(win, 'GTDT', exp, frame_rate=85.0)
+    gtdt.add(bg)
+    gtdt.add(annular, on_start=lambda comp: marker(1))
+    gtdt.add_keys(press, ['space'], store='all')
+    gtdt.retime(stop=asec)
+    gtdt.run(each_frame=update)
+
+Start/stop bookkeeping (status, frameNStart, tStartRefresh, `name.started`
+timestamps, autoDraw, keyboard clock reset) follows what the Builder scripts
+do, so the data files keep the same columns.
+"""
+import numpy as np
+
+from gtdt import keyreader
+
+# same values as psychopy.constants
+NOT_STARTED = 0
+STARTED = 1
+FINISHED = -1
+
+OPEN = np.iinfo(np.int64).max  # stop frame of a component without a duration
+
+
+def to_frames(seconds, frame_rate):
+    # first frame at or after `seconds`; None stays open-ended
+    if seconds is None:
+        return OPEN
+    return int(round(float(seconds) * frame_rate))
+
+
+class Keys(object):
+    """Keyboard component of a routine.
+
+    keys / rt follow the Builder conventions: the last key (store='last') or
+    the list of all keys (store='all'), None when nothing was pressed.
+    With a keyreader.KeyReader the presses are read in its thread (which
+    also runs its own on_key) and poll() only drains them.
+    """
+
+    def __init__(self, kb, key_list, end_routine=True, store='last', on_key=None,
+                 reader=None):
+        self.kb = kb
+        self.key_list = list(key_list)
+        self.end_routine = end_routine
+        self.store = store
+        self.on_key = on_key
+        self.reader = reader
+        self.pressed = []
+
+    def reset(self):
+        self.pressed = []
+        self.kb.keys = []
+        self.kb.rt = []
+
+    def poll(self, routine):
+        if self.reader is not None:
+            theseKeys = self.reader.drain()
+        else:
+            with keyreader.DEVICE_LOCK:
+                theseKeys = self.kb.getKeys(keyList=self.key_list, waitRelease=False)
+        if not theseKeys:
+            return
+        self.pressed.extend(theseKeys)
+        if self.store == 'all':
+            self.kb.keys = [key.name for key in self.pressed]
+            self.kb.rt = [key.rt for key in self.pressed]
+        else:
+            self.kb.keys = self.pressed[-1].name
+            self.kb.rt = self.pressed[-1].rt
+        if self.on_key is not None:
+            for key in theseKeys:
+                self.on_key(key)
+        if self.end_routine:
+            routine.end()
+
+    def save(self, handler, name):
+        # the 'check responses' block of a Builder routine
+        if self.kb.keys in ['', [], None]:  # No response was made
+            self.kb.keys = None
+        handler.addData(name + '.keys', self.kb.keys)
+        if self.kb.keys is not None:  # we had a response
+            handler.addData(name + '.rt', self.kb.rt)
+
+
+class Routine(object):
+    """Components of one routine with their start/stop frames.
+
+    win          : psychopy Window
+    name         : routine name, for the log
+    exp          : ExperimentHandler receiving the `name.started/stopped` stamps
+    frame_rate   : refresh rate (Hz) used to turn seconds into frames
+    quit_keyboard: keyboard checked for 'escape' on every frame
+    quit         : called when escape is pressed (psychopy.core.quit by default)
+    """
+
+    def __init__(self, win, name, exp=None, frame_rate=60.0, quit_keyboard=None,
+                 quit=None):
+        self.win = win
+        self.name = name
+        self.exp = exp
+        self.frame_rate = float(frame_rate)
+        self.quit_keyboard = quit_keyboard
+        self.quit = quit
+        self.components = []
+        self.names = []
+        self.draw = []
+        self.on_start = []
+        self.on_stop = []
+        self.keys = {}  # row -> Keys
+        self.start = np.zeros(0, dtype=np.int64)
+        self.stop = np.zeros(0, dtype=np.int64)
+        self.frameN = -1
+        self.flipTimes = []  # time of every flip of the last run
+        self.forceEnded = False
+        self._ended = False
+
+    def add(self, component, start=0.0, stop=None, draw=True, on_start=None,
+            on_stop=None, name=None):
+        """Add a component shown from `start` to `stop` seconds (None = until the routine ends)."""
+        self.components.append(component)
+        self.names.append(name or component.name)
+        self.draw.append(draw)
+        self.on_start.append(on_start)
+        self.on_stop.append(on_stop)
+        self.start = np.append(self.start, to_frames(start, self.frame_rate))
+        self.stop = np.append(self.stop, to_frames(stop, self.frame_rate))
+        return len(self.components) - 1
+
+    def add_keys(self, kb, key_list, end_routine=True, store='last', on_key=None,
+                 start=0.0, stop=None, name=None, reader=None):
+        """Add a keyboard; on_key(key) is called for every new key press.
+
+        reader : keyreader.KeyReader of `kb`, to read it off the frame loop
+        """
+        row = self.add(kb, start, stop, draw=False, name=name or kb.name)
+        self.keys[row] = Keys(kb, key_list, end_routine, store, on_key, reader)
+        return self.keys[row]
+
+    def retime(self, start=None, stop=None, components=None):
+        """Change start/stop (seconds) of the given components, or of all of them.
+
+        A start or stop left at None is not changed.
+        """
+        rows = range(len(self.components)) if components is None else \
+            [self.components.index(comp) for comp in components]
+        for row in rows:
+            if start is not None:
+                self.start[row] = to_frames(start, self.frame_rate)
+            if stop is not None:
+                self.stop[row] = to_frames(stop, self.frame_rate)
+
+    def end(self):
+        # force the routine to end after the current frame
+        self._ended = True
+
+    def save(self, handler):
+        # store the responses of every keyboard in a loop or the ExperimentHandler
+        for row, keys in sorted(self.keys.items()):
+            keys.save(handler, self.names[row])
+
+    def _start(self, row):
+        comp = self.components[row]
+        comp.status = STARTED
+        comp.frameNStart = self.frameN  # exact frame index
+        comp.tStartRefresh = None
+        self.win.timeOnFlip(comp, 'tStartRefresh')  # time at next scr refresh
+        if self.exp is not None:
+            self.exp.timestampOnFlip(self.win, self.names[row] + '.started')
+        if self.draw[row]:
+            comp.setAutoDraw(True)
+        if row in self.keys:
+            # keyboard checking starts with the next flip
+            if self.keys[row].reader is not None:
+                self.win.callOnFlip(self.keys[row].reader.start)
+            else:
+                self.win.callOnFlip(comp.clock.reset)
+                self.win.callOnFlip(comp.clearEvents, eventType='keyboard')
+        if self.on_start[row] is not None:
+            self.on_start[row](comp)
+
+    def _stop(self, row):
+        comp = self.components[row]
+        comp.status = FINISHED
+        comp.frameNStop = self.frameN  # exact frame index
+        if self.exp is not None:
+            self.exp.timestampOnFlip(self.win, self.names[row] + '.stopped')
+        if self.draw[row]:
+            comp.setAutoDraw(False)
+        if row in self.keys and self.keys[row].reader is not None:
+            self.keys[row].reader.stop()
+        if self.on_stop[row] is not None:
+            self.on_stop[row](comp)
+
+    def run(self, each_frame=None):
+        """Run the routine until every component has stopped or end() is called.
+
+        each_frame(frameN) is called on every frame, after the table has been
+        advanced and before the flip, for the per-frame parameter updates.
+        Returns the number of frames shown; their flip times are in flipTimes.
+        """
+        n = len(self.components)
+        for row, comp in enumerate(self.components):
+            comp.status = NOT_STARTED
+            comp.tStartRefresh = None
+        for keys in self.keys.values():
+            keys.reset()
+        last = self.stop.max() if n else 0
+        active = np.zeros(n, dtype=bool)
+        keyRows = sorted(self.keys)
+        self.frameN = -1
+        self.flipTimes = []
+        self.forceEnded = False
+        self._ended = False
+
+        while True:
+            self.frameN += 1
+            frameN = self.frameN
+            now = (self.start <= frameN) & (frameN < self.stop)
+            for row in np.flatnonzero(now != active):
+                if now[row]:
+                    self._start(row)
+                else:
+                    self._stop(row)
+            active = now
+
+            if each_frame is not None:
+                each_frame(frameN)
+            for row in keyRows:
+                # keys are read from the frame after the keyboard started
+                if active[row] and frameN > self.start[row]:
+                    self.keys[row].poll(self)
+
+            # check for quit (typically the Esc key)
+            if self.quit_keyboard is not None and self._escape():
+                if self.quit is None:
+                    from psychopy import core
+                    self.quit = core.quit
+                self.quit()
+
+            if self._ended:
+                self.forceEnded = True
+                break
+            if frameN >= last:
+                break  # every component has finished
+            self.flipTimes.append(self.win.flip())
+
+        # --- Ending Routine ---
+        for row in np.flatnonzero(active):
+            if self.draw[row]:
+                self.components[row].setAutoDraw(False)
+            if row in self.keys and self.keys[row].reader is not None:
+                self.keys[row].reader.stop()
+        return frameN
+
+    def _escape(self):
+        with keyreader.DEVICE_LOCK:  # a reader thread may be polling the same device
+            return self.quit_keyboard.getKeys(keyList=["escape"])
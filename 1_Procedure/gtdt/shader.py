@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+The GTDT stimulus evaluated on the GPU.
+
+With the precomputed timeline the GTDT routine still pushes the square size,
+annulus contrast and cover opacity into three stimuli from Python on every
+frame, and each of the four stimuli is a separate draw. GTDTStim draws the
+square, checkerboard annulus, flickering cover and centre as one quad whose
+fragment shader evaluates the contrast ramp, the flicker sine and the square
+enlargement itself from the frame number:
+
+    stim = shader.GTDTStim(win, tasks.C1, flicker_hz=21.25, frame_rate=85.0)
+    stim.set_trial(trialTimeline)  # once per trial: last frame, enlargement frames
+    stim.draw(frameN)              # per frame: one uniform and one display list
+
+The geometry, colours and the ramp (timeline.CONTRAST_RAMP) are compiled into
+the shader when the stimulus is built, so a frame costs a handful of GL calls
+whatever the task. tasks.Session(..., shader=True) and
+`python -m gtdt.launch --shader` use it in place of bg/annular/cover/center;
+those stay in the routine, undrawn, so the data files keep their columns.
+The frame number is still handed over by Python, once per frame: GL has no
+frame counter of its own.
+"""
+import numpy as np
+
+from gtdt import annulus, timeline
+
+# named colours of the GTDT stimuli in signed rgb
+COLOURS = dict(white=1.0, grey=128 / 127.5 - 1)
+COVER_COLOUR = 0.0  # the cover is white at contrast 0, i.e. mid grey
+
+VERTEX = """
+#version 120
+varying vec2 pos;  // position in stimulus units, centre at 0
+void main() {
+    pos = gl_MultiTexCoord0.xy;
+    gl_Position = gl_ModelViewProjectionMatrix * gl_Vertex;
+}
+"""
+
+FRAGMENT = """
+#version 120
+uniform float frame;      // frame of the routine (frameN)
+uniform float lastFrame;  // last frame of the trial timeline
+uniform float bigFirst;   // first and last frame of the enlarged square
+uniform float bigLast;
+varying vec2 pos;
+
+const float FRAME_RATE = %(frame_rate)r;
+const float FLICKER_HZ = %(flicker_hz)r;
+const float PI2 = 6.283185307179586;
+
+float contrast(float t) {
+%(ramp)s
+    return %(base)r;
+}
+
+vec4 over(vec4 below, float value, float alpha) {
+    // a layer of grey level `value` (signed rgb) and opacity `alpha` over `below`
+    float a = alpha + below.a * (1.0 - alpha);
+    if (a <= 0.0)
+        return below;
+    return vec4((vec3(value) * alpha + below.rgb * below.a * (1.0 - alpha)) / a, a);
+}
+
+void main() {
+    float n = min(frame, lastFrame);  // as TrialTimeline.index()
+    float t = n / FRAME_RATE;
+    float r = length(pos);
+    float side = (n >= bigFirst && n <= bigLast) ? %(big)r : %(normal)r;
+    bool square = max(abs(pos.x), abs(pos.y)) <= 0.5 * side;
+    vec4 colour = vec4(0.0);
+%(layers)s
+    if (colour.a <= 0.0)
+        discard;
+    gl_FragColor = vec4(0.5 * (colour.rgb + 1.0), colour.a);
+}
+"""
+
+# one block per stimulus, drawn in the depth order of the Session stimuli
+LAYERS = dict(
+    bg="""
+    if (square)
+        colour = over(colour, 1.0, 1.0);""",
+    annular="""
+    if (r <= %(radius)r) {
+        // sectors clockwise from 12 o'clock, as annulus.sector_texture()
+        float sector = floor(mod(degrees(atan(pos.x, pos.y)), 360.0) / %(sector)r);
+        float grey = mod(sector, 2.0) < 0.5 ? %(light)r : %(dark)r;
+        colour = over(colour, grey * contrast(t), 1.0);
+    }""",
+    cover="""
+    if (r <= %(cover)r)
+        colour = over(colour, %(cover_colour)r, 0.5 + 0.5 * sin(PI2 * fract(FLICKER_HZ * t)));""",
+    center="""
+    if (r <= %(center)r)
+        colour = over(colour, %(center_colour)r, 1.0);""")
+
+
+def ramp_source(ramp=timeline.CONTRAST_RAMP):
+    # the if-chain of timeline.contrast_ramp() in GLSL
+    return '\n'.join('    if (t > %r && t <= %r)\n        return %r * t + %r;'
+                     % tuple(float(v) for v in segment) for segment in ramp)
+
+
+def fragment_source(task, flicker_hz, frame_rate):
+    """Fragment shader of the GTDT stimulus of one task dict (see tasks.py)."""
+    values = dict(radius=float(task['radius']), cover=0.5 * task['cover'],
+                  center=0.5 * task['center'], sector=360.0 / annulus.N_SECTORS,
+                  light=annulus.LIGHTGREY, dark=annulus.DARKGREY,
+                  cover_colour=COVER_COLOUR, center_colour=COLOURS[task['center_color']])
+    # the square is drawn first, or last where its depth puts it above the centre
+    order = ['annular', 'cover', 'center']
+    order.insert(0 if task['bg_depth'] > -3.0 else 3, 'bg')
+    layers = ''.join(LAYERS[name] % values for name in order)
+    return FRAGMENT % dict(frame_rate=float(frame_rate), flicker_hz=float(flicker_hz),
+                           ramp=ramp_source(), base=timeline.BASE_CONTRAST,
+                           normal=float(task['sizes'][0]), big=float(task['sizes'][1]),
+                           layers=layers)
+
+
+class GTDTStim(object):
+    """Square, annulus, cover and centre of the GTDT routine in one shader.
+
+    win        : psychopy Window in the task's units (needs GLSL shaders)
+    task       : task dict giving the geometry (radius, cover, center, sizes ...)
+    flicker_hz : cover frequency shown (Session.flicker.hz)
+    frame_rate : refresh rate the trial timelines are compiled for
+    """
+
+    def __init__(self, win, task, flicker_hz, frame_rate, name='gtdt'):
+        import pyglet.gl as GL
+        from psychopy.tools.monitorunittools import convertToPix
+        from psychopy.visual import shaders
+
+        if not getattr(win, '_haveShaders', False):
+            raise RuntimeError('the window has no GLSL shaders; run without shader=True')
+        self.win = win
+        self.name = name
+        self.GL = GL
+        self.program = shaders.compileProgram(
+            VERTEX, fragment_source(task, flicker_hz, frame_rate))
+        self._uniforms = dict((key, GL.glGetUniformLocation(self.program, key.encode()))
+                              for key in ('frame', 'lastFrame', 'bigFirst', 'bigLast'))
+
+        # one quad over the largest of the stimuli, texture coordinates in units
+        half = 0.5 * max(2 * task['radius'], task['cover'], task['center'],
+                         *task['sizes'])
+        corners = np.array([(-half, -half), (half, -half), (half, half), (-half, half)])
+        pix = convertToPix(vertices=corners, pos=(0, 0), units=win.units, win=win)
+        self._list = GL.glGenLists(1)
+        GL.glNewList(self._list, GL.GL_COMPILE)
+        GL.glBegin(GL.GL_QUADS)
+        for (u, v), (x, y) in zip(corners, pix):
+            GL.glTexCoord2f(u, v)
+            GL.glVertex2f(x, y)
+        GL.glEnd()
+        GL.glEndList()
+        self.set_uniforms(lastFrame=0, bigFirst=-1, bigLast=-2)
+
+    def set_uniforms(self, **values):
+        GL = self.GL
+        GL.glUseProgram(self.program)
+        for key, value in values.items():
+            GL.glUniform1f(self._uniforms[key], float(value))
+        GL.glUseProgram(0)
+
+    def set_trial(self, trialTimeline):
+        """Upload the parameters of one trial: its last frame and enlargement frames."""
+        big = np.flatnonzero(trialTimeline.size != trialTimeline.size[0])
+        first, last = (big[0], big[-1]) if len(big) else (-1, -2)
+        self.set_uniforms(lastFrame=trialTimeline.last, bigFirst=first, bigLast=last)
+
+    def draw(self, frameN=0):
+        # the stimulus of frame `frameN` of the trial, into the back buffer
+        GL = self.GL
+        self.win.setScale('pix')
+        GL.glUseProgram(self.program)
+        GL.glUniform1f(self._uniforms['frame'], float(frameN))
+        GL.glCallList(self._list)
+        GL.glUseProgram(0)
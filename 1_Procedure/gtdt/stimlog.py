@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+Binary per-frame stimulus log and its offline verification.
+
+Nothing recorded what the annulus, cover and square actually did on each
+flip, so the luminance sequence a participant saw could not be checked. A
+StimulusLog writes one fixed-size record per frame of every GTDT trial
+
+    trial, frame, flip (s), contrast, opacity, size, marker
+
+into a memory-mapped ring buffer (`path + '.ring'`, one trial long) while the
+trial runs, fills in the flip times and markers when it ends and appends the
+trial to the session file between trials:
+
+    session = tasks.Session(tasks.C1, win, thisExp, root_dir, port=port,
+                            stim_log=filename + '_stim.dat')
+
+The file starts with a header holding the refresh rate and the flicker
+frequency of the session. The verification rebuilds the cover opacity and
+annulus contrast of every trial as shown (held from one flip to the next),
+finds the flicker frequency in the spectrum of the opacity and compares the
+contrast with the ramp at the time of each flip; a session takes about a
+second:
+
+    cd 1_Procedure
+    python -m gtdt.stimlog data/123456_GTDT1_stim.dat --csv check.csv
+"""
+import argparse
+import csv
+import os
+import sys
+
+import numpy as np
+
+from gtdt import frames, timeline
+
+MAGIC = b'GTDTSTIM'
+VERSION = 1
+HEADER_DTYPE = np.dtype([('magic', 'S8'), ('version', '<u4'), ('frame_rate', '<f8'),
+                         ('flicker_hz', '<f8')])
+RECORD_DTYPE = np.dtype([('trial', '<i4'), ('frame', '<i4'), ('flip', '<f8'),
+                         ('contrast', '<f4'), ('opacity', '<f4'), ('size', '<f4'),
+                         ('marker', 'u1')])
+CAPACITY = 1 << 14  # frames of the ring, over 3 minutes at 85 Hz
+FS = 1000.0  # Hz; the waveform is rebuilt on this grid for the spectrum
+LOWEST_HZ = 2.0  # the flicker is searched for above this frequency
+HZ_TOLERANCE = 0.1
+
+
+class StimulusLog(object):
+    """Per-frame records of the GTDT trials (see the module docstring).
+
+    path       : session file; the ring buffer is path + '.ring'
+    frame_rate : nominal refresh rate, stored in the header
+    flicker_hz : flicker frequency shown (Session.flicker.hz)
+    overwritten: frames lost because a trial ran longer than the ring
+    """
+
+    def __init__(self, path, frame_rate, flicker_hz, capacity=CAPACITY):
+        self.path = path
+        self.capacity = int(capacity)
+        self.trial = 0
+        self.overwritten = 0
+        self.ring = np.memmap(path + '.ring', dtype=RECORD_DTYPE, mode='w+',
+                              shape=(self.capacity,))
+        self._n = 0  # records of the current trial
+        header = np.array([(MAGIC, VERSION, frame_rate, flicker_hz)], dtype=HEADER_DTYPE)
+        self._file = open(path, 'wb')
+        self._file.write(header.tobytes())
+        self._file.flush()
+
+    def frame(self, frameN, trialTimeline):
+        # the values of frame `frameN` as the timeline sets them
+        i = trialTimeline.index(frameN)
+        if self._n == self.capacity:
+            self.overwritten += 1
+        self.ring[self._n % self.capacity] = (
+            self.trial, frameN, np.nan, trialTimeline.contrast[i], trialTimeline.opacity[i],
+            trialTimeline.size[i], 0)
+        self._n += 1
+
+    def end_trial(self, flip_times, markers=()):
+        """Add the flip times and (frame, code) markers, then append the trial to the file.
+
+        Frames without a flip (the pass that ends the routine) are dropped.
+        """
+        n = self._n
+        if n > self.capacity:
+            start = n % self.capacity
+            records = np.concatenate([self.ring[start:], self.ring[:start]])
+        else:
+            records = np.array(self.ring[:n])
+        flip_times = np.asarray(flip_times, dtype=float)
+        records = records[records['frame'] < len(flip_times)]
+        records['flip'] = flip_times[records['frame']]
+        codes = dict(markers)
+        if codes:
+            for frame, code in codes.items():
+                records['marker'][records['frame'] == frame] = code
+        self._file.write(records.tobytes())
+        self._file.flush()
+        self._n = 0
+        self.trial += 1
+
+    def close(self):
+        self._file.close()
+        ring, self.ring = self.ring, None
+        del ring
+        os.remove(self.path + '.ring')
+
+
+def read(path):
+    """Header (dict) and records of a session file."""
+    with open(path, 'rb') as f:
+        header = np.frombuffer(f.read(HEADER_DTYPE.itemsize), dtype=HEADER_DTYPE)[0]
+        if header['magic'] != MAGIC or header['version'] != VERSION:
+            raise ValueError('%s is not a version %d stimulus log' % (path, VERSION))
+        records = np.fromfile(f, dtype=RECORD_DTYPE)
+    return dict(frame_rate=float(header['frame_rate']),
+                flicker_hz=float(header['flicker_hz'])), records
+
+
+def split_trials(records):
+    # records of every trial, in the order they were written
+    bounds = np.flatnonzero(np.diff(records['trial'])) + 1
+    return np.split(records, bounds)
+
+
+def held(flip, values, frame_rate, fs=FS):
+    """`values` as shown: each one held from its flip to the next, on a grid of `fs` Hz."""
+    end = flip[-1] + 1.0 / frame_rate
+    grid = np.arange(flip[0], end, 1.0 / fs)
+    return grid, values[np.searchsorted(flip, grid, side='right') - 1]
+
+
+def peak_frequency(signal, fs=FS, lowest=LOWEST_HZ):
+    """Frequency of the largest spectral peak above `lowest` Hz.
+
+    Hann window, zero-padded to 16 times the length, refined by a parabola
+    through the log magnitudes around the peak.
+    """
+    signal = signal - signal.mean()
+    n = 1 << int(np.ceil(np.log2(len(signal) * 16)))
+    spectrum = np.abs(np.fft.rfft(signal * np.hanning(len(signal)), n))
+    hz = np.fft.rfftfreq(n, 1.0 / fs)
+    first = np.searchsorted(hz, lowest)
+    k = first + int(np.argmax(spectrum[first:]))
+    if first < k < len(spectrum) - 1:
+        a, b, c = np.log(spectrum[k - 1:k + 2] + 1e-12)
+        offset = 0.5 * (a - c) / (a - 2 * b + c)
+        return hz[k] + offset * (hz[1] - hz[0])
+    return hz[k]
+
+
+def check_trial(records, frame_rate, flicker_hz, tolerance=HZ_TOLERANCE):
+    """Flicker and contrast ramp of one trial as shown.
+
+    peak_hz     : flicker frequency found in the opacity waveform
+    ramp_error  : largest difference between the contrast shown and the ramp
+                  at the time of its flip since the first flip of the trial
+    missed      : refreshes without a flip (frames.trial_stats)
+    flicker_ok  : peak_hz within `tolerance` of flicker_hz
+    ramp_ok     : ramp_error within what one frame of lag can cause
+    """
+    flip = records['flip']
+    shown = dict(trial=int(records['trial'][0]), frames=len(records),
+                 missed=frames.trial_stats(flip, frame_rate)['missed'],
+                 markers=' '.join('%d:%d' % (f, c) for f, c in
+                                  zip(records['frame'][records['marker'] > 0],
+                                      records['marker'][records['marker'] > 0])))
+    _, opacity = held(flip, records['opacity'].astype(float), frame_rate)
+    shown['peak_hz'] = float(peak_frequency(opacity))
+    shown['flicker_ok'] = bool(abs(shown['peak_hz'] - flicker_hz) <= tolerance)
+    ramp = timeline.contrast_ramp(flip - flip[0])
+    shown['ramp_error'] = float(np.max(np.abs(records['contrast'] - ramp)))
+    steepest = max(abs(segment[2]) for segment in timeline.CONTRAST_RAMP)
+    shown['ramp_ok'] = bool(shown['ramp_error'] <=
+                           steepest * (1 + frames.TOLERANCE) / frame_rate)
+    return shown
+
+
+def verify(path, tolerance=HZ_TOLERANCE):
+    """Header and check_trial() of every trial of a session file."""
+    header, records = read(path)
+    return header, [check_trial(trial, header['frame_rate'], header['flicker_hz'], tolerance)
+                    for trial in split_trials(records) if len(trial) > 1]
+
+
+COLUMNS = ['trial', 'frames', 'missed', 'peak_hz', 'flicker_ok', 'ramp_error', 'ramp_ok',
+           'markers']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('files', nargs='+', help='*_stim.dat session files')
+    parser.add_argument('--tolerance', type=float, default=HZ_TOLERANCE,
+                        help='Hz the flicker peak may deviate')
+    parser.add_argument('--csv', help='one row per trial of all files')
+    args = parser.parse_args(argv)
+    rows = []
+    failed = 0
+    for path in args.files:
+        header, checks = verify(path, args.tolerance)
+        bad = [c for c in checks if not (c['flicker_ok'] and c['ramp_ok'])]
+        failed += len(bad)
+        print('%s: %d trials at %.4g Hz, flicker %.4g Hz; peak %.3f-%.3f Hz, '
+              'ramp error max %.4f; %d trials failed'
+              % (path, len(checks), header['frame_rate'], header['flicker_hz'],
+                 min(c['peak_hz'] for c in checks) if checks else np.nan,
+                 max(c['peak_hz'] for c in checks) if checks else np.nan,
+                 max(c['ramp_error'] for c in checks) if checks else np.nan, len(bad)))
+        for c in bad:
+            print('  trial %(trial)d: peak %(peak_hz).3f Hz, ramp error %(ramp_error).4f, '
+                  '%(missed)d missed' % c)
+        rows.extend([os.path.basename(path)] + [c[key] for key in COLUMNS] for c in checks)
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['file'] + COLUMNS)
+            writer.writerows(rows)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
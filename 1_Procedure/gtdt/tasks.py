@@ -0,0 +1,588 @@
+# -*- coding: utf-8 -*-
+"""
+The GTDT tasks as configuration.
+
+Each task (C1-C3 and their practice versions P1-P3) is a dict describing its
+instructions, loops, stimulus geometry and markers. Session builds the
+stimuli once and runs the flow of the task with routine.Routine, so a task
+script only has to set up the window/ExperimentHandler and call
+
+    session = tasks.Session(tasks.C1, win, thisExp, root_dir, port=port,
+                            frame_rate=1.0 / frameDur, quit_keyboard=defaultKeyboard)
+    session.run()
+
+Flow of a formal task (C*):
+    instructions -> blocks: [fixation -> trials: [GTDT] -> question? -> rest] -> condition
+Flow of the interleaved Task 2/3 session (C2C3, see interleave.py):
+    instructions -> blocks: [instruction of the block's task -> fixation -> trials -> question? -> rest]
+Flow of a practice task (P*), repeated until 'p' is pressed on the last screen:
+    instructions -> fixation -> trials: [GTDT] -> present_corr? / question? -> practise_end
+"""
+import contextlib
+import os
+
+from gtdt import (annulus, conditions, flicker, frames, interleave, keyreader, realtime,
+                  routine, shader, stimlog, timeline, triggers)
+
+QUESTION = '请问在这个阶段中，你观察到圆环变暗的次数为？\n填写完成后按空格键提交'
+
+# stimulus geometry of the formal tasks (units='height') and the practice (units='cm')
+HEIGHT = dict(units='height', image_size=(1.6, 1), fixation_height=0.05,
+              radius=0.25, cover=0.5, center=0.25, center_color='white',
+              sizes=(0.5, 1.0), bg_depth=0.0, flicker_hz=timeline.FLICKER_HZ,
+              question_pos=(0, 0.15), question_height=0.05,
+              textbox_pos=(0, 0), textbox_size=(0.5, 0.5), textbox_height=0.05)
+CM = dict(units='cm', image_size=(30, 20), fixation_height=2,
+          radius=2.8, cover=5.6, center=2.8, center_color='grey',
+          sizes=(0.05, 0.25), bg_depth=-4.0, flicker_hz=20,
+          question_pos=(-2, 0.15), question_height=1,
+          textbox_pos=(0, -2.5), textbox_size=(10, 10), textbox_height=1,
+          corr_height=1)
+
+
+def task(geometry, **options):
+    config = dict(geometry)
+    config.update(options)
+    return config
+
+
+# instructions : instruction images shown in turn, each ended with 'p'
+# blocks       : (conditions file, method, loop name) of the block loop
+# trials       : conditions file of the trial loop, or the block column naming it
+# rest         : image of the rest screen, or the block column naming it
+# press        : 'space' presses are recorded during the GTDT routine
+# question     : ask for the number of dimming events after the trials
+C1 = task(HEIGHT, name='GTDT1', instructions=('instruction3C1.png',),
+          blocks=('blist_c1.xlsx', 'fullRandom', 'blocks'), trials='c1.xlsx',
+          rest='instruction4.png', press=True)
+C2 = task(HEIGHT, name='GTDT2',
+          instructions=('instruction1.png', 'instruction2.png', 'instruction3C2.png'),
+          blocks=('blist_c2.xlsx', 'sequential', 'blocks'), trials='c2.xlsx',
+          rest='brest', press=True)
+C3 = task(HEIGHT, name='GTDT_C3',
+          instructions=('instruction1.png', 'instruction2.png', 'instruction3C3.png'),
+          blocks=('blist_c3.xlsx', 'sequential', 'block'), trials='btrials',
+          rest='brest', question=True)
+P1 = task(CM, name='GTDT_P1', practice=True, instructions=('instruction3P1.png',),
+          trials='c1p.xlsx', press=True)
+P2 = task(CM, name='GTDT_P2', practice=True,
+          instructions=('instruction1.png', 'instruction2.png', 'instruction3P2.png'),
+          trials='c2p.xlsx', press=True, score=True)
+P3 = task(CM, name='GTDT_P3', practice=True,
+          instructions=('instruction1.png', 'instruction2.png', 'instruction3P3.png'),
+          trials='c3p.xlsx', question=True)
+# Task 2 and 3 blocks interleaved over two sessions (GTDT2and3_1 / GTDT2and3_2):
+# every block is preceded by the instruction of its task and followed by rest<n>.png,
+# the last block of a part by instruction5.png; every part starts with a `first` block
+C2C3 = task(CM, name='GTDT2and3', flicker_hz=timeline.FLICKER_HZ,
+            instructions=('instruction1.png', 'instruction2.png'), first='C2',
+            interleave=dict(
+                C2=dict(blocks='blist_c2.xlsx', instruction='instruction3P2.png',
+                        trials='c2.xlsx', press=True),
+                C3=dict(blocks='blist_c3.xlsx', instruction='instruction3P3.png',
+                        trials='btrials', question=True)),
+            rest='rest%d.png')
+TASKS = dict(C1=C1, C2=C2, C3=C3, P1=P1, P2=P2, P3=P3, C2C3=C2C3)
+
+# marker codes
+BLOCK_MARKER = 9  # block start (fixation) and block end (rest / question)
+RESPONSE_MARKER = 2  # every new 'space' press
+RT_CORRECT = 2.0  # practice 2: a press within 2 s of the circle onset is correct
+PREFETCH_LEAD = 0.25  # seconds before the end of a trial the next one is compiled
+
+
+class Session(object):
+    """Stimuli and routines of one task on one window.
+
+    task          : one of the task dicts above
+    win, exp      : psychopy Window and ExperimentHandler
+    root_dir      : folder of the instruction images
+    port          : trigger backend for the markers, ports.open_port(address)
+                    (None: no markers, as in the practice)
+    frame_rate    : refresh rate used for the frame-based timing
+    quit_keyboard : keyboard checked for 'escape'
+    log           : datalog.TrialLog receiving every entry as it is finished
+    shader        : draw the GTDT stimulus with shader.GTDTStim (one draw per frame,
+                    contrast, flicker and square size evaluated on the GPU)
+    condition_cache : conditions.ConditionCache to share between tasks (a new one by default);
+                    every conditions file of the task is parsed into it at start-up
+    realtime      : run the trial loops in a realtime.RealTime section (gc frozen and
+                    collected between trials, raised priority, pinned CPU; pauses and
+                    overruns saved with the frames .npz)
+    key_reader    : read the 'space' presses of the GTDT routine in a keyreader.KeyReader
+                    thread, which also sends the response marker as soon as a press is read
+    stim_log      : path of the binary per-frame stimulus log (stimlog.StimulusLog), or None
+    visual, keyboard, data : the psychopy modules, replaceable by stand-ins
+    """
+
+    def __init__(self, task, win, exp, root_dir='', port=None, frame_rate=60.0,
+                 quit_keyboard=None, log=None, shader=False, condition_cache=None,
+                 realtime=True, key_reader=True, stim_log=None, visual=None, keyboard=None, data=None):
+        if visual is None:
+            from psychopy import visual
+        if keyboard is None:
+            from psychopy.hardware import keyboard
+        if data is None:
+            from psychopy import data
+        self.task = task
+        self.win = win
+        self.exp = exp
+        self.root_dir = root_dir
+        self.port = port
+        self.frame_rate = frame_rate
+        self.quit_keyboard = quit_keyboard
+        self.log = log
+        self.shader = shader
+        self.realtime = realtime
+        self.key_reader = key_reader
+        self.readers = []  # every keyreader.KeyReader started
+        self.visual = visual
+        self.keyboard = keyboard
+        self.data = data
+        self.number_correct = 0
+        self._prefetched = None  # (trial row, its timeline) compiled ahead by prefetch()
+        self.frames = frames.FrameLog(frame_rate)  # frame timing of every trial
+        # the cover flicker this refresh rate can show for the task's frequency
+        self.flicker = flicker.plan(task['flicker_hz'], frame_rate)
+        self.stim_log = None
+        if stim_log is not None:
+            self.stim_log = stimlog.StimulusLog(stim_log, frame_rate, self.flicker.hz)
+        self.routines = []  # every routine built, for prewarm()
+        if condition_cache is None:
+            condition_cache = conditions.ConditionCache(data.importConditions)
+        self.condition_cache = condition_cache
+        self.preload_conditions()
+        self._build()
+
+    def marker(self, code):
+        # queued onto the next flip; the practice runs without a port
+        if self.port is not None:
+            triggers.attach(self.win, self.port).send(code)
+
+    def marker_now(self, code):
+        # written at once from the calling thread (the key reader), not on a flip
+        if self.port is not None:
+            triggers.attach(self.win, self.port).send_now(code)
+
+    def _routine(self, name):
+        r = routine.Routine(self.win, name, self.exp, self.frame_rate, self.quit_keyboard)
+        self.routines.append(r)
+        return r
+
+    def _image(self, name, image):
+        return self.visual.ImageStim(
+            win=self.win, name=name, image=image, mask=None, anchor='center',
+            ori=0.0, pos=(0, 0), size=self.task['image_size'],
+            color=[1, 1, 1], colorSpace='rgb', opacity=None,
+            flipHoriz=False, flipVert=False,
+            texRes=128.0, interpolate=True, depth=0.0)
+
+    def _text(self, name, text, pos, height):
+        return self.visual.TextStim(
+            win=self.win, name=name, text=text, font='Open Sans',
+            pos=pos, height=height, wrapWidth=None, ori=0.0,
+            color='white', colorSpace='rgb', opacity=None,
+            languageStyle='LTR', depth=0.0)
+
+    def _keyboard(self, name):
+        kb = self.keyboard.Keyboard()
+        kb.name = name
+        return kb
+
+    def _gtdt(self, press):
+        r = self._routine('GTDT')
+        # with the shader the four stimuli only keep their data columns
+        drawn = self.stim is None
+        r.add(self.bg, draw=drawn)
+        r.add(self.annular, draw=drawn,
+              on_start=lambda comp: self.marker(timeline.ONSET_MARKER))
+        r.add(self.cover, draw=drawn)
+        r.add(self.center, draw=drawn)
+        keys = None
+        if press and self.key_reader:
+            kb = self._keyboard('press')
+            reader = keyreader.KeyReader(
+                kb, ['space'], on_key=lambda key: self.marker_now(RESPONSE_MARKER))
+            self.readers.append(reader)
+            keys = r.add_keys(kb, ['space'], end_routine=False, store='all', reader=reader)
+        elif press:
+            keys = r.add_keys(self._keyboard('press'), ['space'], end_routine=False,
+                              store='all', on_key=lambda key: self.marker(RESPONSE_MARKER))
+        return r, keys
+
+    def _build(self):
+        # --- Initialize components ---
+        cfg, visual, win = self.task, self.visual, self.win
+        # block kinds: the task itself, or the tasks of an interleaved session
+        self.kinds = cfg.get('interleave') or {cfg['name']: cfg}
+        self.instructions = []
+        # numbered like the Builder routines: a single instruction is instruction3
+        first = 4 - len(cfg['instructions'])
+        for n, image in enumerate(cfg['instructions'], first):
+            r = self._routine('instruction%d' % n)
+            r.add(self._image('i%d' % n, self.root_dir + image))
+            r.add_keys(self._keyboard('key_resp_%d' % n if n > 1 else 'key_resp'), ['p'])
+            self.instructions.append(r)
+
+        self.fixation = self._routine('fixation')
+        self.fixation.add(self._text('text', '+', (0, 0), cfg['fixation_height']),
+                          stop=1.0, on_start=lambda comp: self.marker(BLOCK_MARKER))
+
+        # --- GTDT: square, checkerboard annulus, flickering cover, centre ---
+        normal = cfg['sizes'][0]
+        self.bg = visual.Rect(
+            win=win, name='bg', width=normal, height=normal,
+            ori=0.0, pos=(0, 0), anchor='center',
+            lineWidth=1.0, colorSpace='rgb', lineColor='white', fillColor='white',
+            opacity=None, depth=cfg['bg_depth'], interpolate=False)
+        self.annular = annulus.make_annulus(win, radius=cfg['radius'], name='annular',
+                                            depth=-1.0, contrast=timeline.BASE_CONTRAST,
+                                            visual=visual)
+        self.cover = visual.ShapeStim(
+            win=win, name='cover', size=(cfg['cover'], cfg['cover']), vertices='circle',
+            ori=0.0, pos=(0, 0), anchor='center',
+            lineWidth=1.0, colorSpace='rgb', lineColor='white', fillColor='white',
+            opacity=1.0, contrast=0.0, depth=-2.0, interpolate=False)
+        self.center = visual.ShapeStim(
+            win=win, name='center', size=(cfg['center'], cfg['center']), vertices='circle',
+            ori=0.0, pos=(0, 0), anchor='center',
+            lineWidth=1.0, colorSpace='rgb',
+            lineColor=cfg['center_color'], fillColor=cfg['center_color'],
+            opacity=None, depth=-3.0, interpolate=False)
+        self.stim = None
+        if self.shader:
+            self.stim = shader.GTDTStim(win, cfg, self.flicker.hz, self.frame_rate)
+        self.rt = None  # the realtime section of the trial loops
+        if self.realtime:
+            self.rt = realtime.RealTime(frame_rate=self.frame_rate)
+            self.frames.realtime = self.rt  # pauses and overruns go into the frames .npz
+        # one GTDT routine with and one without the 'space' keyboard, as the blocks need
+        self.gtdt = {}
+        for press in set(bool(spec.get('press')) for spec in self.kinds.values()):
+            self.gtdt[press] = self._gtdt(press)
+
+        self.question = None
+        if any(spec.get('question') for spec in self.kinds.values()):
+            self.question = self._routine('question')
+            self.question.add(self._text('text_2', QUESTION, cfg['question_pos'],
+                                         cfg['question_height']),
+                              on_start=lambda comp: self.marker(BLOCK_MARKER))
+            self.textbox = visual.TextBox2(
+                win, text=None, placeholder='Type here...', font='Arial',
+                pos=cfg['textbox_pos'], letterHeight=cfg['textbox_height'],
+                size=cfg['textbox_size'], borderWidth=2.0,
+                color='white', colorSpace='rgb', opacity=None,
+                bold=False, italic=False, lineSpacing=1.0, speechPoint=None,
+                padding=0.0, alignment='center', anchor='center', overflow='visible',
+                fillColor=None, borderColor=None,
+                flipHoriz=False, flipVert=False, languageStyle='LTR',
+                editable=True, name='textbox', depth=-1, autoLog=True)
+            self.question.add(self.textbox)
+            self.question.add_keys(self._keyboard('key_resp_7' if cfg.get('practice')
+                                                  else 'key_resp_6'), ['space'])
+
+        if cfg.get('practice'):
+            self.present_corr = None
+            if cfg.get('score'):
+                self.present_corr = self._routine('present_corr')
+                self.practise_corr = self._text('practise_corr', None, (0, 0),
+                                                cfg['corr_height'])
+                self.present_corr.add(self.practise_corr)
+                self.present_corr.add_keys(self._keyboard('key_resp_7'), ['p'])
+            self.practise_end = self._routine('practise_end')
+            self.practise_end.add(self._image('image', self.root_dir + 'rep_practise.png'))
+            self.practise_end_keys = self.practise_end.add_keys(
+                self._keyboard('key_resp_6'), ['p', 'q'])
+        else:
+            # a fixed image, or one set per block (block column / numbered rest<n>.png);
+            # one rest routine per image, built on first use or by prewarm()
+            rest = cfg['rest']
+            fixed = rest.endswith('.png') and '%' not in rest
+            self.rest_default = self.root_dir + rest if fixed else None
+            self.rests = {}
+            # instruction shown before every block of an interleaved session
+            self.block_instructions = {}
+            for kind, spec in cfg.get('interleave', {}).items():
+                r = self._routine('instruction_' + kind)
+                r.add(self._image('i_' + kind, self.root_dir + spec['instruction']))
+                r.add_keys(self._keyboard('key_resp_' + kind), ['p'])
+                self.block_instructions[kind] = r
+            self.condition = self._routine('condition')
+            self.condition.add(self._image('i5', self.root_dir + 'instruction5.png'))
+            self.condition.add_keys(self._keyboard('key_resp_5'), ['p'])
+
+    def preload_conditions(self):
+        """Parse every block list and trial list of the task, so no block reads a file."""
+        cfg, cache = self.task, self.condition_cache
+        if cfg.get('practice'):
+            cache.preload([self.root_dir + cfg['trials']])
+            return
+        for spec in (cfg.get('interleave') or {cfg['name']: cfg}).values():
+            blocks = spec['blocks'][0] if isinstance(spec['blocks'], tuple) else spec['blocks']
+            cache.preload([self.root_dir + blocks])
+            trials = spec['trials']
+            if trials.endswith('.xlsx'):
+                cache.preload([self.root_dir + trials])
+            else:
+                # named per block, relative to the script folder as in block()
+                cache.preload(sorted(set(row[trials] for row in
+                                         cache.get(self.root_dir + blocks))))
+
+    def _rest(self, image):
+        # rest screen showing `image`
+        if image not in self.rests:
+            r = self._routine('rest')
+            r.add(self._image('i4', image))
+            r.add_keys(self._keyboard('key_resp_4'), ['p'])
+            self.rests[image] = r
+        return self.rests[image]
+
+    def rest_images(self):
+        """Images the rest screens of this task can show."""
+        cfg = self.task
+        rest = cfg.get('rest')
+        if cfg.get('practice'):
+            return []
+        if self.rest_default is not None:
+            return [self.rest_default]
+        if '%' in rest:
+            # numbered per block of a session part
+            n_blocks = sum(len(self.condition_cache.get(self.root_dir + spec['blocks']))
+                           for spec in cfg['interleave'].values())
+            images = [self.root_dir + rest % (n + 1) for n in range(n_blocks)]
+            images.append(self.root_dir + 'instruction5.png')  # after the last block
+            return [image for image in images if os.path.exists(image)]
+        rows = self.condition_cache.get(self.root_dir + cfg['blocks'][0])
+        return sorted(set(row[rest] for row in rows))
+
+    def prewarm(self):
+        """Decode and upload every image and text before the first frame.
+
+        Builds the rest screens of all rest_images(), then draws each
+        component of every routine once into the back buffer and clears it,
+        so no texture is created on the first frame of a routine.
+        """
+        for image in self.rest_images():
+            self._rest(image)
+        for r in self.routines:
+            for comp, draw in zip(r.components, r.draw):
+                if draw:
+                    comp.draw()
+        if self.stim is not None:
+            self.stim.draw()
+        self.win.clearBuffer()
+
+    def close(self):
+        # stop the key reader threads and close the stimulus log once the task is over
+        for reader in self.readers:
+            reader.close()
+        if self.stim_log is not None:
+            self.stim_log.close()
+
+    def loop(self, name, conditions, method, nReps=1.0):
+        # a TrialHandler registered with the ExperimentHandler
+        if conditions is None:
+            trialList = [None]
+        elif isinstance(conditions, list):
+            trialList = conditions
+        else:
+            trialList = self.condition_cache.get(conditions)  # preloaded, no file read
+        handler = self.data.TrialHandler(
+            nReps=nReps, method=method, extraInfo=self.exp.extraInfo, originPath=-1,
+            trialList=trialList, seed=None, name=name)
+        self.exp.addLoop(handler)
+        return handler
+
+    def next_entry(self):
+        # close the entry of thisExp and hand a copy to the background log
+        self.exp.nextEntry()
+        if self.log is not None:
+            self.log.add_entry(dict(self.exp.entries[-1]))
+
+    def show(self, r, handler):
+        # run a routine ended by a key press and store the response
+        r.run()
+        r.save(handler)
+        self.next_entry()
+
+    def compile(self, thisTrial):
+        # the timeline of one trial row at this refresh rate and flicker
+        return timeline.compile_trial(thisTrial, self.frame_rate, flicker_hz=self.flicker.hz,
+                                      sizes=self.task['sizes'])
+
+    def prefetch(self, trials, n=1):
+        """Compile the timeline of the trial `n` ahead of `trials` now.
+
+        Called from a frame with time to spare (the tail of a trial, the
+        fixation before the first one), so trial() finds its timeline ready
+        and the first flip of the trial carries no setup work.
+        """
+        nextTrial = trials.getFutureTrial(n)
+        if nextTrial is None or (self._prefetched is not None and
+                                 self._prefetched[0] is nextTrial):
+            return
+        self._prefetched = (nextTrial, self.compile(nextTrial))
+
+    def trial(self, thisTrial, trials, press):
+        # --- GTDT routine of one trial ---
+        prefetched, self._prefetched = self._prefetched, None
+        if prefetched is not None and prefetched[0] is thisTrial:
+            trialTimeline = prefetched[1]
+        else:
+            trialTimeline = self.compile(thisTrial)
+        bg, annular, cover, stim, rt = self.bg, self.annular, self.cover, self.stim, self.rt
+        stim_log = self.stim_log
+
+        if stim is None:
+            def draw(frameN):
+                frameI = trialTimeline.index(frameN)  # row of the precomputed timeline
+                x = y = trialTimeline.size[frameI]
+                bg.setSize((x, y), log=False)
+                annular.setContrast(trialTimeline.contrast[frameI], log=False)
+                cover.setOpacity(trialTimeline.opacity[frameI], log=False)
+        else:
+            stim.set_trial(trialTimeline)  # the GPU evaluates the timeline itself
+
+            def draw(frameN):
+                # not on the last pass, which ends the routine without a flip
+                if annular.status == routine.STARTED:
+                    stim.draw(frameN)
+
+        # the next trial is prepared in the tail of this one
+        lead = routine.to_frames(PREFETCH_LEAD, self.frame_rate)
+        prefetchFrame = max(1, trialTimeline.last - lead)
+
+        def each_frame(frameN):
+            draw(frameN)
+            if stim_log is not None:
+                stim_log.frame(frameN, trialTimeline)
+            if rt is not None:
+                rt.frame = frameN
+            if frameN == prefetchFrame:
+                self.prefetch(trials)
+
+        gtdt, keys = self.gtdt[press]
+        gtdt.retime(stop=thisTrial['asec'])
+        self.frames.start(self.win)
+        gtdt.run(each_frame)
+        self.frames.stop(self.win, gtdt.flipTimes, trials)
+        if stim_log is not None:
+            stim_log.end_trial(gtdt.flipTimes, self.frames.last_markers)
+        if rt is not None:
+            rt.end_trial(gtdt.flipTimes)  # late flips, then gc between the trials
+        trials.addData('flicker.hz', self.flicker.hz)
+        trials.addData('flicker.method', self.flicker.method)
+        if self.log is not None:
+            for frame, code in self.frames.last_markers:
+                flipTime = gtdt.flipTimes[frame] if 0 <= frame < len(gtdt.flipTimes) else None
+                self.log.event('GTDT', 'marker', flip=frame, time=flipTime, marker=code)
+        if keys is not None:
+            if self.task.get('score'):
+                keyRT = keys.kb.rt
+                keys.kb.corr = 1 if keys.kb.keys and keyRT[0] < RT_CORRECT else 0
+                trials.addData('press.corr', keys.kb.corr)
+                self.number_correct += keys.kb.corr
+            gtdt.save(trials)
+        self.next_entry()
+
+    def trials(self, conditions, press, lead=None):
+        """Trial loop over `conditions`, after the routine `lead` (the fixation).
+
+        The first trial is prefetched during `lead`, every further one during
+        the tail of the trial before it. Both run in the realtime section.
+        """
+        trials = self.loop('trials', conditions, 'fullRandom')
+        self.number_correct = 0
+        with self.rt if self.rt is not None else contextlib.nullcontext():
+            if lead is not None:
+                lead.run(lambda frameN: self.prefetch(trials) if frameN == 1 else None)
+            for thisTrial in trials:
+                self.trial(thisTrial, trials, press)
+        return trials
+
+    def ask(self, handler):
+        # --- question: number of dimming events ---
+        self.textbox.reset()
+        self.question.run()
+        handler.addData('textbox.text', self.textbox.text)
+        self.question.save(handler)
+        self.next_entry()
+
+    def block(self, spec, thisBlock, blocks, rest_image=None):
+        """fixation -> trials -> question? -> rest of one block row."""
+        trials = spec['trials']
+        self.trials(thisBlock[trials] if trials in thisBlock else self.root_dir + trials,
+                    bool(spec.get('press')), lead=self.fixation)
+        if spec.get('question'):
+            self.ask(blocks)  # marks the block end
+        else:
+            self.marker(BLOCK_MARKER)  # on the first flip of the rest screen
+        self.show(self._rest(rest_image if rest_image is not None else self.rest_default),
+                  blocks)
+
+    def run(self, **options):
+        if self.task.get('practice'):
+            self.run_practice()
+        elif self.task.get('interleave'):
+            self.run_interleaved(**options)
+        else:
+            self.run_task()
+
+    def run_task(self):
+        cfg = self.task
+        for r in self.instructions:
+            self.show(r, self.exp)
+        conditions, method, name = cfg['blocks']
+        blocks = self.loop(name, self.root_dir + conditions, method)
+        for thisBlock in blocks:
+            rest = cfg['rest']
+            self.block(cfg, thisBlock, blocks, thisBlock[rest] if rest in thisBlock else None)
+        self.show(self.condition, self.exp)
+
+    def run_interleaved(self, part=1, parts=2, seed=None, order_file=None):
+        """Blocks of all interleaved tasks in one constrained pseudo-random order.
+
+        The order is drawn from `seed` (the participant id) and split over
+        `parts` sessions; this session runs part `part` of it. With
+        `order_file`, part 1 writes the order there and the other parts read
+        it back, failing if part 1 did not run for this participant.
+        """
+        cfg = self.task
+        rows = dict((kind, self.condition_cache.get(self.root_dir + spec['blocks']))
+                    for kind, spec in cfg['interleave'].items())
+        if order_file is not None and part > 1:
+            order = interleave.load_order(order_file, rows, seed)
+        else:
+            order = interleave.block_order(rows, seed=seed, first=cfg.get('first'),
+                                           parts=parts)
+            if order_file is not None:
+                interleave.save_order(order_file, order, rows, seed)
+        for r in self.instructions:
+            self.show(r, self.exp)
+        part_rows = interleave.session_part(order, part, parts)
+        blocks = self.loop('blocks', part_rows, 'sequential')
+        for n, thisBlock in enumerate(blocks):
+            kind = thisBlock['task']
+            self.show(self.block_instructions[kind], self.exp)
+            last = n == len(part_rows) - 1
+            self.block(cfg['interleave'][kind], thisBlock, blocks,
+                       self.root_dir + ('instruction5.png' if last else cfg['rest'] % (n + 1)))
+
+    def run_practice(self):
+        practise_back = self.loop('practise_back', None, 'sequential', nReps=999.0)
+        for thisPractise_back in practise_back:
+            for r in self.instructions:
+                self.show(r, self.exp)
+            trials = self.trials(self.root_dir + self.task['trials'],
+                                 bool(self.task.get('press')), lead=self.fixation)
+            if self.present_corr is not None:
+                correct_rate = self.number_correct / float(trials.nTotal)
+                self.practise_corr.setText(
+                    "Your correct rate is ({:.2f}), press 'p' to continue".format(correct_rate))
+                self.show(self.present_corr, practise_back)
+            if self.question is not None:
+                self.ask(practise_back)
+            self.show(self.practise_end, practise_back)
+            # 'p' ends the practice, 'q' runs it again
+            if 'p' in self.practise_end_keys.kb.keys:
+                practise_back.finished = True
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Per-frame stimulus timeline for the GTDT routine.
+
+The scripts used to re-evaluate the contrast ramp and the flicker sine from
+the routine clock `t` on every frame, once per annulus sector. compile_trial()
+does that work once, before the trial starts, and returns arrays indexed by
+frame number so the frame loop only has to look values up:
+
+    trialTimeline = timeline.compile_trial(thisTrial, 1.0 / frameDur)
+    ...
+    frameI = trialTimeline.index(frameN)
+    cont = trialTimeline.contrast[frameI]
+"""
+import numpy as np
+
+# piecewise contrast ramp of the annulus: (end of segment in s, slope, intercept)
+# 0 < t <= 1.6 : cont = -0.1875 * t + 0.65
+# 1.6 < t <= 2.4 : cont = 0.375 * t - 0.25
+# otherwise      : cont = 0.65
+CONTRAST_RAMP = ((0.0, 1.6, -0.1875, 0.65), (1.6, 2.4, 0.375, -0.25))
+BASE_CONTRAST = 0.65
+FLICKER_HZ = 21.25  # cover flicker of the formal tasks (practice runs at 20 Hz)
+
+# marker codes sent by the GTDT scripts
+ONSET_MARKER = 1  # circle onset
+SQUARE_MARKER = 9  # square enlargement (task 1)
+
+
+class TrialTimeline(object):
+    """Arrays describing one trial, one entry per flip.
+
+    t        : time of each flip relative to the first flip of the routine
+    contrast : annulus contrast
+    opacity  : cover opacity (flicker)
+    size     : side of the central square (bg)
+    marker   : marker code to send on that flip (0 = none)
+    """
+
+    def __init__(self, frame_rate, t, contrast, opacity, size, marker):
+        self.frame_rate = frame_rate
+        self.t = t
+        self.contrast = contrast
+        self.opacity = opacity
+        self.size = size
+        self.marker = marker
+        self.n_frames = len(t)
+        self.last = self.n_frames - 1
+
+    def index(self, frameN):
+        # the routine may run a frame past asec before it notices it is over
+        return frameN if frameN < self.last else self.last
+
+    def marker_frames(self):
+        # frame indices and codes of every scheduled marker
+        frames = np.flatnonzero(self.marker)
+        return frames, self.marker[frames]
+
+    def event_frame(self, code):
+        # frame on which `code` is scheduled, -1 if the trial has none
+        frames = np.flatnonzero(self.marker == code)
+        return int(frames[0]) if len(frames) else -1
+
+
+def contrast_ramp(t):
+    # vectorised form of the if/elif/else ramp in the GTDT scripts
+    t = np.asarray(t, dtype=float)
+    cont = np.full(t.shape, BASE_CONTRAST)
+    for start, stop, slope, intercept in CONTRAST_RAMP:
+        seg = (t > start) & (t <= stop)
+        cont[seg] = slope * t[seg] + intercept
+    return cont
+
+
+def flicker(t, flicker_hz=FLICKER_HZ):
+    # cover opacity, 0.5 + 0.5 * sin(2 * pi * f * t)
+    return 0.5 + 0.5 * np.sin(2 * np.pi * flicker_hz * np.asarray(t, dtype=float))
+
+
+def event_frames(ssec, esec, frame_rate, closed='right'):
+    """First and last frame of the enlargement ssec < t <= esec.
+
+    Frame n is shown at t = n / frame_rate, so the window is fixed in flip
+    indices before the trial instead of being tested against the jittery
+    routine clock (`t == ssec` almost never holds for a float clock).
+    closed: the ends included, as the scripts tested them: 'right'
+    (ssec < t <= esec), 'left' (ssec <= t < esec) or 'both'.
+    """
+    if closed not in ('right', 'left', 'both'):
+        raise ValueError("closed must be 'right', 'left' or 'both', got %r" % closed)
+    if closed == 'right':
+        first = int(np.floor(float(ssec) * frame_rate + 1e-6)) + 1
+    else:
+        first = int(np.ceil(float(ssec) * frame_rate - 1e-6))
+    if closed == 'left':
+        last = int(np.ceil(float(esec) * frame_rate - 1e-6)) - 1
+    else:
+        last = int(np.floor(float(esec) * frame_rate + 1e-6))
+    return first, last
+
+
+def compile_trial(trial, frame_rate, flicker_hz=FLICKER_HZ, sizes=(0.5, 1.0),
+                  onset_marker=ONSET_MARKER, square_marker=SQUARE_MARKER,
+                  closed='right'):
+    """Build the TrialTimeline of one trial row.
+
+    trial      : a row of the conditions file (dict-like) with `asec` and,
+                 for task 1 and its practice, `ssec` and `esec`
+    frame_rate : measured refresh rate in Hz
+    sizes      : (normal, enlarged) side of the central square
+    closed     : ends of the enlargement window included (see event_frames)
+    """
+    asec = float(trial['asec'])
+    n_frames = int(np.ceil(asec * frame_rate - 1e-6)) + 1
+    t = np.arange(n_frames) / float(frame_rate)
+
+    size = np.full(n_frames, float(sizes[0]))
+    marker = np.zeros(n_frames, dtype=np.uint8)
+    marker[0] = onset_marker
+    ssec = trial.get('ssec') if hasattr(trial, 'get') else None
+    if ssec is not None and ssec == ssec:  # skip missing / NaN cells
+        first, last = event_frames(ssec, trial['esec'], frame_rate, closed)
+        size[first:last + 1] = sizes[1]
+        if first <= last and first < n_frames:
+            # the enlargement is marked on the flip that first shows it
+            marker[first] = square_marker
+
+    return TrialTimeline(frame_rate, t, contrast_ramp(t),
+                         flicker(t, flicker_hz), size, marker)
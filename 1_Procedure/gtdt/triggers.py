@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Non-blocking, flip-locked trigger output.
+
+The old marker helpers did
+
+    port.setData(value)
+    core.wait(0.05)
+    port.setData(0)
+
+inside the frame loop, which stalls rendering for ~4 frames at 85 Hz. A
+TriggerScheduler instead queues the code, writes it right after the next
+win.flip() (the same moment win.callOnFlip would) and clears the line after
+`hold_frames` further flips, or after `hold_time` seconds on a background
+timer. The frame loop never waits on the port.
+
+A code queued during frame n goes out right after the flip that shows frame
+n, unless the line is still busy with an earlier code; `delays` records, for
+every code written, how many flips it had to wait for that. send_now()
+writes a code at once from any thread (the response marker of a
+keyreader.KeyReader) and holds it like the others.
+"""
+import threading
+from collections import deque
+
+
+class TriggerScheduler(object):
+    """Queue marker codes onto the flips of one window.
+
+    port        : any object with a setData(int) method (psychopy.parallel.ParallelPort)
+    win         : psychopy Window whose flip() the scheduler hooks into
+    hold_frames : number of flips the code stays on the line before it is cleared
+    hold_time   : if given (seconds), clear on a background timer instead of counting flips
+    """
+
+    def __init__(self, port, win=None, hold_frames=4, hold_time=None):
+        self.port = port
+        self.hold_frames = max(1, int(hold_frames))
+        self.hold_time = hold_time
+        self.flip_count = 0  # number of flips seen since attach()
+        self.sent = []  # (flip index, code) of every code written to the port
+        self.delays = []  # flips each of those codes waited behind an earlier one
+        self._pending = deque()
+        self._current = None  # code currently held on the line
+        self._frames_left = 0
+        self._timer = None
+        self._lock = threading.Lock()
+        if win is not None:
+            self.attach(win)
+
+    def attach(self, win):
+        # wrap win.flip once so every flip (whoever calls it) services the queue
+        flip = win.flip
+
+        def flip_and_trigger(*args, **kwargs):
+            flipTime = flip(*args, **kwargs)
+            self.on_flip()
+            return flipTime
+
+        win.flip = flip_and_trigger
+        win._gtdtTrigger = self
+        return self
+
+    def send(self, code, urgent=False):
+        # queue a code for the next flip; returns immediately. An urgent code
+        # goes ahead of the queued ones (it still waits for a held code)
+        with self._lock:
+            entry = (int(code), self.flip_count)
+            if urgent:
+                self._pending.appendleft(entry)
+            else:
+                self._pending.append(entry)
+
+    def send_now(self, code):
+        """Write a code right away, from any thread, instead of on the next flip.
+
+        For events that do not belong to a frame (a key press read by a
+        keyreader.KeyReader). The code is held and cleared like the others;
+        if the line still holds one, it is queued ahead for the next flip.
+        """
+        with self._lock:
+            if self._current is not None:
+                self._pending.appendleft((int(code), self.flip_count))
+                return
+            self._write_locked(int(code), self.flip_count - 1)  # no delay
+
+    def on_flip(self):
+        with self._lock:
+            self.flip_count += 1
+            if self._current is not None:
+                if self.hold_time is not None:
+                    return  # the timer clears the line
+                self._frames_left -= 1
+                if self._frames_left > 0:
+                    return
+                self._clear_locked()
+                # leave one flip of 0 between two codes so both edges are seen
+                return
+            if not self._pending:
+                return
+            code, requested = self._pending.popleft()
+            self._write_locked(code, requested)
+
+    def _write_locked(self, code, requested):
+        self.port.setData(code)
+        self._current = code
+        self._frames_left = self.hold_frames
+        self.sent.append((self.flip_count, code))
+        self.delays.append(self.flip_count - requested - 1)
+        if self.hold_time is not None:
+            self._timer = threading.Timer(self.hold_time, self._clear)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def since(self, flip):
+        # (flip index, code, delay in flips) of the codes written after `flip`
+        with self._lock:
+            return [(n, code, delay) for (n, code), delay in zip(self.sent, self.delays)
+                    if n > flip]
+
+    def pending(self):
+        # number of codes not yet written plus the one currently held
+        with self._lock:
+            return len(self._pending) + (self._current is not None)
+
+    def clear(self):
+        # drop anything queued and force the line back to 0
+        with self._lock:
+            self._pending.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._clear_locked()
+
+    def _clear(self):
+        with self._lock:
+            self._timer = None
+            self._clear_locked()
+
+    def _clear_locked(self):
+        if self._current is not None:
+            self.port.setData(0)
+        self._current = None
+        self._frames_left = 0
+
+
+def attach(win, port, hold_frames=4, hold_time=None):
+    """Return the window's TriggerScheduler, creating it on first use.
+
+    All markers of a script share one physical port, so every *_marker
+    helper goes through the same scheduler; later calls ignore `port`.
+    """
+    scheduler = getattr(win, '_gtdtTrigger', None)
+    if scheduler is None:
+        scheduler = TriggerScheduler(port, win, hold_frames=hold_frames,
+                                     hold_time=hold_time)
+    return scheduler
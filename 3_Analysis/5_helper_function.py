@@ -1,11 +1,26 @@
 import mne
 import os
+import hashlib
+import json
+import scipy
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+# the steps of preprocess_raw_data
+EOG_CHANNEL = 'EOG'
+MONTAGE = 'standard_1020'
+RESAMPLE = 512 # Hz
+L_FREQ, H_FREQ = 1, 30 # Hz
+REFERENCE = 'average'
+# cache of preprocess_raw_data; raise PIPELINE_VERSION when a step changes in a way the
+# parameters above do not show, so the results of the old steps are not used again
+CACHE_DIR = '../2_Data/Cache'
+CACHE_BUDGET = 20 * 1024**3 # bytes the cache may take, the least recently used go first
+PIPELINE_VERSION = 1
 
-def preprocess_raw_data(subjidx,taskidx):
+
+def preprocess_raw_data(subjidx,taskidx,photodiode=None,cache_dir=CACHE_DIR,cache_budget=CACHE_BUDGET):
     # read data
     #- set the number of participant and task
     #- load eeg data
@@ -18,8 +33,19 @@ def preprocess_raw_data(subjidx,taskidx):
     folder = '../2_Data/BIDS' # the root directory
     task = os.path.join('sub-'+str(subjidx).zfill(2)+'_task-GTDT_run-'+str(taskidx).zfill(2)+'_eeg.vhdr') # the task name of the experiment 
     filename_eeg = os.path.join(folder,'sub-'+str(subjidx).zfill(2),'eeg',task) # the file name of the eeg data in this experiment
+    # the result of an earlier call on the same files with the same steps (cache_dir=None: no cache)
+    if cache_dir is not None:
+        key = cache_key(filename_eeg, cache_dir=cache_dir, photodiode=photodiode)
+        raw = cache_load(cache_dir, key)
+        if raw is not None:
+            return raw
     raw = mne.io.read_raw_brainvision(filename_eeg, preload=True)
     raw.load_data()
+    # move the circle onset markers to the light onset seen by the photodiode, at the
+    # original sampling rate and before any filter (only for recordings with that channel)
+    if photodiode is not None:
+        raw.set_channel_types({photodiode:'misc'})
+        correct_onsets(raw, photodiode_latencies(raw, photodiode))
     ## load behavioral data
 
     # preprocess the eeg data
@@ -33,37 +59,287 @@ def preprocess_raw_data(subjidx,taskidx):
     #- remove ica components
     ## set the channel type
     # set the channel type
-    raw.set_channel_types({'EOG':'eog'})   
+    raw.set_channel_types({EOG_CHANNEL:'eog'})   
     # check if the 
-    if raw.get_channel_types(['EOG'])[0] == 'eog': # check if the EOG is set as the 'eog'
+    if raw.get_channel_types([EOG_CHANNEL])[0] == 'eog': # check if the EOG is set as the 'eog'
         pass
     else:
         raise ValueError('Error: Channel type is not EOG.') # if not rasie error
     ## set the electrode location
     # set the electrode location
-    raw.set_montage('standard_1020')
+    raw.set_montage(MONTAGE)
     # check if the electrode location is standard 1020 system
-    if all(channel in mne.channels.make_standard_montage('standard_1020').ch_names for channel in raw.copy().pick_types(eog=False, eeg=True).info.ch_names):
+    if all(channel in mne.channels.make_standard_montage(MONTAGE).ch_names for channel in raw.copy().pick_types(eog=False, eeg=True).info.ch_names):
         pass
     else:
         raise ValueError('Error: montage is not standard 1020') # if not rasie error
     ## resample to 512 Hz
     # resample to 512 Hz
-    raw.resample(512, npad="auto")
+    raw.resample(RESAMPLE, npad="auto")
     # check if the sample rate is 512 Hz
-    if raw.info['sfreq'] == 512:
+    if raw.info['sfreq'] == RESAMPLE:
         pass
     else:
         raise ValueError('Error: sample rate is not 512 Hz') # if not rasie error
     ## filter 1-30 Hz   
     # filter 1-30 Hz   
-    raw.filter(l_freq=1, h_freq=30, picks=['eog','eeg'])
+    raw.filter(l_freq=L_FREQ, h_freq=H_FREQ, picks=['eog','eeg'])
     # check if the filter is 1-30 Hz   
-    if raw.info['highpass']==1 and raw.info['lowpass']==30:
+    if raw.info['highpass']==L_FREQ and raw.info['lowpass']==H_FREQ:
         pass
     else:
         raise ValueError('Error: filter is not 1-30 Hz') # if not rasie error
     ## rereference
     # rereference
-    raw.set_eeg_reference('average')
-    return raw
\ No newline at end of file
+    raw.set_eeg_reference(REFERENCE)
+    if cache_dir is not None:
+        cache_store(raw, cache_dir, key, cache_budget)
+    return raw
+
+def brainvision_files(filename_vhdr):
+    # the header and the data and marker files it names
+    folder = os.path.dirname(filename_vhdr)
+    files = [filename_vhdr]
+    with open(filename_vhdr, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            name, _, value = line.strip().partition('=')
+            if name in ('DataFile', 'MarkerFile'):
+                files.append(os.path.join(folder, value.strip()))
+    return files
+
+def file_hash(filename, cache_dir=CACHE_DIR):
+    # sha256 of a file; kept in cache_dir/hashes with its size and modification time, so a file
+    # is read again only when it changed (one small file per input, so the workers of
+    # 6_preprocess_runner never write the same one)
+    path = os.path.abspath(filename)
+    hash_file = os.path.join(cache_dir, 'hashes', hashlib.sha256(path.encode()).hexdigest() + '.json')
+    stat = os.stat(filename)
+    stamp = [stat.st_size, stat.st_mtime_ns]
+    try:
+        with open(hash_file) as f:
+            entry = json.load(f)
+        if entry['path'] == path and entry['stamp'] == stamp:
+            return entry['sha256']
+    except (OSError, ValueError, KeyError):
+        pass
+    sha = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    # written under a temporary name, other processes may read it at the same time
+    os.makedirs(os.path.dirname(hash_file), exist_ok=True)
+    partial = '%s.%d' % (hash_file, os.getpid())
+    with open(partial, 'w') as f:
+        json.dump(dict(path=path, stamp=stamp, sha256=sha.hexdigest()), f)
+    os.replace(partial, hash_file)
+    return sha.hexdigest()
+
+def cache_key(filename_vhdr, cache_dir=CACHE_DIR, **parameters):
+    # the files of the recording, the steps of preprocess_raw_data and the library versions
+    description = dict(files=[file_hash(filename, cache_dir) for filename in brainvision_files(filename_vhdr)],
+                       steps=dict(eog=EOG_CHANNEL, montage=MONTAGE, resample=RESAMPLE, l_freq=L_FREQ,
+                                  h_freq=H_FREQ, reference=REFERENCE, version=PIPELINE_VERSION),
+                       parameters=parameters,
+                       versions=dict(mne=mne.__version__, numpy=np.__version__, scipy=scipy.__version__))
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+def cache_path(cache_dir, key):
+    return os.path.join(cache_dir, key + '_eeg.fif')
+
+def cache_load(cache_dir, key):
+    # the raw stored under `key`, or None
+    path = cache_path(cache_dir, key)
+    try:
+        raw = mne.io.read_raw_fif(path, preload=True)
+    except FileNotFoundError:
+        return None
+    os.utime(path) # the modification time is the last use, for cache_evict
+    return raw
+
+def cache_store(raw, cache_dir, key, budget=CACHE_BUDGET):
+    # store `raw` under `key` in double precision (the result is the same as without the cache),
+    # then keep the cache within `budget` bytes
+    os.makedirs(cache_dir, exist_ok=True)
+    path = cache_path(cache_dir, key)
+    partial = path.replace('_eeg.fif', '_%d_partial_eeg.fif' % os.getpid())
+    raw.save(partial, fmt='double', overwrite=True)
+    os.replace(partial, path)
+    cache_evict(cache_dir, budget, keep=path)
+
+def cache_evict(cache_dir, budget=CACHE_BUDGET, keep=None):
+    # delete the least recently used results until the cache takes at most `budget` bytes
+    # (`keep`, the one just stored, stays even if it alone is larger)
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.endswith('_eeg.fif') and not name.endswith('_partial_eeg.fif'):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError: # deleted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed.append(path)
+    return removed
+
+# BrainVision binary formats and the units of the channel resolutions
+BRAINVISION_FORMATS = {'INT_16':'<i2', 'INT_32':'<i4', 'IEEE_FLOAT_32':'<f4'}
+BRAINVISION_UNITS = {'V':1.0, 'mV':1e-3, 'µV':1e-6, 'uV':1e-6, 'nV':1e-9}
+
+def read_brainvision_header(filename_vhdr):
+    # the sections of a .vhdr as {section: {key: value}}; lines before the first section and
+    # ';' comments are skipped
+    sections = {}
+    section = None
+    with open(filename_vhdr, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('[') and line.endswith(']'):
+                section = sections.setdefault(line[1:-1], {})
+            elif section is not None and line and not line.startswith(';') and '=' in line:
+                key, value = line.split('=', 1)
+                section[key.strip()] = value.strip()
+    return sections
+
+def read_brainvision_channels(filename_vhdr, channels=None, tmin=0, tmax=None, as_raw=True):
+    # only `channels` from `tmin` to `tmax` seconds of a BrainVision recording, in volts
+    #- the .eeg file is memory-mapped with the layout the header gives, and only the samples of
+    #  the requested channels and time range are converted, so the memory taken grows with the
+    #  channels read and not with the channels recorded
+    #- as_raw: an mne RawArray with the markers of the time range as annotations (EOG_CHANNEL as
+    #  'eog', the others 'eeg'); otherwise (data, channel names, sampling rate)
+    header = read_brainvision_header(filename_vhdr)
+    common, binary = header['Common Infos'], header.get('Binary Infos', {})
+    if common.get('DataFormat', 'BINARY') != 'BINARY':
+        raise ValueError('Error: only binary BrainVision data can be memory-mapped')
+    binary_format = binary.get('BinaryFormat', 'INT_16')
+    if binary_format not in BRAINVISION_FORMATS:
+        raise ValueError('Error: unknown binary format ' + binary_format)
+    sfreq = 1e6 / float(common['SamplingInterval']) # the interval is in µs
+    n_channels = int(common['NumberOfChannels'])
+    # Ch1=<name>,<reference>,<resolution>,<unit>; '\1' stands for a comma in a name
+    names, scales = [], []
+    for i in range(n_channels):
+        fields = header['Channel Infos']['Ch%d' % (i+1)].split(',')
+        fields = [field.replace('\\1', ',') for field in fields] + ['', '', '']
+        names.append(fields[0])
+        resolution = float(fields[2]) if fields[2] else 1.0
+        scales.append(resolution * BRAINVISION_UNITS.get(fields[3] or 'µV', 1e-6))
+    if channels is None:
+        channels = names
+    missing = [channel for channel in channels if channel not in names]
+    if missing:
+        raise ValueError('Error: channels not in the recording: ' + ', '.join(missing))
+    picks = [names.index(channel) for channel in channels]
+    # the data file, multiplexed: sample by sample, all channels of a sample in a row
+    folder = os.path.dirname(filename_vhdr)
+    filename_data = os.path.join(folder, common['DataFile'])
+    dtype = np.dtype(BRAINVISION_FORMATS[binary_format])
+    n_times = os.path.getsize(filename_data) // (dtype.itemsize * n_channels)
+    multiplexed = common.get('DataOrientation', 'MULTIPLEXED') == 'MULTIPLEXED'
+    shape = (n_times, n_channels) if multiplexed else (n_channels, n_times)
+    data_map = np.memmap(filename_data, dtype=dtype, mode='r', shape=shape)
+    start = max(int(round(tmin * sfreq)), 0)
+    stop = n_times if tmax is None else min(int(round(tmax * sfreq)) + 1, n_times)
+    if multiplexed:
+        data = data_map[start:stop, picks].T.astype(np.float64)
+    else:
+        data = data_map[picks, start:stop].astype(np.float64)
+    del data_map
+    data *= np.array(scales)[picks, np.newaxis]
+    if not as_raw:
+        return data, list(channels), sfreq
+    ch_types = ['eog' if channel == EOG_CHANNEL else 'eeg' for channel in channels]
+    raw = mne.io.RawArray(data, mne.create_info(list(channels), sfreq, ch_types))
+    # the markers of the time range, from the first sample read
+    if 'MarkerFile' in common:
+        annotations = mne.read_annotations(os.path.join(folder, common['MarkerFile']), sfreq=sfreq)
+        onsets = annotations.onset - start / sfreq
+        keep = (onsets >= 0) & (onsets < (stop - start) / sfreq)
+        raw.set_annotations(mne.Annotations(onsets[keep], annotations.duration[keep],
+                                            annotations.description[keep]))
+    return raw
+
+def ssvep_frequencies(filename_beh, default=(21.25, 22)):
+    # the flicker frequencies to analyse
+    # the scripts log the frequency the cover flickered at on this screen (flicker.hz, FlickerHz
+    # after the R preprocessing); files written before it was logged keep the nominal 21.25 Hz
+    freqs = list(default)
+    dfs_stim = pd.read_csv(filename_beh, sep=',')
+    for column in ['FlickerHz', 'flicker.hz']:
+        if column in dfs_stim.columns:
+            shown = pd.to_numeric(dfs_stim[column], errors='coerce')
+            shown = np.unique(shown[shown > 0])
+            if len(shown) > 0:
+                freqs = [float(hz) for hz in shown] + [hz for hz in freqs[1:] if hz not in shown]
+            break
+    return np.array(freqs)
+
+def detect_light_onsets(raw, channel, threshold=None, invert=False):
+    # samples (counted like the events, from raw.first_samp) where the photodiode channel turns
+    # light; every rising edge, the flicker ones too, match_onsets picks the one after each trigger
+    signal = raw.get_data(picks=[channel])[0]
+    if invert: # a photodiode whose voltage drops with light
+        signal = -signal
+    if threshold is None: # halfway between the dark and the light level
+        low, high = np.percentile(signal, [5, 95])
+        threshold = (low + high) / 2
+    change = np.diff((signal > threshold).astype(np.int8))
+    return np.flatnonzero(change == 1) + 1 + raw.first_samp
+
+def match_onsets(triggers, onsets, sfreq, max_lag=0.1):
+    # the first light onset at or after every trigger sample within max_lag seconds, -1 if none;
+    # the window is locked to the trigger, so the trials may follow each other without any dark
+    # between them
+    onsets = np.asarray(onsets)
+    candidate = np.append(onsets, np.iinfo(np.int64).max)[np.searchsorted(onsets, triggers)]
+    return np.where(candidate - triggers <= max_lag * sfreq, candidate, -1)
+
+def photodiode_latencies(raw, channel, description='Stimulus/S  1', max_lag=0.1, **detect):
+    # trigger-to-light latency of every `description` marker (the circle onset by default)
+    sfreq = raw.info['sfreq']
+    events, _ = mne.events_from_annotations(raw, event_id={description: 1}, verbose=False)
+    triggers = events[:, 0]
+    onsets = match_onsets(triggers, detect_light_onsets(raw, channel, **detect), sfreq, max_lag)
+    latency = np.where(onsets >= 0, (onsets - triggers) / sfreq * 1000, np.nan)
+    return pd.DataFrame({'trigger': triggers, 'onset': onsets, 'latency_ms': latency})
+
+def latency_distribution(latencies):
+    # latency summary per site of the photodiode_latencies() tables, {site: [table, ...]}
+    rows = []
+    for site, tables in latencies.items():
+        lat = pd.concat(tables)['latency_ms']
+        rows.append({'site': site, 'n': lat.notna().sum(), 'missing': lat.isna().sum(),
+                     'median_ms': lat.median(), 'p5_ms': lat.quantile(0.05),
+                     'p95_ms': lat.quantile(0.95), 'sd_ms': lat.std()})
+    return pd.DataFrame(rows).set_index('site')
+
+def correct_onsets(raw, latencies, description='Stimulus/S  1', max_missing=0.1):
+    # shift the `description` annotations of raw by their photodiode latency, so the epochs
+    # are locked to the light onset; markers without a detected onset move by the median latency,
+    # and more than max_missing (a share of the markers) without one is an error
+    lag = latencies['latency_ms'].to_numpy() / 1000
+    missing = np.isnan(lag).sum()
+    if missing > max_missing * len(lag):
+        raise ValueError('Error: no light onset found for %d of %d %s markers'
+                         % (missing, len(lag), description))
+    if missing:
+        print('%d of %d %s markers without a light onset, moved by the median latency %.1f ms'
+              % (missing, len(lag), description, np.nanmedian(lag) * 1000))
+    lag = np.where(np.isnan(lag), np.nanmedian(lag), lag)
+    which = np.flatnonzero(raw.annotations.description == description)
+    if len(which) != len(lag):
+        raise ValueError('Error: %d %s markers but %d latencies' % (len(which), description, len(lag)))
+    raw.annotations.onset[which] += lag
+    return raw
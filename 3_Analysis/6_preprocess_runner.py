@@ -0,0 +1,156 @@
+# Parallel preprocessing of every subject x run
+#
+# The first cell of 3_MainScript.ipynb preprocessed the runs one after the other
+# (preprocess_raw_data, ICA, save as fif). Every run is an independent job, so this script
+# runs them in a pool of worker processes:
+#
+#     cd 3_Analysis
+#     python 6_preprocess_runner.py --workers 4
+#     python 6_preprocess_runner.py --subjects 1 2 --runs 1 --workers 2
+#
+# - the jobs are all sub-xx / run-xx recordings found in ../2_Data/BIDS (or the given ones)
+# - a job whose fif already exists is skipped, so a second call only runs what is left
+#   (the fif is written under a temporary name and renamed when complete); --force reruns all
+# - every job writes the mne log and, if it fails, the traceback to
+#   ../2_Data/Preprocessed/logs/sub-xx_run-xx.log; a failed job does not stop the others
+# - the outcome and duration of every job are appended to ../2_Data/Preprocessed/logs/jobs.csv
+import os
+
+# one BLAS thread per worker, the pool is the parallelism; set before numpy/mne are imported,
+# since the workers are forked from this process with the thread pools it starts at import
+for variable in ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS']:
+    os.environ.setdefault(variable, '1')
+
+import argparse
+import concurrent.futures
+import csv
+import glob
+import importlib.util
+import re
+import sys
+import time
+import traceback
+
+import mne
+
+BIDS = '../2_Data/BIDS'
+PREPROCESSED = '../2_Data/Preprocessed'
+LOGS = os.path.join(PREPROCESSED, 'logs')
+JOBS_CSV = os.path.join(LOGS, 'jobs.csv')
+
+# the scripts of this folder use relative paths to 2_Data
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+# 5_helper_function.py, which cannot be imported by name
+_spec = importlib.util.spec_from_file_location('helper_function', '5_helper_function.py')
+helper_function = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(helper_function)
+
+
+def output_path(subjidx, taskidx):
+    # the fif 3_MainScript.ipynb reads
+    return os.path.join(PREPROCESSED, f'sub-{subjidx:02d}_task-GTDT_run-{taskidx:02d}_eeg.fif')
+
+
+def find_jobs(subjects=None, runs=None):
+    # (subject, run) of every BrainVision recording in BIDS, limited to `subjects` and `runs`
+    jobs = []
+    for path in sorted(glob.glob(os.path.join(BIDS, 'sub-*', 'eeg', '*_eeg.vhdr'))):
+        match = re.search(r'sub-(\d+)_task-GTDT_run-(\d+)_eeg\.vhdr$', path)
+        if match is None:
+            continue
+        subjidx, taskidx = int(match.group(1)), int(match.group(2))
+        if (subjects is None or subjidx in subjects) and (runs is None or taskidx in runs):
+            jobs.append((subjidx, taskidx))
+    return jobs
+
+
+def preprocess(subjidx, taskidx, photodiode=None):
+    # the first cell of 3_MainScript.ipynb for one run
+    raw = helper_function.preprocess_raw_data(subjidx, taskidx, photodiode)
+    # remove ica components
+    ica = mne.preprocessing.ICA(n_components=None, random_state=124, max_iter='auto')
+    ica.fit(raw)
+    eog_indices, eog_scores = ica.find_bads_eog(raw)
+    ica.exclude = eog_indices
+    ica.apply(raw)
+    # written under a temporary name, so an interrupted job leaves no fif behind
+    path = output_path(subjidx, taskidx)
+    partial = path.replace('_eeg.fif', '_partial_eeg.fif')
+    raw.save(partial, overwrite=True)
+    os.replace(partial, path)
+
+
+def run_job(job, photodiode=None):
+    # one job in a worker process: its log file, its outcome and duration
+    subjidx, taskidx = job
+    log = os.path.join(LOGS, f'sub-{subjidx:02d}_run-{taskidx:02d}.log')
+    mne.set_log_file(log, overwrite=True)
+    start = time.perf_counter()
+    try:
+        preprocess(subjidx, taskidx, photodiode)
+        status, error = 'ok', ''
+    except Exception as e:
+        status, error = 'failed', '%s: %s' % (type(e).__name__, e)
+        with open(log, 'a') as f:
+            f.write(traceback.format_exc())
+    finally:
+        mne.set_log_file(None)
+    return dict(subject=subjidx, run=taskidx, status=status,
+                seconds=round(time.perf_counter() - start, 1), error=error, log=log)
+
+
+def record(result):
+    # append the outcome of one job to jobs.csv
+    new = not os.path.exists(JOBS_CSV)
+    with open(JOBS_CSV, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['finished', 'subject', 'run', 'status',
+                                               'seconds', 'error', 'log'])
+        if new:
+            writer.writeheader()
+        writer.writerow(dict(result, finished=time.strftime('%Y-%m-%d %H:%M:%S')))
+
+
+def run(jobs, workers=None, photodiode=None):
+    # run `jobs` in `workers` processes; returns the results in the order they finished
+    os.makedirs(LOGS, exist_ok=True)
+    results = []
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = dict((pool.submit(run_job, job, photodiode), job) for job in jobs)
+        for future in concurrent.futures.as_completed(futures):
+            subjidx, taskidx = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # the worker process itself died
+                result = dict(subject=subjidx, run=taskidx, status='failed', seconds='',
+                              error='%s: %s' % (type(e).__name__, e), log='')
+            record(result)
+            results.append(result)
+            print('[%d/%d] sub-%02d run-%02d %s %ss %s'
+                  % (len(results), len(jobs), subjidx, taskidx, result['status'],
+                     result['seconds'], result['error']))
+    failed = [r for r in results if r['status'] != 'ok']
+    print('%d jobs in %.1fs, %d failed' % (len(results), time.perf_counter() - start,
+                                           len(failed)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Parallel preprocessing of every subject x run')
+    parser.add_argument('--subjects', nargs='+', type=int, help='subject numbers (default: all)')
+    parser.add_argument('--runs', nargs='+', type=int, help='run numbers (default: all)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='worker processes (default: one per CPU)')
+    parser.add_argument('--photodiode', help='photodiode channel to correct the onsets with')
+    parser.add_argument('--force', action='store_true', help='rerun the finished jobs too')
+    args = parser.parse_args(argv)
+    jobs = find_jobs(args.subjects, args.runs)
+    todo = [job for job in jobs if args.force or not os.path.exists(output_path(*job))]
+    print('%d jobs, %d finished before, %d to run on %d workers'
+          % (len(jobs), len(jobs) - len(todo), len(todo), args.workers))
+    if todo and any(r['status'] != 'ok' for r in run(todo, args.workers, args.photodiode)):
+        sys.exit(1)  # the failed jobs run again on the next call
+
+
+if __name__ == '__main__':
+    main()